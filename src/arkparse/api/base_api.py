@@ -1,12 +1,14 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 from pathlib import Path
 import os
 import json
+import numpy as np
 
 from arkparse.api.structure_api import StructureApi
 from arkparse.parsing.struct.actor_transform import MapCoords
 from arkparse.object_model.structures import Structure, StructureWithInventory
+from arkparse.object_model.structures.structure_graph import connected_components
 from arkparse.object_model.bases.base import Base
 from arkparse.object_model.misc.inventory import Inventory
 from arkparse.object_model.misc.inventory_item import InventoryItem
@@ -40,13 +42,8 @@ class BaseApi(StructureApi):
         if structures is None or len(structures) == 0:
             return None
         
-        all_structures: Dict[UUID, Structure] = {}
-        connected = self.get_connected_structures(structures)
-        for key, structure in structures.items():
-            all_structures[key] = structure
-            for key, conn_structure in connected.items():
-                if key not in all_structures:
-                    all_structures[key] = conn_structure
+        # the structures come first in the connected structures, followed by the ones connected to them
+        all_structures: Dict[UUID, Structure] = self.get_connected_structures(structures)
 
         if owner_tribe_id is not None or owner_tribe_name is not None:
             all_structures = {k: v for k, v in all_structures.items() if (v.owner.tribe_id == owner_tribe_id or v.owner.tribe_name == owner_tribe_name)}
@@ -71,6 +68,11 @@ class BaseApi(StructureApi):
         return out, base_file
     
     def import_base(self, path: Path, location: ActorTransform = None) -> Base:
+        # all objects and transforms of the base are written in one transaction
+        with self.save.batch():
+            return self.__import_base(path, location)
+
+    def __import_base(self, path: Path, location: ActorTransform) -> Base:
         uuid_translation_map = {}
         # interconnection_properties = [
         #     "PlacedOnFloorStructure",
@@ -169,36 +171,169 @@ class BaseApi(StructureApi):
 
         return base
     
-    def get_all_bases(self, only_connected: bool = False, radius: float = 0.3, min_structures: int = 10) -> List[Base]:
+    def get_all_bases(self, only_connected: bool = False, radius: float = 0.3, min_structures: int = 10, transitive: bool = False) -> List[Base]:
+        # By default every base is get_base_at around a keystone, the first structure that is not part of an earlier base.
+        # With only_connected or transitive, bases are the connected components of the structures, in a single pass over all of them.
+        # Structures are connected through the structure graph (links and floors), and with transitive also when they have the
+        # same owner and are within radius of each other in map coordinates, so a chain of nearby outposts becomes one base.
+        if not only_connected and not transitive:
+            return self.__get_bases_around_keystones(radius, min_structures)
+
         all_bases: List[Base] = []
         all_structures: Dict[UUID, Structure] = super().get_all()
-        visited_structures: List[UUID] = []
+        graph = self.get_structure_graph()
+        keys = graph.uuids
+        structures = [all_structures[key] for key in keys]
+
+        # owners are compared like ObjectOwner.__eq__ does for structures that have both ids set
+        owner_groups: Dict[tuple, int] = {}
+        groups = np.array([owner_groups.setdefault((s.owner.tribe_id, s.owner.id_), len(owner_groups)) for s in structures], dtype=np.int64)
+
+        sources = np.repeat(np.arange(len(keys)), np.diff(graph.indptr))
+        targets = graph.indices
+        if not only_connected:
+            same_owner = groups[sources] == groups[targets]
+            sources = sources[same_owner]
+            targets = targets[same_owner]
+        edges = [(sources, targets)]
+
+        if not only_connected:
+            lat, long = ActorTransform.as_map_coord_arrays([s.location for s in structures], self.map)
+            edges.extend(BaseApi.__proximity_edges(groups, lat, long, radius))
+
+        labels = connected_components(len(structures), edges)
+
+        components: Dict[int, List[int]] = {}
+        for i, label in enumerate(labels.tolist()):
+            components.setdefault(label, []).append(i)
+
+        # components are ordered by their first structure, which is the keystone
+        for members in components.values():
+            if len(members) < min_structures:
+                continue
+
+            base = Base(keys[members[0]], {keys[i]: structures[i] for i in members})
+            all_bases.append(base)
+            ArkSaveLogger.api_log(f"Parsed base at {'Unknown' if base.location is None else base.keystone.location.as_map_coords(self.map)} with {len(base.structures)} structures, owner: {base.owner}")
+
+        return all_bases
+
+    def __get_bases_around_keystones(self, radius: float, min_structures: int) -> List[Base]:
+        all_bases: List[Base] = []
+        all_structures: Dict[UUID, Structure] = super().get_all()
+        visited_structures = set()
 
         for key, structure in all_structures.items():
-            base = None
-            if key in visited_structures:
+            if key in visited_structures or structure.location is None:
                 continue
-    
-            if only_connected:
-                connected = self.get_connected_structures({key: structure})
-                base = Base(structure.uuid, connected)
-            else:
-                base = self.get_base_at(structure.location.as_map_coords(self.map), radius, structure.owner.tribe_id, structure)
 
-            for structure in base.structures.values():
-                visited_structures.append(structure.uuid)
+            base = self.get_base_at(structure.location.as_map_coords(self.map), radius, structure.owner.tribe_id, structure)
+            if base is None:
+                continue
+            visited_structures.update(base.structures.keys())
 
-            
-            if base is not None and len(base.structures) >= min_structures:
+            if len(base.structures) >= min_structures:
                 all_bases.append(base)
                 ArkSaveLogger.api_log(f"Parsed base at {'Unknown' if base.location is None else base.keystone.location.as_map_coords(self.map)} with {len(base.structures)} structures, owner: {base.owner}")
 
         return all_bases
 
-                
+    @staticmethod
+    def __proximity_edges(groups: np.ndarray, lat_coords: np.ndarray, long_coords: np.ndarray, radius: float) -> List[Tuple[np.ndarray, np.ndarray]]:
+        # Edges between structures of the same group that are within radius of each other (on both axes),
+        # without comparing all pairs. Map coordinates are compared exactly, in hundredths (their precision).
+        # Structures are put in grid cells that are radius wide, structures in the same cell are always
+        # within radius of each other, so only neighbouring cells need checking
+        located = np.flatnonzero(np.isfinite(lat_coords) & np.isfinite(long_coords))
+        reach = int(np.floor(radius * 100 + 1e-9))
+        if len(located) == 0 or reach < 0:
+            return []
+        lat = np.full(len(groups), -1, dtype=np.int64)
+        long = np.full(len(groups), -1, dtype=np.int64)
+        lat[located] = np.rint(lat_coords[located] * 100)
+        long[located] = np.rint(long_coords[located] * 100)
+        cell_x = lat[located] // (reach + 1)
+        cell_y = long[located] // (reach + 1)
+        cell_x -= cell_x.min() - 1
+        cell_y -= cell_y.min() - 1
+        width = int(cell_x.max()) + 2
+        height = int(cell_y.max()) + 2
+        keys = (groups[located] * width + cell_x) * height + cell_y
 
-        
+        order = np.argsort(keys, kind="stable")
+        points = located[order]
+        cells, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], len(points))
+        cell_of_point = np.repeat(np.arange(len(cells)), ends - starts)
 
-    
+        # every structure to the first one of its cell
+        edges = [(points, points[starts[cell_of_point]])]
 
-        
+        lat = lat[points]
+        long = long[points]
+        min_lat = np.minimum.reduceat(lat, starts)
+        max_lat = np.maximum.reduceat(lat, starts)
+        min_long = np.minimum.reduceat(long, starts)
+        max_long = np.maximum.reduceat(long, starts)
+
+        def neighbours_of(dx: int, dy: int) -> Tuple[np.ndarray, np.ndarray]:
+            # pairs of existing cells, the second one at an offset of (dx, dy) cells from the first
+            offset = dx * height + dy
+            found = np.searchsorted(cells, cells + offset)
+            exists = found < len(cells)
+            exists[exists] = cells[found[exists]] == cells[exists] + offset
+            first = np.flatnonzero(exists)
+            return first, found[first]
+
+        # side by side cells share a row or column, so only the gap between them matters
+        above_first, above_second = neighbours_of(0, 1)
+        right_first, right_second = neighbours_of(1, 0)
+        above = min_long[above_second] - max_long[above_first] <= reach
+        right = min_lat[right_second] - max_lat[right_first] <= reach
+        cell_sources = [above_first[above], right_first[right]]
+        cell_targets = [above_second[above], right_second[right]]
+
+        # diagonal cells only need checking when they are not connected yet through the others
+        cell_labels = connected_components(len(cells), list(zip(cell_sources, cell_targets)))
+        for dy in (1, -1):
+            first, second = neighbours_of(1, dy)
+            long_gap = min_long[second] - max_long[first] if dy > 0 else min_long[first] - max_long[second]
+            candidates = (min_lat[second] - max_lat[first] <= reach) & (long_gap <= reach) & (cell_labels[first] != cell_labels[second])
+            first = first[candidates]
+            second = second[candidates]
+            close = BaseApi.__diagonal_cells_close(lat, long * dy, starts, ends, first, second, reach)
+            cell_sources.append(first[close])
+            cell_targets.append(second[close])
+
+        edges.append((points[starts[np.concatenate(cell_sources)]], points[starts[np.concatenate(cell_targets)]]))
+        return edges
+
+    @staticmethod
+    def __diagonal_cells_close(lat: np.ndarray, long: np.ndarray, starts: np.ndarray, ends: np.ndarray, first: np.ndarray, second: np.ndarray, reach: int) -> np.ndarray:
+        # For every pair of cells, whether a structure in the second cell has lat and long at most reach
+        # above one in the first cell. Small pairs of cells compare all structures at once
+        sizes_first = ends[first] - starts[first]
+        sizes_second = ends[second] - starts[second]
+        pair_sizes = sizes_first * sizes_second
+        small = np.flatnonzero(pair_sizes <= 64)
+        close = np.zeros(len(first), dtype=bool)
+
+        pair = np.repeat(small, pair_sizes[small])
+        offset = np.arange(len(pair)) - np.repeat(np.cumsum(pair_sizes[small]) - pair_sizes[small], pair_sizes[small])
+        a = starts[first[pair]] + offset // sizes_second[pair]
+        b = starts[second[pair]] + offset % sizes_second[pair]
+        found = (lat[b] - lat[a] <= reach) & (long[b] - long[a] <= reach)
+        close[np.unique(pair[found])] = True
+
+        # for the others, the structure in the first cell with the largest long that is still
+        # within reach in lat is the best candidate for every structure in the second cell
+        for k in np.flatnonzero(pair_sizes > 64).tolist():
+            lat_a = lat[starts[first[k]]:ends[first[k]]]
+            order = np.argsort(lat_a)
+            best_long = np.maximum.accumulate(long[starts[first[k]]:ends[first[k]]][order][::-1])[::-1]
+            lat_b = lat[starts[second[k]]:ends[second[k]]]
+            long_b = long[starts[second[k]]:ends[second[k]]]
+            best = np.searchsorted(lat_a[order], lat_b - reach, side="left")
+            valid = best < len(order)
+            close[k] = bool(np.any(long_b[valid] - best_long[best[valid]] <= reach))
+        return close
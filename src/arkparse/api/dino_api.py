@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 from pathlib import Path
+import itertools
 import os
 
 from arkparse.object_model.cryopods.cryopod import Cryopod
@@ -15,9 +16,9 @@ from arkparse.object_model.misc.dino_owner import DinoOwner
 from arkparse.parsing import ArkBinaryParser
 from arkparse.saves.asa_save import AsaSave
 from arkparse.parsing import GameObjectReaderConfiguration
-from arkparse.parsing.struct.actor_transform import MapCoords, ActorTransform
+from arkparse.parsing.struct.actor_transform import MapCoords, ActorTransform, ActorTransformTable
 from arkparse.enums import ArkMap, ArkStat, ArkDinoTrait
-from arkparse.utils import TEMP_FILES_DIR, ImportFile
+from arkparse.utils import TEMP_FILES_DIR, ImportFile, bin_heatmap
 from arkparse.logging import ArkSaveLogger
 from arkparse.classes.dinos import Dinos
 from arkparse.object_model.misc.inventory import Inventory
@@ -37,6 +38,11 @@ class DinoApi:
         self.parsed_dinos: Dict[UUID, Dino] = {}
         self.parsed_cryopods: Dict[UUID, Cryopod] = {}
 
+        # DinoId -> dino, keyed by whether only tamed (incl. cryopodded) dinos are indexed.
+        # Built from the result of a full get_all() and reset when dinos are modified or imported
+        self._dino_id_index: Dict[bool, Dict[DinoId, Dino]] = {}
+        self._indexed_tamed_dinos: Optional[Dict[UUID, TamedDino]] = None
+
     @staticmethod
     def is_applicable_bp(blueprint: str) -> bool:
         return DinoApi._DEFAULT_CONFIG.blueprint_name_filter(blueprint)
@@ -157,17 +163,43 @@ class DinoApi:
 
         ArkSaveLogger.api_log(f"Parsed {len(dinos)} dinos")
 
+        if config is None and include_cryos and include_tamed and include_babies and not only_cryopodded:
+            self.__index_dinos(dinos, include_wild)
+
         return dinos
+
+    def __index_dinos(self, dinos: Dict[UUID, Dino], include_wild: bool):
+        tamed = {key: dino for key, dino in dinos.items() if isinstance(dino, TamedDino)} if include_wild else dinos
+        for tamed_only, indexed in ((True, tamed), (False, dinos)):
+            if tamed_only or include_wild:
+                index: Dict[DinoId, Dino] = {}
+                for dino in indexed.values():
+                    index.setdefault(dino.id_, dino)
+                self._dino_id_index[tamed_only] = index
+        self._indexed_tamed_dinos = tamed
+
+    def _invalidate_dino_id_index(self):
+        self._dino_id_index = {}
+        self._indexed_tamed_dinos = None
     
     def get_at_location(self, map: ArkMap, coords: MapCoords, radius: float = 0.3, tamed: bool = True, untamed: bool = True) -> Dict[UUID, Dino]:
         dinos = self.get_all()
 
         filtered_dinos = {}
 
+        # the save's spatial index rules out the dinos that are indexed away from the location,
+        # dinos that are not indexed at their current location are checked the slow way
+        actor_transforms = self.save.save_context.actor_transforms
+        spatial_index = actor_transforms.spatial_index if isinstance(actor_transforms, ActorTransformTable) else None
+        candidates = None if spatial_index is None else set(spatial_index.query_map_coords(map, coords, radius))
+
         for key, dino in dinos.items():
             if isinstance(dino, TamedDino) and dino.cryopod is not None:
                 continue
 
+            if candidates is not None and key not in candidates and spatial_index.is_indexed_at(key, dino.location):
+                continue
+
             if dino.location.is_at_map_coordinate(map, coords, tolerance=radius):
                 if (tamed and isinstance(dino, TamedDino)) or (untamed and not isinstance(dino, TamedDino)):
                     filtered_dinos[key] = dino
@@ -399,37 +431,21 @@ class DinoApi:
         return cryopodded
     
     def modify_dinos(self, dinos: Dict[UUID, TamedDino], new_owner: DinoOwner = None):
+        self._invalidate_dino_id_index()
         for key, dino in dinos.items():
             if new_owner is not None:
                 dino.owner.replace_with(new_owner, dino.binary)
                 dino.update_binary()
 
     def create_heatmap(self, map: ArkMap, resolution: int = 100, dinos: Dict[UUID, TamedDino] = None, classes: List[str] = None, owner: DinoOwner = None, only_tamed: bool = False):
-        import math
-        import numpy as np
-
         tamed = None if not only_tamed else True
         if dinos is None:
             dinos = self.get_all_filtered(class_names=classes, tamed=tamed, include_cryopodded=False)
 
-        heatmap = [[0 for _ in range(resolution)] for _ in range(resolution)]
         # print(f"Found {len(dinos)} dinos")
+        lat, long = ActorTransform.as_map_coord_arrays([dino.location for dino in dinos.values()], map)
 
-        for key, dino in dinos.items():
-            if dino.location is None:
-                continue
-
-            coords: MapCoords = dino.location.as_map_coords(map)
-
-            y = math.floor(coords.long)
-            x = math.floor(coords.lat)
-
-            if x < 0 or x >= resolution or y < 0 or y >= resolution:
-                continue
-
-            heatmap[x][y] += 1
-
-        return np.array(heatmap)
+        return bin_heatmap(lat, long, resolution)
     
     
     def get_best_dino_for_stat(self, classes: List[str] = None, stat: ArkStat = None, only_tamed: bool = False, only_untamed: bool = False, base_stat: bool = False, mutated_stat=False, level_upper_bound=None) -> (Dino, int, ArkStat):
@@ -493,13 +509,14 @@ class DinoApi:
         return out
     
     def get_by_id(self, dino_id: DinoId, tamed: bool = True) -> Optional[Dino]:
-        for dino in self.get_all(include_wild=(not tamed)).values():
-            if dino.id_ == dino_id:
-                return dino
-        return None
+        if tamed not in self._dino_id_index:
+            self.get_all(include_wild=(not tamed))
+        return self._dino_id_index[tamed].get(dino_id)
     
     def get_childless_tamed_dinos(self) -> Dict[UUID, TamedDino]:
-        tamed = self.get_all_tamed(include_cryopodded=True)
+        if self._indexed_tamed_dinos is None:
+            self.get_all(include_wild=False)
+        tamed = self._indexed_tamed_dinos
         childless = {}
 
         all_ancestors = set()
@@ -521,27 +538,43 @@ class DinoApi:
         childless = self.get_childless_tamed_dinos()
 
         pedigrees: List[Pedigree] = []
+        # DinoId -> indices of the pedigrees containing it, so overlapping pedigrees are found without scanning all of them
+        pedigrees_of_id: Dict[DinoId, List[int]] = {}
+        registered: List[int] = []
+
+        def register(index: int):
+            ped = pedigrees[index]
+            for dino_id in itertools.islice(ped.dino_id_map, registered[index], None):
+                pedigrees_of_id.setdefault(dino_id, []).append(index)
+            registered[index] = len(ped.dino_id_map)
 
         for key, dino in childless.items():
             if dino.generation >= min_generations:
                 existing_ped = None
-                for ped in pedigrees:
-                    if (ped.has_ancestors_in_pedigree(dino) or (dino.id_ in ped.dino_id_map)) and dino.get_short_name() == ped.dino_type:
-                        existing_ped = ped
+                candidates = set(pedigrees_of_id.get(dino.id_, ()))
+                for ancestor in dino.ancestor_ids:
+                    candidates.update(pedigrees_of_id.get(ancestor, ()))
+                for index in sorted(candidates):
+                    if dino.get_short_name() == pedigrees[index].dino_type:
+                        existing_ped = pedigrees[index]
                         # print(f"Found overlapping pedigree for {dino}, skipping creation of new pedigree")
                         break
                 
                 if existing_ped is None:
                     ped = Pedigree(dino, self, player_api)
                     pedigrees.append(ped)
+                    registered.append(0)
+                    register(len(pedigrees) - 1)
                     ArkSaveLogger.api_log(f"Created new pedigree, current count: {len(pedigrees)}")
                 elif not dino.id_ in existing_ped.dino_id_map:
                     existing_ped.add_new_dino(dino)
+                    register(index)
 
         ArkSaveLogger.api_log(f"Total pedigrees found: {len(pedigrees)}")
         return pedigrees
 
     def import_dino(self, path: Path, location: ActorTransform = None) -> Dino | TamedDino:
+        self._invalidate_dino_id_index()
         uuid_translation_map = {}
 
         def replace_uuids(uuid_map: Dict[UUID, UUID], bytes_: bytes):
@@ -12,12 +12,11 @@ from arkparse.object_model.equipment.__equipment_with_durability import Equipmen
 from arkparse.object_model.structures import Structure, StructureWithInventory
 from arkparse.object_model.ark_game_object import ArkGameObject
 from arkparse.api import EquipmentApi, PlayerApi, StructureApi, DinoApi
-from arkparse.parsing import ArkBinaryParser
+from arkparse.parsing import GameObjectReaderConfiguration
 from arkparse.parsing.struct.ark_item_net_id import ArkItemNetId
 from arkparse.parsing.struct import ActorTransform
 from arkparse.parsing.struct import ObjectReference
 from arkparse.saves.asa_save import AsaSave
-from arkparse.saves.save_connection import SaveConnection
 from arkparse.utils.json_utils import DefaultJsonEncoder
 
 from arkparse.enums import ArkEquipmentStat
@@ -446,39 +445,26 @@ class JsonApi:
     def export_items(self, dino_api: DinoApi = None, export_folder_path: str = Path.cwd() / "json_exports", include_engrams: bool = False, include_saddles_from_cryopods: bool = False):
         ArkSaveLogger.api_log("Exporting items...")
 
-        # Parse and format items as JSON.
+        # Parse and format items as JSON, streaming the objects so they are not all kept in memory.
+        item_classes = ["/PrimalItemArmor_", "/PrimalItem_", "/PrimalItemAmmo_", "/PrimalItemC4Ammo", "/PrimalItemResource_", "/DroppedItemGeneric_", "/PrimalItemConsumable_"]
+        config = GameObjectReaderConfiguration(
+            blueprint_name_filter=lambda name: name is not None and any(item_class in name for item_class in item_classes)
+        )
+
         all_items = []
-        query = "SELECT key, value FROM game"
-        with self.save.save_connection.connection as conn:
-            cursor = conn.execute(query)
-            for row in cursor:
-                try:
-                    obj_uuid = SaveConnection.byte_array_to_uuid(row[0])
-                    byte_buffer = ArkBinaryParser(row[1], self.save.save_context)
-                    class_name = byte_buffer.read_name()
-
-                    if "/PrimalItemArmor_" not in class_name and \
-                            "/PrimalItem_" not in class_name and \
-                            "/PrimalItemAmmo_" not in class_name and \
-                            "/PrimalItemC4Ammo" not in class_name and \
-                            "/PrimalItemResource_" not in class_name and \
-                            "/DroppedItemGeneric_" not in class_name and \
-                            "/PrimalItemConsumable_" not in class_name:
-                        continue
-
-                    obj = SaveConnection.parse_as_predefined_object(obj_uuid, class_name, byte_buffer)
-                    if obj is not None:
-                        is_engram = False
-                        if obj.has_property("bIsEngram"):
-                            is_engram = obj.get_property_value("bIsEngram", False)
-                        if is_engram and not include_engrams:
-                            continue
-                        all_items.append(JsonApi.primal_item_to_json_obj(obj))
-                except Exception as e:
-                    if ArkSaveLogger._allow_invalid_objects:
-                        ArkSaveLogger.error_log(f"Failed to parse item {UUID(row[0])}: {e}")
-                    else:
-                        raise e
+        for obj_uuid, obj in self.save.iter_game_objects(config):
+            try:
+                is_engram = False
+                if obj.has_property("bIsEngram"):
+                    is_engram = obj.get_property_value("bIsEngram", False)
+                if is_engram and not include_engrams:
+                    continue
+                all_items.append(JsonApi.primal_item_to_json_obj(obj))
+            except Exception as e:
+                if ArkSaveLogger._allow_invalid_objects:
+                    ArkSaveLogger.error_log(f"Failed to parse item {obj_uuid}: {e}")
+                else:
+                    raise e
 
         # If we need to include saddles from cryopods.
         if include_saddles_from_cryopods:
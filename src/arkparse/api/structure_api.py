@@ -1,14 +1,16 @@
-from typing import Dict, Union, List
+from collections import deque
+from typing import Dict, Optional, Set, Union, List
 from uuid import UUID
 
 from arkparse.saves.asa_save import AsaSave
 from arkparse.parsing import GameObjectReaderConfiguration
 from arkparse.object_model.ark_game_object import ArkGameObject
 from arkparse.object_model.misc.object_owner import ObjectOwner
-from arkparse.object_model.structures import Structure, StructureWithInventory
-from arkparse.parsing.struct.actor_transform import MapCoords
+from arkparse.object_model.structures import Structure, StructureWithInventory, StructureGraph
+from arkparse.parsing.struct.actor_transform import MapCoords, ActorTransform, ActorTransformTable, SpatialIndex
 from arkparse.enums.ark_map import ArkMap
 from arkparse.logging import ArkSaveLogger
+from arkparse.utils import bin_heatmap
 
 SKIPPED_STRUCTURE_BPS = []
 
@@ -17,21 +19,32 @@ class StructureApi:
         self.save = save
         self.retrieved_all = False
         self.parsed_structures = {}
+        # built from all structures on first use, reset when structures are added or removed
+        self._structure_graph: Optional[StructureGraph] = None
+
+    @staticmethod
+    def _is_structure_blueprint(name: str) -> bool:
+        return name is not None \
+               and "Structures" in name \
+               and (not "PrimalItemStructure_" in name or "PrimalItemStructure_ASR" in name) \
+               and not "/Skins/" in name \
+               and not "PrimalInventory" in name \
+               and not "/TreasureMap/" in name \
+               and not "PrimalItemStructureSkin" in name \
+               and not "PrimalItemResource" in name \
+               and not "/TrainCarts/" in name
+            #  and not "Tileset" in name
+
+    @staticmethod
+    def _is_container_blueprint(name: str) -> bool:
+        # containers are only structures if they have a MyInventoryComponent
+        return name is not None and not "PlayerPawn" in name and not "/Dinos/" in name and not "Character_BP" in name
 
     def get_all_objects(self, config: GameObjectReaderConfiguration = None) -> Dict[UUID, ArkGameObject]:
         if config is None:
             ArkSaveLogger.api_log("Retrieving all structure objects from save")
             reader_config = GameObjectReaderConfiguration(
-                blueprint_name_filter=lambda name: name is not None \
-                                                   and "Structures" in name \
-                                                   and (not "PrimalItemStructure_" in name or "PrimalItemStructure_ASR" in name) \
-                                                   and not "/Skins/" in name \
-                                                   and not "PrimalInventory" in name \
-                                                   and not "/TreasureMap/" in name \
-                                                #    and not "Tileset" in name \
-                                                   and not "PrimalItemStructureSkin" in name \
-                                                   and not "PrimalItemResource" in name \
-                                                   and not "/TrainCarts/" in name \
+                blueprint_name_filter=StructureApi._is_structure_blueprint
             )
 
             objects = self.save.get_game_objects(reader_config)
@@ -39,7 +52,7 @@ class StructureApi:
             ArkSaveLogger.api_log(f"Found {len(objects)} structure objects, now looking for containers that were missed")
             config = GameObjectReaderConfiguration()
             config.property_names = ["MyInventoryComponent"]
-            config.blueprint_name_filter = lambda name: name is not None and not "PlayerPawn" in name and not "/Dinos/" in name and not "Character_BP" in name
+            config.blueprint_name_filter = StructureApi._is_container_blueprint
             containers = self.save.get_game_objects(config)
             for key, obj in containers.items():
                 if key not in objects.keys():
@@ -59,6 +72,12 @@ class StructureApi:
             objects = self.save.get_game_objects(reader_config)
 
         ArkSaveLogger.api_log(f"Total objects retrieved for structure parsing: {len(objects)}")
+        self.__remove_non_structures(objects)
+        ArkSaveLogger.api_log(f"Total structure objects after filtering non-structures: {len(objects)}")
+
+        return objects
+
+    def __remove_non_structures(self, objects: Dict[UUID, ArkGameObject]):
         to_remove = []
         for obj in objects.values():
             if obj.get_property_value("StructureID") is None:
@@ -69,9 +88,30 @@ class StructureApi:
 
         for uuid in to_remove:
             del objects[uuid]
-            
-        ArkSaveLogger.api_log(f"Total structure objects after filtering non-structures: {len(objects)}")
 
+    def __get_objects_among(self, uuids: Set[UUID], classes: List[str] = None) -> Dict[UUID, ArkGameObject]:
+        # The selection of get_all_objects, but only for the given uuids.
+        # Class names are read first, so only objects of a matching class are parsed
+        objects = {}
+        for obj_uuid, blueprint in self.save.get_classes_of_uuids(uuids).items():
+            if classes is not None:
+                if blueprint not in classes:
+                    continue
+            elif not StructureApi._is_structure_blueprint(blueprint) and not StructureApi._is_container_blueprint(blueprint):
+                continue
+
+            obj = self.save.get_game_object_by_id(obj_uuid)
+            if obj is None:
+                continue
+
+            if classes is None:
+                if not StructureApi._is_structure_blueprint(blueprint) and obj.get_property_value("MyInventoryComponent") is None:
+                    continue
+                if obj.get_property_value("bIsEngram") is not None:
+                    continue
+            objects[obj_uuid] = obj
+
+        self.__remove_non_structures(objects)
         return objects
 
     def _parse_single_structure(self, obj: ArkGameObject, bypass_inventory: bool = True) -> Union[Structure, StructureWithInventory]:
@@ -91,6 +131,7 @@ class StructureApi:
                 structure.set_actor_transform(self.save.save_context.actor_transforms[obj.uuid])
 
             self.parsed_structures[obj.uuid] = structure
+            self._structure_graph = None
         except Exception as e:
             if ArkSaveLogger._allow_invalid_objects:
                 ArkSaveLogger.error_log(f"Failed to parse structure {obj.uuid}: {e}")
@@ -105,7 +146,14 @@ class StructureApi:
             return self.parsed_structures
         
         objects = self.get_all_objects(config)
+        structures = self.__parse_structures(objects, bypass_inventory)
+
+        if config is None:
+            self.retrieved_all = True
+
+        return structures    
 
+    def __parse_structures(self, objects: Dict[UUID, ArkGameObject], bypass_inventory: bool = True) -> Dict[UUID, Union[Structure, StructureWithInventory]]:
         structures = {}
 
         ArkSaveLogger.api_log(f"Parsing structure objects into structure models, total objects to parse: {len(objects)}")
@@ -119,10 +167,21 @@ class StructureApi:
 
             structures[obj.uuid] = structure
 
-        if config is None:
-            self.retrieved_all = True
+        return structures
 
-        return structures    
+    def __get_spatial_index(self) -> Optional[SpatialIndex]:
+        # None if the transforms are not indexed
+        actor_transforms = self.save.save_context.actor_transforms
+        if not isinstance(actor_transforms, ActorTransformTable):
+            return None
+        return actor_transforms.spatial_index
+
+    def __get_candidates_at(self, map: ArkMap, coords: MapCoords, radius: float) -> Optional[Set[UUID]]:
+        # uuids of the actor transforms around the location, None if the transforms are not indexed
+        spatial_index = self.__get_spatial_index()
+        if spatial_index is None:
+            return None
+        return set(spatial_index.query_map_coords(map, coords, radius))
 
     def get_by_id(self, id: UUID) -> Union[Structure, StructureWithInventory]:
         obj = self.save.get_game_object_by_id(id)
@@ -138,11 +197,18 @@ class StructureApi:
         else:
             config = None
 
-        structures = self.get_all(config)
-        result = {}
-
         ArkSaveLogger.api_log(f"Getting structures at location {coords} on map {map.name} within radius {radius}")
 
+        # Only the objects the spatial index puts around the location are parsed, the exact check is done below
+        candidates = self.__get_candidates_at(map, coords, radius)
+        if candidates is None:
+            structures = self.get_all(config)
+        elif config is None and self.retrieved_all:
+            structures = {key: self.parsed_structures[key] for key in candidates if key in self.parsed_structures}
+        else:
+            structures = self.__parse_structures(self.__get_objects_among(candidates, classes))
+        result = {}
+
         for key, obj in structures.items():
             obj: Structure = obj
             if obj.location is None:
@@ -162,6 +228,7 @@ class StructureApi:
                 self.save.remove_obj_from_db(uuid)
                 removed.append(uuid)
                 self.parsed_structures.pop(uuid, None)
+                self._structure_graph = None
 
         ArkSaveLogger.api_log(f"Removed {len(removed)} structures at location {coords} on map {map.name}")
 
@@ -222,41 +289,61 @@ class StructureApi:
     
     def filter_by_location(self, map: ArkMap, coords: MapCoords, radius: float, structures: Dict[UUID, Union[Structure, StructureWithInventory]]) -> Dict[UUID, Union[Structure, StructureWithInventory]]:
         result = {}
+        spatial_index = self.__get_spatial_index()
+        candidates = None if spatial_index is None else set(spatial_index.query_map_coords(map, coords, radius))
 
         for key, obj in structures.items():
+            # structures that are not indexed at their current location are checked the slow way,
+            # a location can be changed without modify_actor_transform (e.g. Base.move_to without a save)
+            if candidates is not None and key not in candidates and spatial_index.is_indexed_at(key, obj.location):
+                continue
+
             if obj.location.is_at_map_coordinate(map, coords, tolerance=radius):
                 result[key] = obj
 
         return result
     
+    def get_structure_graph(self) -> StructureGraph:
+        # graph of LinkedStructures, PlacedOnFloorStructure and StructuresPlacedOnFloor over all structures
+        if self._structure_graph is None:
+            self._structure_graph = StructureGraph(self.get_all())
+        return self._structure_graph
+
     def get_connected_structures(self, structures: Dict[UUID, Union[Structure, StructureWithInventory]]) -> Dict[UUID, Union[Structure, StructureWithInventory]]:
         result = structures.copy()
-        new_found = True
-        ignore = []
-        processed = []
-
-        while new_found:
-            new_found = False
-            new_result = result.copy()
-            unprocessed = [s for s in result.values() if s.uuid not in processed]
-            for s in unprocessed:
-                if s.uuid in processed:
+
+        # with all structures parsed, the graph answers without reading the save
+        if self.retrieved_all and all(key in self.parsed_structures for key in structures):
+            for uuid in self.get_structure_graph().get_connected(structures.keys()):
+                if uuid not in result:
+                    result[uuid] = self.parsed_structures[uuid]
+            return result
+
+        # breadth first otherwise, every structure is processed once
+        ignore = set()
+        unprocessed = deque(result.values())
+
+        while unprocessed:
+            s = unprocessed.popleft()
+            attached = s.linked_structure_uuids + s.placed_on_floor_uuids
+            if s.placed_on_floor_uuid is not None:
+                attached.append(s.placed_on_floor_uuid)
+            for uuid in attached:
+                if uuid in result or uuid in ignore:
                     continue
-                for uuid in s.linked_structure_uuids:
-                    if uuid not in new_result.keys() and uuid not in ignore and uuid not in processed:
-                        new_found = True
-                        obj = self.get_by_id(uuid)
-                        if obj is not None:
-                            new_result[uuid] = obj
-                        else:
-                            ignore.append(uuid)
-                            ArkSaveLogger.api_log(f"Could not find linked structure {uuid}, ignoring")
-                    processed.append(s.uuid)
-            result = new_result
-
-            # ArkSaveLogger.api_log(f"Connected structures found so far: {len(result)}")
+                obj = self.get_by_id(uuid)
+                if obj is not None:
+                    result[uuid] = obj
+                    unprocessed.append(obj)
+                else:
+                    ignore.add(uuid)
+                    ArkSaveLogger.api_log(f"Could not find linked structure {uuid}, ignoring")
 
         return result
+
+    def get_placed_on(self, structure: Structure) -> Dict[UUID, Union[Structure, StructureWithInventory]]:
+        # everything that is placed on the structure, directly or stacked on top
+        return {uuid: self.parsed_structures[uuid] for uuid in self.get_structure_graph().get_placed_on(structure.uuid)}
      
     def modify_structures(self, structures: Dict[UUID, Union[Structure, StructureWithInventory]], new_owner: ObjectOwner = None, new_max_health: float = None):
         for key, obj in structures.items():
@@ -264,45 +351,30 @@ class StructureApi:
                 if uuid not in structures.keys():
                     raise ValueError(f"Linked structure {uuid} is not in the structures list, please change owner of all linked structures")
 
-            if new_max_health is not None:
-                obj.set_max_health(new_max_health)
-            
-            if new_owner is not None:
-                obj.owner.replace_self_with(new_owner, binary=obj.binary)
+        with self.save.batch():
+            for key, obj in structures.items():
+                if new_max_health is not None:
+                    obj.set_max_health(new_max_health)
 
-            obj.update_binary()
+                if new_owner is not None:
+                    obj.owner.replace_self_with(new_owner, binary=obj.binary)
 
-    def create_heatmap(self, map: ArkMap, resolution: int = 100, structures: Dict[UUID, Union[Structure, StructureWithInventory]] = None, classes: List[str] = None, owner: ObjectOwner = None, min_in_section: int = 1):
-        import math
-        import numpy as np
+                obj.update_binary()
 
+    def create_heatmap(self, map: ArkMap, resolution: int = 100, structures: Dict[UUID, Union[Structure, StructureWithInventory]] = None, classes: List[str] = None, owner: ObjectOwner = None, min_in_section: int = 1):
         structs = structures
 
         if classes is not None:
             structs = self.get_by_class(classes)
         elif structures is None:
             structs = self.get_all()
-        heatmap = [[0 for _ in range(resolution)] for _ in range(resolution)]
-
-        for key, obj in structs.items():
-            obj: Structure = obj
-            if obj.location is None:
-                continue
-
-            if owner is not None and not obj.is_owned_by(owner):
-                continue
-
-            coords: MapCoords = obj.location.as_map_coords(map)
-            y = math.floor(coords.long)
-            x = math.floor(coords.lat)
-            heatmap[x][y] += 1
 
-        for i in range(resolution):
-            for j in range(resolution):
-                if heatmap[i][j] < min_in_section:
-                    heatmap[i][j] = 0
+        locations = [obj.location for obj in structs.values() if obj.location is not None and (owner is None or obj.is_owned_by(owner))]
+        lat, long = ActorTransform.as_map_coord_arrays(locations, map)
+        heatmap = bin_heatmap(lat, long, resolution)
+        heatmap[heatmap < min_in_section] = 0
 
-        return np.array(heatmap)
+        return heatmap
     
     def get_all_with_inventory(self) -> Dict[UUID, StructureWithInventory]:
         structures = self.get_all()
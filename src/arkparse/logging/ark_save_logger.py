@@ -1,7 +1,8 @@
 import logging
 import subprocess
+from collections import OrderedDict
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 from enum import Enum
 
 if TYPE_CHECKING:
@@ -40,6 +41,15 @@ class ArkSaveLogger:
     _file_viewer_enabled = None
     _log_level_states = None
 
+    # Snapshots of the buffers registered with set_file, the latest one per file name. Only written to disk when
+    # the hex view or an error dump needs them
+    _RECENT_FILES_SIZE = 16
+    _recent_files: "OrderedDict[Path, bytes]" = OrderedDict()
+
+    # Cheap flag for hot paths, check it before formatting a parser message: `if ArkSaveLogger.parser_enabled: ...`
+    # True until the config is loaded, so the first parser log call loads it and sets the real value
+    parser_enabled = True
+
     __LOG_CONFIG_FILE_NAME = "logger"
 
     @staticmethod
@@ -48,6 +58,13 @@ class ArkSaveLogger:
 
     @staticmethod
     def parser_log(message: str):
+        if not ArkSaveLogger.parser_enabled:
+            return
+        if ArkSaveLogger._log_level_states is None:
+            ArkSaveLogger.__init_config()
+            if not ArkSaveLogger.parser_enabled:
+                return
+
         struct_header = ""
         max = 15
         curr = 0
@@ -109,6 +126,17 @@ class ArkSaveLogger:
             ArkSaveLogger._log_level_states = config["levels"]
             ArkSaveLogger._file_viewer_enabled = config["fve"]
             ArkSaveLogger._allow_invalid_objects = config["allow_invalid"]
+        ArkSaveLogger.__update_flags()
+
+    @staticmethod
+    def __update_flags():
+        ArkSaveLogger.parser_enabled = ArkSaveLogger.is_enabled(ArkSaveLogger.LogTypes.PARSER)
+
+    @staticmethod
+    def is_enabled(log_type: "ArkSaveLogger.LogTypes") -> bool:
+        if ArkSaveLogger._log_level_states is None:
+            ArkSaveLogger.__init_config()
+        return ArkSaveLogger._log_level_states.get(log_type.value, False) or ArkSaveLogger._log_level_states["all"]
 
     @staticmethod
     def __log(message: str, log_type: "ArkSaveLogger.LogTypes", color: "ArkSaveLogger.LogColors" = None):
@@ -130,6 +158,7 @@ class ArkSaveLogger:
         if ArkSaveLogger._log_level_states is None:
             ArkSaveLogger.__init_config()
         ArkSaveLogger._log_level_states[log_type.value] = state
+        ArkSaveLogger.__update_flags()
 
         if set_globally:
             global_config = read_config_file(ArkSaveLogger.__LOG_CONFIG_FILE_NAME)
@@ -142,10 +171,12 @@ class ArkSaveLogger:
             ArkSaveLogger.__init_config()
         for key in ArkSaveLogger._log_level_states.keys():
             ArkSaveLogger._log_level_states[key] = False
+        ArkSaveLogger.__update_flags()
         ArkSaveLogger.allow_invalid_objects(False)
 
     @staticmethod
     def enter_struct(struct_name: str):
+        # always kept, parser logging can be turned on while a struct is open
         ArkSaveLogger.current_struct_path.append(struct_name)
 
     @staticmethod
@@ -179,11 +210,30 @@ class ArkSaveLogger:
 
     @staticmethod
     def set_file(reader: "ArkBinaryParser", name: str):
+        # keeps a snapshot of the buffer, the file is written when it is needed
         if ArkSaveLogger._temp_file_path != "" and ArkSaveLogger._file_viewer_enabled:
             ArkSaveLogger._byte_buffer = reader
             ArkSaveLogger._file = ArkSaveLogger._temp_file_path / name
-            with open(ArkSaveLogger._file, 'wb') as f:
-                f.write(reader.byte_buffer)
+            recent_files = ArkSaveLogger._recent_files
+            recent_files.pop(ArkSaveLogger._file, None)
+            recent_files[ArkSaveLogger._file] = bytes(reader.byte_buffer)
+            if len(recent_files) > ArkSaveLogger._RECENT_FILES_SIZE:
+                recent_files.popitem(last=False)
+
+    @staticmethod
+    def __write_file(path: Path, data: bytes):
+        with open(path, 'wb') as f:
+            f.write(data)
+
+    @staticmethod
+    def dump_recent_files() -> List[Path]:
+        # writes the recently registered buffers, call it when an error is raised. Nothing is kept when the hex viewer is disabled
+        written = []
+        while ArkSaveLogger._recent_files:
+            path, data = ArkSaveLogger._recent_files.popitem(last=False)
+            ArkSaveLogger.__write_file(path, data)
+            written.append(path)
+        return written
 
     @staticmethod
     def open_hex_view(wait: bool = False):
@@ -191,6 +241,10 @@ class ArkSaveLogger:
             ArkSaveLogger.__init_config()
             
         if ArkSaveLogger._file_viewer_enabled and ArkSaveLogger._byte_buffer is not None:
+            # already on disk when it was dumped since
+            data = ArkSaveLogger._recent_files.pop(ArkSaveLogger._file, None)
+            if data is not None:
+                ArkSaveLogger.__write_file(ArkSaveLogger._file, data)
             parser = Path(__file__).resolve().parent.parent.parent / 'binary-reader' / 'binary_visualizer.py'
             logging.info("[File viewer] Opening hex view")
             subprocess.Popen(['python', parser, '-f', ArkSaveLogger._file, '-i', str(ArkSaveLogger._byte_buffer.get_position())])
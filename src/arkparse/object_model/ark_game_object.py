@@ -45,7 +45,8 @@ class ArkGameObject(ArkPropertyContainer):
         super().__init__()
         if binary_reader:
             ArkSaveLogger.set_file(binary_reader, "debug.bin")
-            ArkSaveLogger.parser_log(f"Parsing object with UUID: {uuid}, Blueprint: {blueprint}, From custom bytes: {from_custom_bytes}, No header: {no_header}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"Parsing object with UUID: {uuid}, Blueprint: {blueprint}, From custom bytes: {from_custom_bytes}, No header: {no_header}")
             if not no_header:
                 if not from_custom_bytes:
                     self.uuid = uuid
@@ -53,15 +54,18 @@ class ArkGameObject(ArkPropertyContainer):
                     binary_reader.set_position(0)
 
                     self.blueprint, string_name = ArkGameObject.read_name(uuid, binary_reader)
-                    ArkSaveLogger.parser_log(f"Read Blueprint: {self.blueprint} (String name: {string_name})")
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(f"Read Blueprint: {self.blueprint} (String name: {string_name})")
 
                     sContext : SaveContext = binary_reader.save_context
                     self.location = sContext.get_actor_transform(uuid) or None
-                    ArkSaveLogger.parser_log(f"Retrieved actor location: {('Success' if self.location else 'Failed')}")
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(f"Retrieved actor location: {('Success' if self.location else 'Failed')}")
                 else:
                     self.uuid = binary_reader.read_uuid()
                     self.blueprint = binary_reader.read_string()
-                    ArkSaveLogger.parser_log(f"Read UUID: {self.uuid}, Blueprint: {self.blueprint}")
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(f"Read UUID: {self.uuid}, Blueprint: {self.blueprint}")
                 
                 binary_reader.validate_uint32(0)
                 if string_name:
@@ -69,21 +73,24 @@ class ArkGameObject(ArkPropertyContainer):
 
             try:
                 if not (no_header or string_name):
-                    ArkSaveLogger.parser_log(f"Reading names for object {self.blueprint} ({self.uuid})")
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(f"Reading names for object {self.blueprint} ({self.uuid})")
                     offsets = []
                     if not from_custom_bytes:
                         nr_names = binary_reader.read_int()
                         self.names, offsets = binary_reader.read_names(nr_names)
                     else:
                         self.names = binary_reader.read_strings_array()
-                        ArkSaveLogger.parser_log(f"Read {len(self.names)} names from custom bytes")
+                        if ArkSaveLogger.parser_enabled:
+                            ArkSaveLogger.parser_log(f"Read {len(self.names)} names from custom bytes")
 
                     self.name_metadata = []
                     for i, offset in enumerate(offsets):
                         self.name_metadata.append(_NameMetadata(self.names[i], offset, binary_reader.save_context.is_read_names_as_strings()))
 
-                    for name in self.names:
-                        ArkSaveLogger.parser_log(f"Name: {name}")
+                    if ArkSaveLogger.parser_enabled:
+                        for name in self.names:
+                            ArkSaveLogger.parser_log(f"Name: {name}")
 
                     if "AnimSequence" in self.blueprint:
                         return
@@ -91,7 +98,8 @@ class ArkGameObject(ArkPropertyContainer):
                     self.section = binary_reader.read_part()
                     self.unknown = binary_reader.read_short()
 
-                    ArkSaveLogger.parser_log(f"Section: {self.section}, Unknown: {self.unknown}")
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(f"Section: {self.section}, Unknown: {self.unknown}")
                     
                     if from_custom_bytes:
                         binary_reader.validate_uint16(0)
@@ -101,22 +109,15 @@ class ArkGameObject(ArkPropertyContainer):
                             ArkRotator(binary_reader)  # Placeholder for rotation data
 
                         self.properties_offset = binary_reader.read_uint32()
-                        ArkSaveLogger.parser_log(f"Properties offset: {self.properties_offset}")
+                        if ArkSaveLogger.parser_enabled:
+                            ArkSaveLogger.parser_log(f"Properties offset: {self.properties_offset}")
                         binary_reader.validate_uint32(0)
 
                 if not from_custom_bytes:
-                    ArkSaveLogger.parser_log(f"Reading properties for object {self.blueprint} ({self.uuid})")
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(f"Reading properties for object {self.blueprint} ({self.uuid})")
                     self.read_properties(binary_reader, self.parser_type, binary_reader.size())
-                    
-                    if  binary_reader.size() - binary_reader.position >= 20:
-                        binary_reader.set_position(binary_reader.size() - 20)
-                        binary_reader.read_int()
-                        self.uuid2 = binary_reader.read_uuid()
-
-                        if binary_reader.has_more():
-                            # ArkSaveLogger.enable_debug = True
-                            ArkSaveLogger.open_hex_view()
-                            raise Exception("Unknown data left")
+                    self.read_trailer(binary_reader)
                         
                 if no_header:
                     bp_ref = self.get_property_value("ItemArchetype", None)
@@ -125,8 +126,20 @@ class ArkGameObject(ArkPropertyContainer):
             except Exception as e:
                 ArkSaveLogger.error_log(f"Error while reading object {self.blueprint} ({self.uuid}): {e}")
                 ArkSaveLogger.set_file(binary_reader, "debug.bin")
+                ArkSaveLogger.dump_recent_files()
                 raise e
     
+    def read_trailer(self, binary_reader: ArkBinaryParser):
+        if  binary_reader.size() - binary_reader.position >= 20:
+            binary_reader.set_position(binary_reader.size() - 20)
+            binary_reader.read_int()
+            self.uuid2 = binary_reader.read_uuid()
+
+            if binary_reader.has_more():
+                # ArkSaveLogger.enable_debug = True
+                ArkSaveLogger.open_hex_view()
+                raise Exception("Unknown data left")
+
     def __replace_name(self, new_class: str, binary: ArkBinaryParser):
         new_short_name = new_class.split(".")[-1] + "_"
         as_bytes = new_short_name.encode("utf-8")
@@ -193,6 +206,7 @@ class ArkGameObject(ArkPropertyContainer):
         binary.validate_byte(underscore)
         binary.replace_bytes(new_bytes, binary.position)
         md.name = md.name[:-11] + "_" + new_bytes.decode("utf-8")
+        self.names[len(self.name_metadata) - 1] = md.name
 
         return binary.byte_buffer
     
@@ -255,7 +269,8 @@ class ArkGameObject(ArkPropertyContainer):
                 class_name = reader.read_string()
                 # reader.validate_uint32(0)
                 string_name = True
-                ArkSaveLogger.parser_log(f"Object {obj_uuid} has string class name {class_name} instead of name table reference")
+                if ArkSaveLogger.parser_enabled:
+                    ArkSaveLogger.parser_log(f"Object {obj_uuid} has string class name {class_name} instead of name table reference")
             except Exception as e:
                 ArkSaveLogger.error_log(f"Error reading class name for object {obj_uuid}: {e}")
                 reader.structured_print(to_default_file=True)
@@ -302,4 +317,110 @@ class ArkGameObject(ArkPropertyContainer):
         return short
     
     def __str__(self):
-            return f"ArkGameObject(UUID: {self.uuid}, Blueprint: {self.blueprint}, Location: {self.location}, Properties: {len(self.properties)} properties)"
\ No newline at end of file
+            return f"ArkGameObject(UUID: {self.uuid}, Blueprint: {self.blueprint}, Location: {self.location}, Properties: {len(self.properties)} properties)"
+
+
+class LazyArkGameObject(ArkGameObject):
+    """
+    ArkGameObject that only reads its header (blueprint and names) when created.
+    Properties are decoded on first access, find_property and has_property only decode up to the first match.
+    Errors in the properties surface when they are decoded instead of failing the parse of the object. The error
+    is stored in decode_error and raised, unless invalid objects are allowed (ArkSaveLogger.allow_invalid_objects).
+    Then the object keeps the properties read before the error and records itself in the decode_errors of the
+    save context, where the SaveConnection counts it as a faulty object.
+    """
+
+    decode_error: Optional[Exception] = None
+
+    def read_properties(self, byte_buffer: ArkBinaryParser, propertyClass, next_object_index: int) -> None:
+        # properties are read on demand, remember where they start
+        self._property_reader = byte_buffer
+        self._next_property_position = byte_buffer.get_position()
+        self._properties_end = next_object_index
+
+    def read_trailer(self, binary_reader: ArkBinaryParser):
+        if getattr(self, "_property_reader", None) is None:
+            super().read_trailer(binary_reader)
+
+    @property
+    def properties(self) -> List[ArkProperty]:
+        self.__decode_all()
+        return self._properties
+
+    @properties.setter
+    def properties(self, value: List[ArkProperty]):
+        self._properties = value
+
+    @property
+    def is_decoded(self) -> bool:
+        return getattr(self, "_property_reader", None) is None
+
+    def __read_next_property(self) -> Optional[ArkProperty]:
+        reader = self._property_reader
+        reader.set_position(self._next_property_position)
+        try:
+            ark_property = None
+            if reader.has_more() and reader.get_position() < self._properties_end:
+                ark_property = self.parser_type.read_property(reader)
+
+            if ark_property is None:
+                # end of the properties
+                self._property_reader = None
+                self.read_trailer(reader)
+                return None
+        except Exception as e:
+            self._property_reader = None
+            self.decode_error = e
+            ArkSaveLogger.error_log(f"Error while decoding properties of {self.blueprint} ({self.uuid}) at position {self._next_property_position}: {e}")
+            if ArkSaveLogger._allow_invalid_objects is False:
+                ArkSaveLogger.dump_recent_files()
+                raise e
+            if reader.save_context is not None:
+                reader.save_context.decode_errors[self.uuid] = self.blueprint
+            return None
+
+        self._next_property_position = reader.get_position()
+        self._properties.append(ark_property)
+        return ark_property
+
+    def __decode_all(self):
+        if not self.is_decoded:
+            ArkSaveLogger.reset_struct_path()
+        while not self.is_decoded:
+            self.__read_next_property()
+
+    def find_property(self, name: str, position: int = None) -> Optional[ArkProperty]:
+        if self.is_decoded:
+            return super().find_property(name, position)
+
+        for property in self._properties:
+            match = ArkPropertyContainer._match_property(property, name, position)
+            if match:
+                return match
+
+        while not self.is_decoded:
+            property = self.__read_next_property()
+            if property is not None:
+                match = ArkPropertyContainer._match_property(property, name, position)
+                if match:
+                    return match
+        return None
+
+    def has_property(self, name: str) -> bool:
+        if self.is_decoded:
+            return super().has_property(name)
+
+        if any(property.name == name for property in self._properties):
+            return True
+
+        while not self.is_decoded:
+            property = self.__read_next_property()
+            if property is not None and property.name == name:
+                return True
+        return False
+
+    def __getstate__(self):
+        # the reader is not stored, decode everything before pickling
+        self.__decode_all()
+        return self.__dict__.copy()
+
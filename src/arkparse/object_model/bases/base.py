@@ -105,8 +105,9 @@ class Base:
             structure.location.update(structure.location.x + offset_x, structure.location.y + offset_y, structure.location.z + offset_z)
 
         if save is not None:
-            for _, structure in self.structures.items():
-                save.modify_actor_transform(structure.object.uuid, structure.location.to_bytes())
+            with save.batch():
+                for _, structure in self.structures.items():
+                    save.modify_actor_transform(structure.object.uuid, structure.location.to_bytes())
 
     def set_owner(self, new_owner: ObjectOwner):
         for uuid, structure in self.structures.items():
@@ -126,29 +127,30 @@ class Base:
         bullet = ""
         turrets = self.get_turrets()
     
-        for turret in turrets:
-            inventory = turret.inventory
+        with save.batch():
+            for turret in turrets:
+                inventory = turret.inventory
             
-            if inventory is None:
-                raise Exception(f"{turret.get_short_name()} {turret.object.uuid} has no inventory")
+                if inventory is None:
+                    raise Exception(f"{turret.get_short_name()} {turret.object.uuid} has no inventory")
             
-            if turret.object.blueprint == Classes.structures.placed.turrets.heavy:
-                bullet = Classes.equipment.ammo.advanced_rifle_bullet
-                amount = bullets_in_heavy
-            elif turret.object.blueprint == Classes.structures.placed.turrets.auto:
-                bullet = Classes.equipment.ammo.advanced_rifle_bullet
-                amount = bullets_in_auto
-            elif turret.object.blueprint == Classes.structures.placed.turrets.tek:
-                bullet = Classes.resources.Basic.element_shard
-                amount = shards_in_tek
+                if turret.object.blueprint == Classes.structures.placed.turrets.heavy:
+                    bullet = Classes.equipment.ammo.advanced_rifle_bullet
+                    amount = bullets_in_heavy
+                elif turret.object.blueprint == Classes.structures.placed.turrets.auto:
+                    bullet = Classes.equipment.ammo.advanced_rifle_bullet
+                    amount = bullets_in_auto
+                elif turret.object.blueprint == Classes.structures.placed.turrets.tek:
+                    bullet = Classes.resources.Basic.element_shard
+                    amount = shards_in_tek
 
            
-            ArkSaveLogger.objects_log(f"Padding {turret.get_short_name()} ({turret.object.uuid}) to {amount} bullets")
-            self.__set_new_inventory(save, turret, bullet, amount)
+                ArkSaveLogger.objects_log(f"Padding {turret.get_short_name()} ({turret.object.uuid}) to {amount} bullets")
+                self.__set_new_inventory(save, turret, bullet, amount)
 
-            ArkSaveLogger.objects_log(f"Updating {turret.get_short_name()} and inventory in database")
-            turret.update_binary()
-            turret.inventory.update_binary()
+                ArkSaveLogger.objects_log(f"Updating {turret.get_short_name()} and inventory in database")
+                turret.update_binary()
+                turret.inventory.update_binary()
 
         return len(turrets)
     
@@ -156,28 +158,29 @@ class Base:
         amount = 0
         generators: List[StructureWithInventory] = self.get_generators()
 
-        for generator in generators:
-            if not generator.inventory:
-                raise Exception(f"Generators must have inventory!")
+        with save.batch():
+            for generator in generators:
+                if not generator.inventory:
+                    raise Exception(f"Generators must have inventory!")
             
-            # Reset the generators last checked fuel time to the current game time to prevent them from running out of fuel instantly
-            generator.binary.replace_double(generator.object.find_property("LastCheckedFuelTime"), save.save_context.game_time)
-            item_class = None
-            if generator.object.blueprint == Classes.structures.placed.metal.generator:
-                item_class = Classes.resources.Crafted.gasoline
-                amount = nr_of_gasoline
-            elif generator.object.blueprint == Classes.structures.placed.tek.generator:
-                item_class = Classes.resources.Basic.element
-                amount = nr_of_element
-
-            ArkSaveLogger.objects_log(f"Adding fuel to generator {generator.object.uuid} (type={generator.get_short_name()})")
-            self.__set_new_inventory(save, generator, item_class, amount)
-
-            ArkSaveLogger.objects_log(f"Updating generator and inventory {generator.object.uuid} in database")
-            generator.update_binary()
-            generator.inventory.update_binary()
-
-            ArkSaveLogger.objects_log("\n")
+                # Reset the generators last checked fuel time to the current game time to prevent them from running out of fuel instantly
+                generator.binary.replace_double(generator.object.find_property("LastCheckedFuelTime"), save.save_context.game_time)
+                item_class = None
+                if generator.object.blueprint == Classes.structures.placed.metal.generator:
+                    item_class = Classes.resources.Crafted.gasoline
+                    amount = nr_of_gasoline
+                elif generator.object.blueprint == Classes.structures.placed.tek.generator:
+                    item_class = Classes.resources.Basic.element
+                    amount = nr_of_element
+
+                ArkSaveLogger.objects_log(f"Adding fuel to generator {generator.object.uuid} (type={generator.get_short_name()})")
+                self.__set_new_inventory(save, generator, item_class, amount)
+
+                ArkSaveLogger.objects_log(f"Updating generator and inventory {generator.object.uuid} in database")
+                generator.update_binary()
+                generator.inventory.update_binary()
+
+                ArkSaveLogger.objects_log("\n")
 
         return len(generators)
     
@@ -270,8 +270,10 @@ class Dino(ParsedObjectBase):
             raise ValueError("SavedBaseWorldLocation property not found in the object")
 
         as_vector: ArkVector = ArkVector(x=location.x, y=location.y, z=location.z)
-        self.binary.replace_struct_property(current_location, as_vector.to_bytes())
-        self.object = ArkGameObject(self.object.uuid, self.object.blueprint, self.binary)
+        self.binary.replace_struct_property(current_location, as_vector.to_bytes(), as_vector)
+        if not self.binary.tracks(self.object):
+            self.object = ArkGameObject(self.object.uuid, self.object.blueprint, self.binary) # align with the new bytes
+            self.binary.track(self.object)
 
         self.save.modify_actor_transform(self.object.uuid, location.to_bytes())
         self.update_binary()
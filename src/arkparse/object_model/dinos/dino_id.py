@@ -1,11 +1,13 @@
 import random
 from typing import TYPE_CHECKING
 
+from arkparse.utils.freezable import Freezable
+
 if TYPE_CHECKING:
     from arkparse.object_model.ark_game_object import ArkGameObject
     from arkparse.parsing.ark_binary_parser import ArkBinaryParser
 
-class DinoId:
+class DinoId(Freezable):
     id1: int
     id2: int
 
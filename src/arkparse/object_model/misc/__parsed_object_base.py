@@ -33,11 +33,13 @@ class ParsedObjectBase:
             return
 
         self.save = save
-        if not save.is_in_db(uuid):
+        binary, object = save.get_parser_and_game_object(uuid)
+        if binary is None:
             ArkSaveLogger.error_log(f"Could not find binary for game object {uuid} in save")
         else:
-            self.binary = save.get_parser_for_game_object(uuid)
-            self.object = save.get_game_object_by_id(uuid)
+            self.binary = binary
+            self.object = object
+            binary.track(object)
 
         self.__init_props__()
 
@@ -56,6 +58,9 @@ class ParsedObjectBase:
 
     def reidentify(self, new_uuid: UUID = None, update=True):
         from ..ark_game_object import ArkGameObject
+        # if the uuid is only the key of the object, the new uuid and name number are all that change
+        old_uuid = self.object.uuid
+        in_place = self.binary.tracks(self.object) and old_uuid.bytes not in self.binary.byte_buffer
         self.replace_uuid(new_uuid=new_uuid)
         self.renumber_name()
         uuid = new_uuid if new_uuid is not None else self.object.uuid
@@ -64,7 +69,15 @@ class ParsedObjectBase:
         # if creation_time is not None:
         #     self.binary.replace_double(creation_time, self.save.save_context.game_time)
 
-        self.object = ArkGameObject(uuid=uuid, blueprint=self.object.blueprint, binary_reader=self.binary)
+        if in_place:
+            self.object.location = self.binary.save_context.get_actor_transform(uuid) or None
+        else:
+            self.object = ArkGameObject(uuid=uuid, blueprint=self.object.blueprint, binary_reader=self.binary)
+        self.binary.track(self.object)
+
+        if self.save is not None and uuid != old_uuid:
+            # the object read for the old uuid was edited along, it is parsed again when requested
+            self.save.uncache_game_object(old_uuid)
 
         if update:
             self.update_binary()
@@ -117,7 +130,9 @@ class ParsedObjectBase:
             ArkSaveLogger.error_log("This object has no ArkGameObject associated with it, cannot update binary as not in save")
             return
         if self.save is not None:
-            self.save.modify_game_obj(self.object.uuid, self.binary.byte_buffer)
+            # an object the writers kept in sync with the binary is stored as it is, others are parsed again
+            parsed_object = self.object if self.binary.tracks(self.object) else None
+            self.save.modify_game_obj(self.object.uuid, self.binary.byte_buffer, parsed_object)
         else:
             ArkSaveLogger.error_log("Parsed objects should have a save attached")
 
@@ -129,8 +144,10 @@ class ParsedObjectBase:
             ArkSaveLogger.error_log("This object has no binary associated with it, cannot update object")
             return
 
-        from ..ark_game_object import ArkGameObject
-        self.object = ArkGameObject(uuid=self.object.uuid, blueprint=self.object.blueprint, binary_reader=self.binary)
+        if not self.binary.tracks(self.object):
+            from ..ark_game_object import ArkGameObject
+            self.object = ArkGameObject(uuid=self.object.uuid, blueprint=self.object.blueprint, binary_reader=self.binary)
+            self.binary.track(self.object)
         self.__init_props__()
 
     def get_short_name(self):
@@ -35,23 +35,33 @@ class DinoOwner:
     def set_in_binary(self, binary: ArkBinaryParser):
         if self.imprinter_unique_id is not None:
             binary.replace_string(self.object.find_property("ImprinterPlayerUniqueNetId"), self.imprinter_unique_id)
-            self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+            if not binary.tracks(self.object):
+                self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                binary.track(self.object)
         if self.id_ is not None:
             binary.replace_u32(self.object.find_property("OwningPlayerID"), self.id_)
         if self.tribe is not None:
             binary.replace_string(self.object.find_property("TribeName"), self.tribe)
-            self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+            if not binary.tracks(self.object):
+                self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                binary.track(self.object)
         if self.tamer_tribe_id is not None:
             binary.replace_u32(self.object.find_property("TamingTeamID"), self.tamer_tribe_id)
         if self.tamer_string is not None:
             binary.replace_string(self.object.find_property("TamerString"), self.tamer_string)
-            self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+            if not binary.tracks(self.object):
+                self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                binary.track(self.object)
         if self.player is not None:
             binary.replace_string(self.object.find_property("OwningPlayerName"), self.player)
-            self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+            if not binary.tracks(self.object):
+                self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                binary.track(self.object)
         if self.imprinter is not None:
             binary.replace_string(self.object.find_property("ImprinterName"), self.imprinter)
-            self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+            if not binary.tracks(self.object):
+                self.object = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                binary.track(self.object)
         if self.target_team is not None:
             binary.replace_u32(self.object.find_property("TargetingTeam"), self.target_team)
 
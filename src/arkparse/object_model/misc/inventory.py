@@ -28,20 +28,27 @@ class Inventory(ParsedObjectBase):
             ArkSaveLogger.error_log(f"Inventory object with UUID {uuid} could not be loaded from save, not found")
             return
 
-        item_arr = self.object.get_array_property_value("InventoryItems")
-        for item in item_arr:
-            item_uuid = UUID(item.value)
-            item_class = self.save.get_class_of_uuid(item_uuid)
-            self.item_classes[item_uuid] = item_class
+        item_uuids = [UUID(item.value) for item in self.object.get_array_property_value("InventoryItems")]
+        item_classes = self.save.get_classes_of_uuids(item_uuids)
+        for item_uuid in item_uuids:
+            if item_uuid in item_classes:
+                self.item_classes[item_uuid] = item_classes[item_uuid]
+            else:
+                self.item_classes[item_uuid] = self.save.get_class_of_uuid(item_uuid)
 
     @property
     def items(self) -> Dict[UUID, InventoryItem]:
         if len(self._items) != len(self.item_classes):
             self._items = {}
-            item_arr = self.object.get_array_property_value("InventoryItems")
-            for item in item_arr:
-                item_uuid = UUID(item.value)
-                if item_uuid not in self._items.keys():
+            item_uuids = [UUID(item.value) for item in self.object.get_array_property_value("InventoryItems")]
+            fetched = self.save.get_parsers_and_game_objects(item_uuids)
+            for item_uuid in item_uuids:
+                if item_uuid in self._items.keys():
+                    continue
+                if item_uuid in fetched:
+                    binary, object = fetched[item_uuid]
+                    self._items[item_uuid] = InventoryItem.from_parser_and_object(self.save, binary, object)
+                else:
                     self._items[item_uuid] = InventoryItem(item_uuid, self.save)
         return self._items
 
@@ -42,6 +42,17 @@ class InventoryItem(ParsedObjectBase):
     def __init__(self, uuid: UUID = None, save: AsaSave = None):
         super().__init__(uuid, save=save)
 
+    @classmethod
+    def from_parser_and_object(cls, save: AsaSave, binary: ArkBinaryParser, object: ArkGameObject) -> "InventoryItem":
+        # for items whose binary and object were already fetched, e.g. with save.get_parsers_and_game_objects
+        item = cls()
+        item.save = save
+        item.binary = binary
+        item.object = object
+        binary.track(object)
+        item.__init_props__()
+        return item
+
     def __str__(self):
         return f"InventoryItem(item={self.object.blueprint.split('/')[-1].split('.')[0]}, quantity={self.quantity})"
 
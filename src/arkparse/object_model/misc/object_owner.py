@@ -44,10 +44,14 @@ class ObjectOwner:
                 binary.replace_u32(self.properties.find_property("OriginalPlacerPlayerID"), self.original_placer_id)
             if self.tribe_name is not None:
                 binary.replace_string(self.properties.find_property("OwnerName"), self.tribe_name)
-                self.properties = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                if not binary.tracks(self.properties):
+                    self.properties = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                    binary.track(self.properties)
             if self.player_name is not None:
                 binary.replace_string(self.properties.find_property("OwningPlayerName"), self.player_name)
-                self.properties = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                if not binary.tracks(self.properties):
+                    self.properties = ArkGameObject(uuid='', blueprint='', binary_reader=binary) # align after potential move of positions
+                    binary.track(self.properties)
             if self.id_ is not None:
                 binary.replace_u32(self.properties.find_property("OwningPlayerID"), self.id_)
             if self.tribe_id is not None:
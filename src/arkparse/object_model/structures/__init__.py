@@ -1,3 +1,4 @@
 """Gather game object imports"""
 from .structure import Structure
 from .structure_with_inventory import StructureWithInventory
+from .structure_graph import StructureGraph
@@ -25,6 +25,8 @@ class Structure(ParsedObjectBase):
 
     linked_structure_uuids: List[str]#LinkedStructures
     linked_structures = List["Structure"]
+    placed_on_floor_uuid: Optional[UUID] #PlacedOnFloorStructure
+    placed_on_floor_uuids: List[UUID] #StructuresPlacedOnFloor
 
     # timestamps
     original_creation_time: float #OriginalCreationTime
@@ -37,11 +39,9 @@ class Structure(ParsedObjectBase):
     last_in_ally_range_time_serialized: float #LastInAllyRangeTimeSerialized
 
     #?
-    #StructuresPlacedOnFloor
     #PrimarySnappedStructureChild
     #BedID
     #NextAllowedUseTime
-    #PlacedOnFloorStructure
     #LinkedPlayerID
     #LinkedPlayerName
     #bInitializedRotation
@@ -67,6 +67,11 @@ class Structure(ParsedObjectBase):
         self.linked_structure_uuids = [UUID(link.value) for link in linked]
         self.linked_structures = []
 
+        floor: Optional[ObjectReference] = properties.get_property_value("PlacedOnFloorStructure")
+        self.placed_on_floor_uuid = UUID(floor.value) if floor is not None and floor.type == ObjectReference.TYPE_UUID else None
+        placed: List[ObjectReference] = properties.get_array_property_value("StructuresPlacedOnFloor", [])
+        self.placed_on_floor_uuids = [UUID(ref.value) for ref in placed if ref.type == ObjectReference.TYPE_UUID]
+
         self.original_creation_time = properties.get_property_value("OriginalCreationTime")
         self.last_enter_stasis_time = properties.get_property_value("LastEnterStasisTime")
         self.has_reset_decay_time = properties.get_property_value("bHasResetDecayTime", False)
@@ -0,0 +1,130 @@
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+import numpy as np
+
+from .structure import Structure
+
+
+def connected_components(count: int, edges: List[Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    # Component label (smallest member index) of every node, for edges given as (sources, targets) arrays.
+    # Union-find in array form: roots are hooked onto the smaller root of every edge, then paths are shortcut
+    labels = np.arange(count)
+    sources = np.concatenate([e[0] for e in edges]) if edges else np.empty(0, dtype=np.intp)
+    targets = np.concatenate([e[1] for e in edges]) if edges else np.empty(0, dtype=np.intp)
+
+    while True:
+        source_labels = labels[sources]
+        target_labels = labels[targets]
+        if np.array_equal(source_labels, target_labels):
+            return labels
+
+        lowest = np.minimum(source_labels, target_labels)
+        np.minimum.at(labels, source_labels, lowest)
+        np.minimum.at(labels, target_labels, lowest)
+        while True:
+            shortcut = labels[labels]
+            if np.array_equal(shortcut, labels):
+                break
+            labels = shortcut
+
+
+class StructureGraph:
+    """
+    Graph of the structures of a save, built in one scan over parsed structures.
+    Nodes are integer ids (the position in uuids), adjacency is kept in CSR form:
+    the neighbours of node i are indices[indptr[i]:indptr[i + 1]].
+    Queries run on the arrays only, nothing is read from the save.
+    """
+
+    def __init__(self, structures: Dict[UUID, Structure]):
+        self.uuids: List[UUID] = list(structures.keys())
+        self.node_of: Dict[UUID, int] = {uuid: i for i, uuid in enumerate(self.uuids)}
+
+        # links: LinkedStructures, PlacedOnFloorStructure and StructuresPlacedOnFloor, in both directions
+        # floors: floor -> structure placed on it
+        link_sources, link_targets = [], []
+        floor_sources, floor_targets = [], []
+        for i, structure in enumerate(structures.values()):
+            if structure is None:
+                continue
+            for uuid in structure.linked_structure_uuids:
+                j = self.node_of.get(uuid)
+                if j is not None:
+                    link_sources.append(i)
+                    link_targets.append(j)
+
+            floor = self.node_of.get(structure.placed_on_floor_uuid)
+            if floor is not None:
+                floor_sources.append(floor)
+                floor_targets.append(i)
+            for uuid in structure.placed_on_floor_uuids:
+                j = self.node_of.get(uuid)
+                if j is not None:
+                    floor_sources.append(i)
+                    floor_targets.append(j)
+
+        link_sources += floor_sources
+        link_targets += floor_targets
+        self.indptr, self.indices = StructureGraph.__to_csr(len(self.uuids), link_sources + link_targets, link_targets + link_sources)
+        self.floor_indptr, self.floor_indices = StructureGraph.__to_csr(len(self.uuids), floor_sources, floor_targets)
+
+    @staticmethod
+    def __to_csr(count: int, sources: List[int], targets: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        keep = sources != targets
+        # sorted by source, duplicate edges removed
+        edges = np.unique(sources[keep] * count + targets[keep])
+        indptr = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(edges // count, minlength=count), out=indptr[1:])
+        return indptr, edges % count
+
+    @staticmethod
+    def __gather(indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        # neighbours of all nodes, concatenated
+        starts = indptr[nodes]
+        counts = indptr[nodes + 1] - starts
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return indices[np.repeat(starts, counts) + offsets]
+
+    @staticmethod
+    def __reach(indptr: np.ndarray, indices: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        # breadth first from all nodes at once, a frontier per step
+        visited = np.zeros(len(indptr) - 1, dtype=bool)
+        visited[nodes] = True
+        frontier = np.unique(nodes)
+        while len(frontier) > 0:
+            neighbours = StructureGraph.__gather(indptr, indices, frontier)
+            frontier = np.unique(neighbours[~visited[neighbours]])
+            visited[frontier] = True
+        return np.flatnonzero(visited)
+
+    def __len__(self) -> int:
+        return len(self.uuids)
+
+    def __nodes(self, uuids: Iterable[UUID]) -> np.ndarray:
+        return np.array([self.node_of[uuid] for uuid in uuids if uuid in self.node_of], dtype=np.int64)
+
+    def neighbours(self, uuid: UUID) -> List[UUID]:
+        node = self.node_of[uuid]
+        return [self.uuids[i] for i in self.indices[self.indptr[node]:self.indptr[node + 1]].tolist()]
+
+    def get_connected(self, uuids: Iterable[UUID]) -> List[UUID]:
+        # everything reachable from the given structures, including themselves
+        return [self.uuids[i] for i in StructureGraph.__reach(self.indptr, self.indices, self.__nodes(uuids)).tolist()]
+
+    def get_placed_on(self, uuid: UUID) -> List[UUID]:
+        # everything placed on the structure, directly or on top of something placed on it
+        reached = StructureGraph.__reach(self.floor_indptr, self.floor_indices, self.__nodes([uuid]))
+        return [self.uuids[i] for i in reached.tolist() if self.uuids[i] != uuid]
+
+    def components(self) -> np.ndarray:
+        # component label of every node, the smallest node id in the component
+        sources = np.repeat(np.arange(len(self.uuids)), np.diff(self.indptr))
+        return connected_components(len(self.uuids), [(sources, self.indices)])
+
+    def get_components(self) -> List[List[UUID]]:
+        grouped: Dict[int, List[UUID]] = {}
+        for node, label in enumerate(self.components().tolist()):
+            grouped.setdefault(label, []).append(self.uuids[node])
+        return list(grouped.values())
@@ -4,7 +4,6 @@ from pathlib import Path
 
 from arkparse.saves.asa_save import AsaSave
 from arkparse.object_model.misc.inventory import Inventory
-from arkparse.object_model.ark_game_object import ArkGameObject
 
 from .structure import Structure
 from ...parsing import ArkBinaryParser
@@ -88,8 +87,6 @@ class StructureWithInventory(Structure):
         super().reidentify(new_uuid)
         if self.inventory is not None:
             self.inventory.renumber_name(new_number=self.object.get_name_number())
-        uuid = new_uuid if new_uuid is not None else self.object.uuid
-        self.object = ArkGameObject(uuid=uuid, blueprint=self.object.blueprint, binary_reader=self.binary)
 
     def store_binary(self, path: Path, prefix: str = "str_"):
         super().store_binary(path, prefix=prefix)
@@ -5,52 +5,94 @@ from uuid import UUID
 from ._binary_reader_base import BinaryReaderBase
 from arkparse.logging import ArkSaveLogger
 
+# precompiled little endian formats of the readers below
+INT16 = struct.Struct('<h')
+UINT16 = struct.Struct('<H')
+INT32 = struct.Struct('<i')
+UINT32 = struct.Struct('<I')
+INT64 = struct.Struct('<q')
+UINT64 = struct.Struct('<Q')
+FLOAT = struct.Struct('<f')
+DOUBLE = struct.Struct('<d')
+# name table id followed by its (mostly zero) instance number
+NAME = struct.Struct('<Ii')
+_DOUBLES = {}
+
 class BaseValueParser(BinaryReaderBase):
     def __init__(self, data: bytes, save_context=None):
         super().__init__(data, save_context)
 
+    def read_struct(self, format: struct.Struct) -> tuple:
+        # reads all fields of a precompiled struct at once
+        position = self.position
+        try:
+            result = format.unpack_from(self._view, position)
+        except struct.error:
+            raise IndexError(f"Buffer underflow: not enough bytes to read {format.size} bytes.") from None
+        self.position = position + format.size
+        return result
+
+    def read_doubles(self, count: int) -> tuple:
+        format = _DOUBLES.get(count)
+        if format is None:
+            format = struct.Struct(f'<{count}d')
+            if count <= 16:
+                _DOUBLES[count] = format
+        return self.read_struct(format)
+
     def read_int(self) -> int:
-        if self.position + 4 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read an int.")
-        result = struct.unpack_from('<i', self.byte_buffer, self.position)[0]
-        self.position += 4
+        position = self.position
+        try:
+            result = INT32.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read an int.") from None
+        self.position = position + 4
         return result
 
     def read_uint32(self) -> int:
-        if self.position + 4 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read an unsigned int.")
-        result = struct.unpack_from('<I', self.byte_buffer, self.position)[0]
-        self.position += 4
+        position = self.position
+        try:
+            result = UINT32.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read an unsigned int.") from None
+        self.position = position + 4
         return result
 
     def read_uint16(self) -> int:
-        if self.position + 2 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read an unsigned short.")
-        result = struct.unpack_from('<H', self.byte_buffer, self.position)[0]
-        self.position += 2
+        position = self.position
+        try:
+            result = UINT16.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read an unsigned short.") from None
+        self.position = position + 2
         return result
 
     def read_uint64(self) -> int:
-        if self.position + 8 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read an unsigned long.")
-        result = struct.unpack_from('<Q', self.byte_buffer, self.position)[0]
-        self.position += 8
+        position = self.position
+        try:
+            result = UINT64.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read an unsigned long.") from None
+        self.position = position + 8
         return result
     
     def read_int64(self) -> int:
-        if self.position + 8 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read a long.")
-        result = struct.unpack_from('<q', self.byte_buffer, self.position)[0]
-        self.position += 8
+        position = self.position
+        try:
+            result = INT64.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read a long.") from None
+        self.position = position + 8
         return result
 
     def read_bytes(self, count: int) -> bytes:
-        if count > len(self.byte_buffer) - self.position:
+        position = self.position
+        buffer = self._byte_buffer
+        if count > len(buffer) - position:
             ArkSaveLogger.open_hex_view()
-            raise ValueError("Attempting to read more bytes than available in the buffer: " + str(count) + " " + str(len(self.byte_buffer) - self.position))
-        result = self.byte_buffer[self.position:self.position + count]
-        self.position += count
-        return result
+            raise ValueError("Attempting to read more bytes than available in the buffer: " + str(count) + " " + str(len(buffer) - position))
+        self.position = position + count
+        return buffer[position:position + count]
 
     def skip_bytes(self, count: int):
         self.position += count
@@ -66,7 +108,8 @@ class BaseValueParser(BinaryReaderBase):
 
         result = ""
         if is_multi_byte:
-            ArkSaveLogger.parser_log(f"Reading multi-byte string of length {abs_length}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"Reading multi-byte string of length {abs_length}")
             # ArkSaveLogger.open_hex_view(True)
             to_read: int = (abs_length * 2) - 2
             if to_read > 0:
@@ -94,24 +137,30 @@ class BaseValueParser(BinaryReaderBase):
         return self.read_byte() != 0
 
     def read_float(self) -> float:
-        if self.position + 4 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read a float.")
-        result = struct.unpack_from('<f', self.byte_buffer, self.position)[0]
-        self.position += 4
+        position = self.position
+        try:
+            result = FLOAT.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read a float.") from None
+        self.position = position + 4
         return result
 
     def read_double(self) -> float:
-        if self.position + 8 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read a double.")
-        result = struct.unpack_from('<d', self.byte_buffer, self.position)[0]
-        self.position += 8
+        position = self.position
+        try:
+            result = DOUBLE.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read a double.") from None
+        self.position = position + 8
         return result
 
     def read_short(self) -> int:
-        if self.position + 2 > len(self.byte_buffer):
-            raise IndexError("Buffer underflow: not enough bytes to read a short.")
-        result = struct.unpack_from('<h', self.byte_buffer, self.position)[0]
-        self.position += 2
+        position = self.position
+        try:
+            result = INT16.unpack_from(self._view, position)[0]
+        except struct.error:
+            raise IndexError("Buffer underflow: not enough bytes to read a short.") from None
+        self.position = position + 2
         return result
 
     def read_unsigned_byte(self) -> int:
@@ -121,10 +170,11 @@ class BaseValueParser(BinaryReaderBase):
         return self.read_byte() & 0xFF
 
     def read_byte(self) -> int:
-        if self.position >= len(self.byte_buffer):
+        position = self.position
+        if position >= len(self._byte_buffer):
             raise IndexError("Buffer underflow: not enough bytes to read a byte.")
-        result = self.byte_buffer[self.position]
-        self.position += 1
+        result = self._byte_buffer[position]
+        self.position = position + 1
         return result
 
     def read_uuid(self) -> UUID:
@@ -168,7 +218,13 @@ class BaseValueParser(BinaryReaderBase):
             return self.read_string()
 
         pos = self.position    
-        name_id = self.read_uint32()
+        try:
+            # id and instance number in one read, the number is only consumed further down
+            name_id, number = NAME.unpack_from(self._view, pos)
+            self.position = pos + 4
+        except struct.error:
+            name_id = self.read_uint32()
+            number = None
         name = self.save_context.get_name(name_id)
         # print(f"Reading name with id {name_id} at position {self.position}, name: {name}")
 
@@ -178,7 +234,8 @@ class BaseValueParser(BinaryReaderBase):
         if name is None and default is not None:
             name = default
             # print(f"Name with id {name_id} not found, using default: {name}")
-            ArkSaveLogger.parser_log(f"Name with id {name_id} not found, using default: {name}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"Name with id {name_id} not found, using default: {name}")
 
         elif name is None and self.save_context.generate_unknown:
             name = f"UnknownName_{name_id:08X}"
@@ -190,9 +247,9 @@ class BaseValueParser(BinaryReaderBase):
             raise ValueError(f"Name is None, for name index {hex(name_id)} at position {pos}, generate_unknown is {self.save_context.generate_unknown}")
 
         elif name == "NPCZoneVolume" or "NPCZoneVolume_" in name or "_NPCZoneVolume" in name or "NPCCountVolume" in name:
-            return name + "_" + hex(self.read_int())
+            return name + "_" + hex(self.__read_name_number(number))
 
-        always_zero = self.read_int()
+        always_zero = self.__read_name_number(number)
 
         # no_prints = ["DontDoMaterialSpawning", "CorruptSpawnInValue", "LadderSocket", "Splus_SourceInclude", "Splus_SourceExclude"]
         # if always_zero != 0 and name not in no_prints:
@@ -200,6 +257,12 @@ class BaseValueParser(BinaryReaderBase):
         
         return name
     
+    def __read_name_number(self, number) -> int:
+        if number is None:
+            return self.read_int()
+        self.position += 4
+        return number
+
     def peek_name(self, ahead: int = 0) -> str:
         pos = self.position
         self.position += ahead
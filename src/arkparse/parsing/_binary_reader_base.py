@@ -10,6 +10,29 @@ class BinaryReaderBase:
         self.save_context = save_context if save_context else SaveContext()
         self.in_cryopod = False
 
+    @property
+    def byte_buffer(self) -> bytes:
+        return self._byte_buffer
+
+    @byte_buffer.setter
+    def byte_buffer(self, data: bytes):
+        # values are unpacked from a memoryview of the buffer, kept in sync whenever the buffer is replaced
+        self._byte_buffer = data
+        self._view = memoryview(data) if data is not None else None
+        # an object parsed from the old buffer no longer matches it, the property writers restore the tracking
+        # when they patched the object as well (see PropertyReplacer.track)
+        self.parsed_object = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_view", None)
+        state.pop("parsed_object", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.byte_buffer = self._byte_buffer
+
     def get_position(self) -> int:
         return self.position
 
@@ -17,8 +40,8 @@ class BinaryReaderBase:
         self.position = i
 
     def has_more(self) -> bool:
-        return self.position < len(self.byte_buffer)
+        return self.position < len(self._byte_buffer)
 
     def size(self) -> int:
-        return len(self.byte_buffer)
+        return len(self._byte_buffer)
     
\ No newline at end of file
@@ -1,8 +1,9 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional
 
 from ._property_insertor import PropertyInsertor
 if TYPE_CHECKING:
     from arkparse.parsing.ark_property import ArkProperty
+    from arkparse.parsing.ark_property_container import ArkPropertyContainer
 from arkparse.logging import ArkSaveLogger
 from typing import Dict, List
 import struct
@@ -12,6 +13,51 @@ class PropertyReplacer(PropertyInsertor):
     def __init__(self, data: bytes, save_context=None):
         super().__init__(data, save_context)
 
+    def track(self, parsed_object: Optional["ArkPropertyContainer"]):
+        # parsed_object was read from this buffer (or an identical one). From now on the property writers below patch
+        # the values and offsets of its properties together with the bytes, so it does not have to be parsed again.
+        # Any other edit of the buffer, or another parser tracking the same object, ends the tracking
+        if parsed_object is None:
+            self.parsed_object = None
+            return
+        self._tracking_token = object()
+        parsed_object._tracking_token = self._tracking_token
+        self.parsed_object = parsed_object
+
+    def tracks(self, parsed_object: Optional["ArkPropertyContainer"]) -> bool:
+        # True if parsed_object still matches the buffer
+        return parsed_object is not None and parsed_object is self.parsed_object \
+            and getattr(parsed_object, "_tracking_token", None) is self._tracking_token
+
+    def __tracked_object_of(self, property: "ArkProperty") -> Optional["ArkPropertyContainer"]:
+        # the tracked object if property is one of its properties, the writers leave other properties untouched
+        parsed_object = self.parsed_object
+        if not self.tracks(parsed_object):
+            return None
+        # a lazy object decodes its remaining properties before the first edit moves the offsets they are read from
+        parsed_object.properties
+        if parsed_object.find_property(property.name, property.position) is property:
+            return parsed_object
+        return None
+
+    def __replace_value(self, property: "ArkProperty", new_value_bytes: bytes, value: Any):
+        parsed_object = self.__tracked_object_of(property)
+        self.replace_bytes(new_value_bytes, position=property.value_position)
+        if parsed_object is not None:
+            property.value = value
+            self.parsed_object = parsed_object
+
+    def __reread_property(self, property: "ArkProperty"):
+        # updates all fields of property from the buffer, so they equal those of a fresh parse
+        from arkparse.parsing.ark_property import ArkProperty
+
+        original_position = self.position
+        self.set_position(property.name_position)
+        fresh = ArkProperty.read_property(self)
+        self.set_position(original_position)
+        for attr in ArkProperty.__slots__:
+            setattr(property, attr, getattr(fresh, attr))
+
     def __check_property_alignment(self, property: "ArkProperty") -> int:
         if property.position != 0:
             return property.name_position # can't check alignment if the property is not the fist occurence
@@ -55,6 +101,7 @@ class PropertyReplacer(PropertyInsertor):
         # ArkSaveLogger.open_hex_view(True)
 
         self.__check_property_alignment(property)
+        parsed_object = self.__tracked_object_of(property)
 
         original_position = self.position
         new_length = len(value) + 1
@@ -71,7 +118,16 @@ class PropertyReplacer(PropertyInsertor):
 
         # replace string
         lengthu32 = new_length.to_bytes(4, byteorder="little")
-        self.replace_bytes(lengthu32 + value.encode("utf-8"), nr_to_replace=current_nr_of_bytes, position=property.value_position)
+        new_string_bytes = lengthu32 + value.encode("utf-8")
+        self.replace_bytes(new_string_bytes, nr_to_replace=current_nr_of_bytes, position=property.value_position)
+
+        if parsed_object is not None and any(p is property for p in parsed_object.properties):
+            # everything behind the string moves by the change in length, the property itself is read again
+            parsed_object.shift_positions(property.value_position, len(new_string_bytes) - current_nr_of_bytes)
+            self.__reread_property(property)
+            self.parsed_object = parsed_object
+        # a string in a struct or array also changes the size of the enclosing property, that is a layout change
+        # and the object stays untracked, so it is parsed again
 
         self.set_position(original_position)
         # print(f"Replaced string {current_string} (length={current_nr_of_bytes}) at {property_position} with {value} at {string_pos}")
@@ -79,44 +135,45 @@ class PropertyReplacer(PropertyInsertor):
     def replace_u16(self, property : "ArkProperty", new_value: int):
         self.__check_property_alignment(property)
         new_value_bytes = new_value.to_bytes(2, byteorder="little")
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, new_value)
     
     def replace_16(self, property : "ArkProperty", new_value: int):
         self.__check_property_alignment(property)
         new_value_bytes = new_value.to_bytes(2, byteorder="little", signed=True)
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, new_value)
 
     def replace_u32(self, property : "ArkProperty", new_value: int):
         self.__check_property_alignment(property)
         new_value_bytes = new_value.to_bytes(4, byteorder="little")
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, new_value)
 
     def replace_u64(self, property : "ArkProperty", new_value: int):
         self.__check_property_alignment(property)
         new_value_bytes = new_value.to_bytes(8, byteorder="little")
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, new_value)
 
     def replace_float(self, property : "ArkProperty", new_value: float):
         self.__check_property_alignment(property)
         new_value_bytes = struct.pack('<f', new_value)
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, struct.unpack('<f', new_value_bytes)[0])
 
     def replace_double(self, property : "ArkProperty", new_value: float):
         self.__check_property_alignment(property)
         new_value_bytes = struct.pack('<d', new_value)
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, float(new_value))
     
     def replace_boolean(self, property : "ArkProperty", new_value: bool):
         self.__check_property_alignment(property)
         new_value_bytes = b"\x01" if new_value else b"\x00"
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, bool(new_value))
 
     def replace_byte_property(self, property : "ArkProperty", new_value: int):
         self.__check_property_alignment(property)
         new_value_bytes = new_value.to_bytes(1, byteorder="little")
-        self.replace_bytes(new_value_bytes, position=property.value_position)
+        self.__replace_value(property, new_value_bytes, new_value)
 
-    def replace_struct_property(self, property: "ArkProperty", new_value: bytes):
+    def replace_struct_property(self, property: "ArkProperty", new_value: bytes, value: Any = None):
+        # value is the struct new_value encodes, without it a tracked object has to be parsed again
         print(property)
         pos = self.__check_property_alignment(property)
         self.set_position(pos)
@@ -134,7 +191,10 @@ class PropertyReplacer(PropertyInsertor):
         if len(new_value) != data_length:
             raise ValueError(f"New value length {len(new_value)} does not match expected data length {data_length}")
         
-        self.replace_bytes(new_value, position=property.value_position)
+        if value is not None:
+            self.__replace_value(property, new_value, value)
+        else:
+            self.replace_bytes(new_value, position=property.value_position)
 
     def replace_array(self, array_name: str, property_type: str, new_items: List[bytes], position: int = None):
         if self.save_context is None:
@@ -73,6 +73,7 @@ class ArkArchive:
             except Exception as e:
                 ArkSaveLogger.error_log(f"Error reading properties for object \'{obj.class_name}\' at {self.data.get_position()}: {e}")
                 self.data.structured_print()
+                ArkSaveLogger.dump_recent_files()
                 raise e
             ArkSaveLogger.exit_struct()
 
@@ -5,7 +5,7 @@ from uuid import UUID
 from io import BytesIO
 import zlib
 
-from arkparse.parsing.struct.actor_transform import ActorTransform
+from arkparse.parsing.struct.actor_transform import ActorTransform, ActorTransformPositions, ActorTransformTable
 from arkparse.logging import ArkSaveLogger
 from ._property_parser import PropertyParser
 from ._property_replacer import PropertyReplacer
@@ -269,7 +269,7 @@ class ArkBinaryParser(PropertyParser, PropertyReplacer):
         for i in range(name_count):
             name_table[i | 0x10000000] = parser.read_string()
         parser.save_context.names = name_table
-        parser.save_context.constant_name_table = COMPRESSED_BYTES_NAME_CONSTANTS
+        parser.save_context.use_constant_name_table(COMPRESSED_BYTES_NAME_CONSTANTS)
         parser.position = 0
 
         return parser
@@ -284,19 +284,11 @@ class ArkBinaryParser(PropertyParser, PropertyReplacer):
             raise ValueError(f"Unknown value type {key_type_name} at position {position}")
         return key_type
 
-    def read_actor_transforms(self) -> tuple[Dict[UUID, ActorTransform], Dict[UUID, int]]:
-        actor_transforms: Dict[UUID, ActorTransform] = {}
-        actor_transform_positions: Dict[UUID, int] = {}
-        termination_uuid = UUID("00000000-0000-0000-0000-000000000000")
-        position = self.get_position()
-        uuid = self.read_uuid()
-
-        while uuid != termination_uuid:
-            actor_transforms[uuid] = ActorTransform(self)
-            actor_transform_positions[uuid] = position
-            uuid = self.read_uuid()
-
-        return actor_transforms, actor_transform_positions
+    def read_actor_transforms(self) -> tuple[ActorTransformTable, ActorTransformPositions]:
+        # the whole table is decoded at once, ActorTransforms are created when looked up
+        table = ActorTransformTable(self.byte_buffer, self.get_position())
+        self.set_position(table.end)
+        return table, table.positions
     
     def replace_name_ids(self, name_ids: Dict[int, str], save: "AsaSave" = None):
         # Update the template name encodings to the actal save name encodings
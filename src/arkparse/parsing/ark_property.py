@@ -1,9 +1,10 @@
 from __future__ import annotations
-from dataclasses import dataclass, field
+import hashlib
 from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, TYPE_CHECKING
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 from arkparse.logging import ArkSaveLogger
+from arkparse.utils.freezable import Freezable
 
 from arkparse.parsing.struct.ark_color import ArkColor
 from arkparse.parsing.struct.ark_int_point import ArkIntPoint
@@ -47,6 +48,7 @@ UNSUPPORTED_STRUCTS: List[str] = []
 
 if TYPE_CHECKING:
     from arkparse.parsing.ark_binary_parser import ArkBinaryParser
+    from arkparse.saves.save_context import SaveContext
 
 T = TypeVar("T")
 
@@ -55,7 +57,7 @@ T = TypeVar("T")
 # -------------------------------------------------------------------------------------------------
 
 @contextmanager
-def log_block(title: str):
+def _log_block(title: str):
     ArkSaveLogger.enter_struct(title)
     try:
         yield
@@ -63,10 +65,21 @@ def log_block(title: str):
         ArkSaveLogger.exit_struct()
 
 
+_NO_LOG_BLOCK = nullcontext()
+
+
+def log_block(title: str):
+    # skipped while parser logging is off, a block that is entered always leaves the struct path again
+    if not ArkSaveLogger.parser_enabled:
+        return _NO_LOG_BLOCK
+    return _log_block(title)
+
+
 def log_property_read(key: str, vtype: ArkValueType, start_pos: int, data_size: int, value: Any, position: int) -> None:
-    ArkSaveLogger.parser_log(
-        f"[property read: key={key}; type={vtype}; bin_pos={start_pos}; bin_size={data_size}; value={value}; index_pos={position}]"
-    )
+    if ArkSaveLogger.parser_enabled:
+        ArkSaveLogger.parser_log(
+            f"[property read: key={key}; type={vtype}; bin_pos={start_pos}; bin_size={data_size}; value={value}; index_pos={position}]"
+        )
 
 
 # -------------------------------------------------------------------------------------------------
@@ -132,24 +145,51 @@ _SIMPLE_SPECS: Dict[ArkValueType, _Spec] = {
     ArkValueType.String: _Spec(False, True, lambda bb: bb.read_string()),
 }
 
+# Payloads up to this many bytes are interned, larger values are rarely repeated
+_INTERN_MAX_SIZE = 256
+
+# Values arrays can be shared with when the save context interns values, see ArkProperty._intern
+_IMMUTABLE_VALUES = (int, float, str, bytes, type(None), Freezable)
+
+# Small value structs that are interned when the save context interns values, they are all Freezable
+_INTERNED_STRUCTS = {
+    ArkStructType.Color,
+    ArkStructType.LinearColor,
+    ArkStructType.Quat,
+    ArkStructType.Rotator,
+    ArkStructType.Vector,
+    ArkStructType.UniqueNetIdRepl,
+    ArkStructType.VectorBoolPair,
+    ArkStructType.ArkDinoAncestor,
+    ArkStructType.ArkIntPoint,
+    ArkStructType.ArkGeneTraitStruct,
+}
+
 _LOGGABLE_COMPLEX = {ArkValueType.Struct, ArkValueType.Array, ArkValueType.Map, ArkValueType.Set}
 
 
 # -------------------------------------------------------------------------------------------------
-# Dataclass
+# Property
 # -------------------------------------------------------------------------------------------------
-@dataclass
-class ArkProperty:
-    name: str
-    type: str
-    value: Any
-    position: int = field(default=0)
-    unknown_byte: Optional[int] = field(default=None, repr=False)
+def _restore_property(name, type, value, position, unknown_byte, nr_of_bytes, name_position, value_position, end_position) -> "ArkProperty":
+    # counterpart of ArkProperty.__reduce__
+    prop = ArkProperty.__new__(ArkProperty)
+    prop.name = name
+    prop.type = type
+    prop.value = value
+    prop.position = position
+    prop.unknown_byte = unknown_byte
+    prop.nr_of_bytes = nr_of_bytes
+    prop.name_position = name_position
+    prop.value_position = value_position
+    prop.end_position = end_position
+    return prop
+
 
-    nr_of_bytes: int = field(default=0, init=False)
-    name_position: int = field(default=0, init=False)
-    value_position: int = field(default=0, init=False)
-    bytes: Optional[bytes] = field(default=None, init=False, repr=False)
+class ArkProperty:
+    # Slotted, there is one instance per property of every parsed object.
+    # The encoding is not copied, name_position and end_position locate it in the blob of the object
+    __slots__ = ("name", "type", "value", "position", "unknown_byte", "nr_of_bytes", "name_position", "value_position", "end_position")
 
     def __init__(self, name: str, type: str, position: int, unknown_byte: int, value: T):
         # Keep ctor to match the original signature/behavior
@@ -161,7 +201,26 @@ class ArkProperty:
         self.nr_of_bytes = 0
         self.name_position = 0
         self.value_position = 0
-        self.bytes = None
+        self.end_position = 0
+
+    def __reduce__(self):
+        # pickled as one tuple of the slot values, much faster to load than the default state of a slotted object
+        return _restore_property, (self.name, self.type, self.value, self.position, self.unknown_byte, self.nr_of_bytes,
+                                   self.name_position, self.value_position, self.end_position)
+
+    def get_bytes(self, byte_buffer: "ArkBinaryParser") -> bytes:
+        # the raw encoding of the property, byte_buffer has to hold the blob the property was read from
+        return bytes(byte_buffer.byte_buffer[self.name_position:self.end_position])
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr in ArkProperty.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"ArkProperty(name={self.name!r}, type={self.type!r}, value={self.value!r}, position={self.position!r}, nr_of_bytes={self.nr_of_bytes!r}, name_position={self.name_position!r}, value_position={self.value_position!r})"
 
     def to_json_obj(self):
         return { "name": self.name, "type": self.type, "value": self.value.__str__() }
@@ -179,59 +238,74 @@ class ArkProperty:
         byte_buffer.save_context.generate_unknown = False
 
         if key is None or key == "None":
-            ArkSaveLogger.parser_log("Exiting struct (None marker) (pos = " + str(byte_buffer.get_position()) + " (hex: " + hex(byte_buffer.get_position()) + "))")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log("Exiting struct (None marker) (pos = " + str(byte_buffer.get_position()) + " (hex: " + hex(byte_buffer.get_position()) + "))")
             ArkSaveLogger.exit_struct()
 
             if byte_buffer.size() - byte_buffer.position >= 4 and byte_buffer.peek_int() == 0:
                 byte_buffer.skip_bytes(4)
             return None
 
-        value_type = byte_buffer.read_value_type_by_name()
+        value_type, reader = ArkProperty._read_value_type(byte_buffer)
         data_size = byte_buffer.read_int()
         position = byte_buffer.read_int()
         start_data_position = byte_buffer.get_position()
 
-        if value_type in _LOGGABLE_COMPLEX:
+        if ArkSaveLogger.parser_enabled and value_type in _LOGGABLE_COMPLEX:
             ArkSaveLogger.parser_log(
                 f"[prop={key};  type={value_type}; bin_pos={start_data_position}; size={data_size}; index_pos={position}]"
             )
 
-        # Dispatch simple/complex
-        if value_type in _SIMPLE_SPECS:
-            prop, value_position = ArkProperty._read_simple_property(key, value_type, position, byte_buffer)
-        elif value_type == ArkValueType.Byte:
-            prop, value_position = ArkProperty._read_byte_property(key, position, data_size, byte_buffer)
-        elif value_type == ArkValueType.Struct:
-            byte_buffer.set_position(byte_buffer.get_position() - 8)  # V14 fix
-            nr_of_names = byte_buffer.read_uint32()
-            struct_type = byte_buffer.read_name()
-            val, value_position = ArkProperty.read_struct_property(byte_buffer, data_size, struct_type, in_array, nr_of_names=nr_of_names)
-            prop = ArkProperty(key, value_type.name, position, 0, val)
-        elif value_type == ArkValueType.Array:
-            prop, value_position = ArkProperty.read_array_property(key, value_type.name, position, byte_buffer, data_size)
-        elif value_type == ArkValueType.Map:
-            byte_buffer.set_position(byte_buffer.get_position() - 4)
-            prop = ArkProperty.read_map_property(key, value_type.name, position, byte_buffer, data_size)
-        elif value_type == ArkValueType.Set:
-            byte_buffer.set_position(byte_buffer.get_position() - 4)
-            prop = ArkProperty.read_set_property(key, value_type.name, position, byte_buffer, data_size)
+        if reader is not None:
+            prop, value_position = reader(key, value_type, position, data_size, byte_buffer, in_array)
         else:
             print(
                 f"Unsupported property type {value_type} with data size {data_size} at position {start_data_position}"
             )
             prop = None
 
-        if value_type not in _LOGGABLE_COMPLEX and prop is not None:
+        if ArkSaveLogger.parser_enabled and value_type not in _LOGGABLE_COMPLEX and prop is not None:
             log_property_read(key, value_type, start_data_position, data_size, prop.value, position)
 
         if prop is not None:
             prop.nr_of_bytes = data_size
             prop.name_position = name_position
             prop.value_position = value_position
-            prop.bytes = byte_buffer.byte_buffer[name_position:byte_buffer.get_position()]
+            prop.end_position = byte_buffer.get_position()
 
         return prop
 
+    @staticmethod
+    def get_dispatch_table(save_context: "SaveContext") -> Dict[int, Tuple[ArkValueType, Callable[..., Tuple[Optional["ArkProperty"], int]]]]:
+        # Name id of every property type string to its value type and reader, built once per save context
+        # and dropped by the save context when its name table changes
+        table = save_context.property_readers
+        if table is None:
+            table = {}
+            # the name table takes precedence over the constant one, like in SaveContext.get_name
+            for names in [save_context.constant_name_table or {}, save_context.names]:
+                for name_id, name in names.items():
+                    value_type = ArkValueType.from_name(name)
+                    if value_type is not None:
+                        table[name_id] = (value_type, _PROPERTY_READERS.get(value_type))
+                    else:
+                        table.pop(name_id, None)
+            save_context.property_readers = table
+        return table
+
+    @staticmethod
+    def _read_value_type(bb: "ArkBinaryParser") -> Tuple[ArkValueType, Optional[Callable[..., Tuple[Optional["ArkProperty"], int]]]]:
+        if bb.save_context.has_name_table():
+            type_position = bb.get_position()
+            entry = ArkProperty.get_dispatch_table(bb.save_context).get(bb.read_uint32())
+            if entry is not None:
+                bb.skip_bytes(4)  # instance number of the name
+                return entry
+            bb.set_position(type_position)
+
+        value_type = bb.read_value_type_by_name()
+        return value_type, _PROPERTY_READERS.get(value_type)
+
     # ---------------------------------------------------------------------------------------------
     # Simple/primitive readers
     # ---------------------------------------------------------------------------------------------
@@ -271,16 +345,36 @@ class ArkProperty:
         _enum_byte_size = bb.read_byte()
         bb.validate_uint32(0)
         enum_name = bb.read_name()
-        ArkSaveLogger.parser_log(f"[ENUM: key={key}; value={ArkEnumValue(enum_name)}; start_pos={pre_read_pos}]")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"[ENUM: key={key}; value={ArkEnumValue(enum_name)}; start_pos={pre_read_pos}]")
         value_position = bb.get_position()
         return ArkProperty(key, ArkValueType.Enum, position, data_size, ArkEnumValue(enum_name)), value_position
 
     # ---------------------------------------------------------------------------------------------
     # Map/Set/Array readers
     # ---------------------------------------------------------------------------------------------
+    @staticmethod
+    def _read_struct_property_at(key: str, position: int, data_size: int, bb: "ArkBinaryParser", in_array: bool) -> Tuple["ArkProperty", int]:
+        bb.set_position(bb.get_position() - 8)  # V14 fix
+        nr_of_names = bb.read_uint32()
+        struct_type = bb.read_name()
+        val, value_position = ArkProperty.read_struct_property(bb, data_size, struct_type, in_array, nr_of_names=nr_of_names)
+        return ArkProperty(key, ArkValueType.Struct.name, position, 0, val), value_position
+
+    @staticmethod
+    def _read_map_property_at(key: str, position: int, data_size: int, bb: "ArkBinaryParser") -> Tuple["ArkProperty", int]:
+        bb.set_position(bb.get_position() - 4)
+        return ArkProperty.read_map_property(key, ArkValueType.Map.name, position, bb, data_size), 0
+
+    @staticmethod
+    def _read_set_property_at(key: str, position: int, data_size: int, bb: "ArkBinaryParser") -> Tuple["ArkProperty", int]:
+        bb.set_position(bb.get_position() - 4)
+        return ArkProperty.read_set_property(key, ArkValueType.Set.name, position, bb, data_size), 0
+
     @staticmethod
     def read_map_property(key: str, value_type_name: str, position: int, bb: "ArkBinaryParser", data_size: int) -> "ArkProperty":
-        ArkSaveLogger.parser_log(f"Reading map property {key} with value type {value_type_name} at position {position} with data size {data_size}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Reading map property {key} with value type {value_type_name} at position {position} with data size {data_size}")
         key_type = bb.read_value_type_by_name()
         struct_names = bb.read_uint32()
         map_name = "None"
@@ -293,7 +387,8 @@ class ArkProperty:
             if struct_names > 0:
                 map_name = bb.read_name()
 
-        ArkSaveLogger.parser_log(f"Map key type: {key_type}, value type: {value_type}, struct names: {struct_names}, map name: {map_name}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Map key type: {key_type}, value type: {value_type}, struct names: {struct_names}, map name: {map_name}")
 
         data_size, position, read_pos, _ = ArkProperty.__read_struct_header(bb, 0, in_map=True, nr_of_struct_names=struct_names)
         start_of_data = bb.get_position() - 4
@@ -301,13 +396,16 @@ class ArkProperty:
         is_end_m4 = bb.position + data_size - 4 >= bb.size()
 
         if (not is_end and bb.peek_name(data_size) != "") and (bb.peek_name() != "" or (not is_end_m4 and bb.peek_name(data_size-4) != "")):
-            ArkSaveLogger.parser_log(f"Restoring position to {start_of_data} for MapStruct")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"Restoring position to {start_of_data} for MapStruct")
             bb.set_position(bb.position - 4)
 
-        ArkSaveLogger.parser_log(f"Current position after map header: {bb.get_position()}, data size: {data_size}, expected end: {start_of_data + data_size}, buffer size: {bb.size()}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Current position after map header: {bb.get_position()}, data size: {data_size}, expected end: {start_of_data + data_size}, buffer size: {bb.size()}")
 
         map_items = bb.read_uint32()
-        ArkSaveLogger.parser_log(f"Map has {map_items} items")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Map has {map_items} items")
 
         if key_type == ArkValueType.Struct:
             ArkSaveLogger.warning_log( f"Map with key type {key_type} is currently not supported, skipping map prop")
@@ -325,7 +423,8 @@ class ArkProperty:
                     map_value = ArkProperty.read_property_value(value_type, bb)
                     entry = ArkProperty(f"{map_key}", value_type.name, 0, 0, map_value)
                     entries.append(entry)
-                    ArkSaveLogger.parser_log(f"Map entry: {map_key} -> {map_value}")
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(f"Map entry: {map_key} -> {map_value}")
                 else:
                     ArkSaveLogger.error_log(f"Unsupported map value type {value_type} in map {key}")
                     raise RuntimeError(f"Unsupported map value type {value_type} in map {key}")
@@ -364,8 +463,9 @@ class ArkProperty:
         if start_of_data + data_size != bb.get_position():
             print("Set read incorrectly, bytes left to read, expected:", start_of_data + data_size - bb.get_position())
 
-        ArkSaveLogger.parser_log(f"Read set property {key} with {count} values of type {value_type_name}")
-        ArkSaveLogger.parser_log(f"Set values: {values}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Read set property {key} with {count} values of type {value_type_name}")
+            ArkSaveLogger.parser_log(f"Set values: {values}")
 
         prop = ArkProperty(key, value_type_name, position, 0, ArkSet(value_type, values))
     
@@ -398,7 +498,8 @@ class ArkProperty:
 
             is_end = bb.position + data_size - 4 > bb.size()
             if bb.peek_name() != "" or (not is_end and bb.peek_name(data_size-4) != ""):
-                ArkSaveLogger.parser_log(f"Restoring position to {data_start_position} for StructProperty")
+                if ArkSaveLogger.parser_enabled:
+                    ArkSaveLogger.parser_log(f"Restoring position to {data_start_position} for StructProperty")
                 bb.set_position(bb.position - 4)
 
             array_items = bb.read_uint32()
@@ -407,9 +508,10 @@ class ArkProperty:
             #     ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.PARSER, True)
 
             with log_block(f"Arr({array_content_type})"):
-                ArkSaveLogger.parser_log(
-                    f"[STRUCT ARRAY: key='none'; nr_of_value={array_items}; type={array_content_type}; bin_length={data_size}]"
-                )
+                if ArkSaveLogger.parser_enabled:
+                    ArkSaveLogger.parser_log(
+                        f"[STRUCT ARRAY: key='none'; nr_of_value={array_items}; type={array_content_type}; bin_length={data_size}]"
+                    )
                 struct_array = [
                     ArkProperty.read_struct_property(bb, data_size, array_content_type, True)[0]
                     for _ in range(array_items)
@@ -432,9 +534,10 @@ class ArkProperty:
 
         # Value array branch
         with log_block(f"Arr({array_type})"):
-            ArkSaveLogger.parser_log(
-                f"[VALUE ARRAY: key={key}; nr_of_values={array_length}; type={array_type}]"
-            )
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(
+                    f"[VALUE ARRAY: key={key}; nr_of_values={array_length}; type={array_type}]"
+                )
 
             if key == "MyPersistentBuffDatas":
                 value, _ = ArkProperty.read_struct_property(bb, array_length, key, True)
@@ -448,16 +551,18 @@ class ArkProperty:
                     else:
                         values.append(ArkProperty.read_property_value(ArkValueType.from_name(array_type), bb))
 
-                if array_type != "ByteProperty":
+                if ArkSaveLogger.parser_enabled and array_type != "ByteProperty":
                     for i, v in enumerate(values):
                         ArkSaveLogger.parser_log(f"value {i}: {v}")
-                else:
+                elif ArkSaveLogger.parser_enabled:
                     ArkSaveLogger.parser_log(f"Array value: {values}")
 
+                values = ArkProperty._intern(bb, array_type, start_values_pos, values)
                 prop = ArkProperty(key, type_, position, end_of_struct, values)
                 
 
-        ArkSaveLogger.parser_log(f"============ END Arr({array_type}) ============")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"============ END Arr({array_type}) ============")
         return prop, start_values_pos
 
     # ---------------------------------------------------------------------------------------------
@@ -471,10 +576,12 @@ class ArkProperty:
             if nr_of_struct_names > 10:
                 ArkSaveLogger.warning_log(f"Too many struct names: {nr_of_struct_names}; reverting to reading one name")
                 nr_of_struct_names = 1
-            ArkSaveLogger.parser_log(f"reading {nr_of_struct_names} names")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"reading {nr_of_struct_names} names")
             for i in range(nr_of_struct_names):
                 _new_name = bb.read_name()
-                ArkSaveLogger.parser_log(f"name {i}: {_new_name}")
+                if ArkSaveLogger.parser_enabled:
+                    ArkSaveLogger.parser_log(f"name {i}: {_new_name}")
                 bb.validate_uint32(0)
             data_size = bb.read_uint32()
             size_byte = bb.read_byte()  # V14 unknown byte
@@ -487,7 +594,8 @@ class ArkProperty:
             if read_pos:
                 position = bb.read_uint32()
 
-            ArkSaveLogger.parser_log(f"pos byte={size_byte}, pos read={read_pos}, position={position}, data size={data_size}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"pos byte={size_byte}, pos read={read_pos}, position={position}, data size={data_size}")
 
         return data_size, position, read_pos, size_byte
 
@@ -499,7 +607,8 @@ class ArkProperty:
                 value_position = bb.get_position()
                 return ArkProperty._read_struct_body(bb, data_size, struct_type, in_array), value_position
         else:
-            ArkSaveLogger.parser_log(f"Reading struct property {struct_type} with data size {data_size}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"Reading struct property {struct_type} with data size {data_size}")
             value_position = bb.get_position()
             return ArkProperty._read_struct_body(bb, data_size, struct_type, in_array), value_position
 
@@ -512,11 +621,17 @@ class ArkProperty:
                 ArkSaveLogger.parser_log("Exiting struct (None marker)")
                 return bb.read_name()
             if data_size <= 4:
-                ArkSaveLogger.parser_log(f"Reading struct {struct_type} as primitive value")
+                if ArkSaveLogger.parser_enabled:
+                    ArkSaveLogger.parser_log(f"Reading struct {struct_type} as primitive value")
                 return None
             if ark_struct_type in _STRUCT_READERS:
-                ArkSaveLogger.parser_log(f"Reading struct {struct_type} with data size {data_size}")
-                return _STRUCT_READERS[ark_struct_type](bb, data_size)
+                if ArkSaveLogger.parser_enabled:
+                    ArkSaveLogger.parser_log(f"Reading struct {struct_type} with data size {data_size}")
+                start = bb.get_position()
+                value = _STRUCT_READERS[ark_struct_type](bb, data_size)
+                if ark_struct_type in _INTERNED_STRUCTS:
+                    value = ArkProperty._intern(bb, struct_type, start, value)
+                return value
             if in_array:
                 if struct_type not in UNSUPPORTED_STRUCTS:
                     ArkSaveLogger.warning_log(f"Unsupported struct type {struct_type} in array")
@@ -530,7 +645,8 @@ class ArkProperty:
                 # ArkSaveLogger.open_hex_view(True)
                 # raise ValueError(f"Unsupported struct type {struct_type}")
 
-        ArkSaveLogger.parser_log(f"Reading struct {struct_type} with data size {data_size} as property list at position {bb.get_position()}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Reading struct {struct_type} with data size {data_size} as property list at position {bb.get_position()}")
         # Fallback: struct as property list
         position = bb.get_position()
         props = ArkProperty.read_struct_properties(bb)
@@ -547,21 +663,24 @@ class ArkProperty:
         props: List[ArkProperty] = []
         struct_property = ArkProperty.read_property(bb)
         if struct_property is not None:
-            ArkSaveLogger.parser_log(
-                f"Struct properties: {struct_property.name} {struct_property.type} {struct_property.value}"
-            )
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(
+                    f"Struct properties: {struct_property.name} {struct_property.type} {struct_property.value}"
+                )
         while struct_property:
             props.append(struct_property)
             if bb.has_more():
                 struct_property = ArkProperty.read_property(bb)
                 if struct_property is not None:
-                    ArkSaveLogger.parser_log(
-                        f"Struct properties: {struct_property.name} {struct_property.type} {struct_property.value}"
-                    )
+                    if ArkSaveLogger.parser_enabled:
+                        ArkSaveLogger.parser_log(
+                            f"Struct properties: {struct_property.name} {struct_property.type} {struct_property.value}"
+                        )
             else:
                 break
 
-        ArkSaveLogger.parser_log(f"Read {len(props)} struct properties")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Read {len(props)} struct properties")
         return ArkPropertyContainer(props)
 
     # ---------------------------------------------------------------------------------------------
@@ -586,14 +705,53 @@ class ArkProperty:
                 obj_name = bb.read_name()
                 names.append(obj_name)
             bb.validate_bytes_as_string("00 00 00 00", 4)
-            ArkSaveLogger.parser_log(f"Read soft object property {names}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"Read soft object property {names}")
             return names
 
+    @staticmethod
+    def _intern(bb: "ArkBinaryParser", type_name: str, start: int, value: Any) -> Any:
+        # Values read from identical bytes are replaced by the first value read from them, so a save kept in memory
+        # holds one object per distinct value. Only done when the save context has an interned_values table, for
+        # payloads up to _INTERN_MAX_SIZE bytes. Shared values can not be modified: structs are frozen, and arrays
+        # are interned as tuples, only when all of their values are immutable or can be frozen
+        interned = bb.save_context.interned_values
+        end = bb.get_position()
+        if interned is None or end - start > _INTERN_MAX_SIZE:
+            return value
+        if isinstance(value, list):
+            if not all(isinstance(v, _IMMUTABLE_VALUES) for v in value):
+                return value
+            value = tuple(value)
+        digest = hashlib.blake2b(bb.byte_buffer[start:end], digest_size=16).digest()
+        shared = interned.setdefault((type_name, digest), value)
+        if shared is value:
+            for v in (value if isinstance(value, tuple) else (value,)):
+                if isinstance(v, Freezable):
+                    v.freeze()
+        return shared
+
     @staticmethod
     def _fixup_if_left(bb: "ArkBinaryParser", start: int, size: int, label: str) -> None:
         if bb.get_position() != start + size:
             remaining = bb.read_bytes(start + size - bb.get_position())
-            ArkSaveLogger.parser_log(f"{label} read incorrectly, bytes left to read: {remaining}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"{label} read incorrectly, bytes left to read: {remaining}")
 
     def __str__(self):
         return f"ArkProperty(name={self.name}, type={self.type}, value={self.value})"
+
+
+# Reader of every property type, called as reader(key, value_type, position, data_size, byte_buffer, in_array)
+# and returning the property and the position of its value
+_PROPERTY_READERS: Dict[ArkValueType, Callable[..., Tuple[Optional[ArkProperty], int]]] = {
+    **{
+        value_type: lambda key, vt, position, data_size, bb, in_array: ArkProperty._read_simple_property(key, vt, position, bb)
+        for value_type in _SIMPLE_SPECS
+    },
+    ArkValueType.Byte: lambda key, vt, position, data_size, bb, in_array: ArkProperty._read_byte_property(key, position, data_size, bb),
+    ArkValueType.Struct: lambda key, vt, position, data_size, bb, in_array: ArkProperty._read_struct_property_at(key, position, data_size, bb, in_array),
+    ArkValueType.Array: lambda key, vt, position, data_size, bb, in_array: ArkProperty.read_array_property(key, vt.name, position, bb, data_size),
+    ArkValueType.Map: lambda key, vt, position, data_size, bb, in_array: ArkProperty._read_map_property_at(key, position, data_size, bb),
+    ArkValueType.Set: lambda key, vt, position, data_size, bb, in_array: ArkProperty._read_set_property_at(key, position, data_size, bb),
+}
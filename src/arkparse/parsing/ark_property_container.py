@@ -67,22 +67,48 @@ class ArkPropertyContainer:
                 property: ArkProperty = property
                 ArkSaveLogger.info_log(f"Property ({property.type}) ({property.position}): {property.name} = {property.value}")
 
+    def _get_property_index(self) -> Dict[str, List[int]]:
+        # name -> indices (in order) of the top level properties that have that name or contain it in their nested properties.
+        # Rebuilt when the property list is replaced or grows, lookups then only visit the candidates
+        properties = self.properties
+        if getattr(self, "_indexed_list", None) is not properties or self._indexed_length != len(properties):
+            index: Dict[str, List[int]] = {}
+            for i, property in enumerate(properties):
+                names = {property.name}
+                if isinstance(property.value, ArkPropertyContainer):
+                    names.update(property.value.property_names)
+                for name in names:
+                    index.setdefault(name, []).append(i)
+            self._property_index = index
+            self._indexed_list = properties
+            self._indexed_length = len(properties)
+        return self._property_index
+
     def has_property(self, name: str) -> bool:
-        return any(property.name == name for property in self.properties)
+        properties = self.properties
+        return any(properties[i].name == name for i in self._get_property_index().get(name, ()))
 
     def find_property(self, name: str, position: int = None) -> Optional['ArkProperty[T]']:
-        for property in self.properties:
-            if property.name == name and (position is None or property.position == position):
-                return property
-            elif isinstance(property.value, ArkPropertyContainer):
-                sub_property = property.value.find_property(name, position)
-                if sub_property:
-                    return sub_property
+        properties = self.properties
+        for i in self._get_property_index().get(name, ()):
+            match = ArkPropertyContainer._match_property(properties[i], name, position)
+            if match:
+                return match
+        return None
+
+    @staticmethod
+    def _match_property(property: 'ArkProperty', name: str, position: int = None) -> Optional['ArkProperty[T]']:
+        # the property itself if it matches, else the first match in its nested properties
+        if property.name == name and (position is None or property.position == position):
+            return property
+        elif isinstance(property.value, ArkPropertyContainer):
+            return property.value.find_property(name, position)
         return None
     
     def find_all_properties_of_name(self, name: str) -> List['ArkProperty[T]']:
         props = []
-        for property in self.properties:
+        properties = self.properties
+        for property in (properties[i] for i in self._get_property_index().get(name, ())):
             if property.name == name:
                 props.append(property)
             elif isinstance(property.value, ArkPropertyContainer):
@@ -93,7 +119,8 @@ class ArkPropertyContainer:
         return props
 
     def find_property_by_position(self, name: str, position: int) -> Optional['ArkProperty[T]']:
-        for property in self.properties:
+        properties = self.properties
+        for property in (properties[i] for i in self._get_property_index().get(name, ())):
             if property.name == name and property.position == position:
                 return property
         return None
@@ -116,6 +143,23 @@ class ArkPropertyContainer:
                 found = True
         return properties
 
+    def shift_positions(self, after: int, delta: int) -> None:
+        # moves the offsets that lie behind position after by delta, for edits that change the size of a value
+        for property in self.properties:
+            if 0 < property.end_position <= after:
+                continue
+            if property.name_position > after:
+                property.name_position += delta
+            if property.value_position > after:
+                property.value_position += delta
+            if property.end_position > after:
+                property.end_position += delta
+
+            values = property.value if isinstance(property.value, (list, tuple)) else [property.value]
+            for value in values:
+                if isinstance(value, ArkPropertyContainer):
+                    value.shift_positions(after, delta)
+
     def get_property_value(self, name: str, default = None, position: int = None) -> Optional[T]:
         property = self.find_property(name, position)
         return property.value if property else default
@@ -126,7 +170,8 @@ class ArkPropertyContainer:
 
     def get_array_property_value(self, name: str, default = None) -> Optional[List[T]]:
         value = self.get_property_value(name, [])
-        return value if isinstance(value, list) else default
+        # interned arrays are tuples
+        return value if isinstance(value, (list, tuple)) else default
 
     def get_properties(self) -> List['ArkProperty[T]']:
         return [f"{property.name}({property.type})" for property in self.properties]
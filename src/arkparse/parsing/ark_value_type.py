@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Type, Optional, Any
+from typing import Dict, Type, Optional, Any
 from decimal import Decimal
 from arkparse.enums.ark_enum import ArkEnumValue
 from .ark_set import ArkSet
@@ -36,13 +36,12 @@ class ArkValueType(Enum):
 
     @classmethod
     def from_name(cls, name: str) -> Optional["ArkValueType"]:
-        for item in cls:
-            if item._type_name == name:
-                return item
-        return None
+        return _VALUE_TYPES_BY_NAME.get(name)
 
     def get_property_type(self) -> Type[Any]:
         return self._clazz
+
+_VALUE_TYPES_BY_NAME: Dict[str, ArkValueType] = {item.type_name: item for item in ArkValueType}
     
 
 def get_bytes_for_value(value_type: ArkValueType, value: Any) -> bytes:
@@ -9,3 +9,5 @@ class GameObjectReaderConfiguration:
     uuid_filter: Optional[Callable[[UUID], bool]] = None
     blueprint_name_filter: Optional[Callable[[Optional[str]], bool]] = None
     property_names: List[str] = field(default_factory=list)
+    # Only decode the properties of an object when they are first accessed, see LazyArkGameObject
+    lazy_properties: bool = False
@@ -1,5 +1,5 @@
 """Gather misc game object imports"""
-from .actor_transform import ActorTransform, MapCoords, MapCoordinateParameters
+from .actor_transform import ActorTransform, ActorTransformTable, MapCoords, MapCoordinateParameters, SpatialIndex
 from .ark_color import ArkColor
 from .ark_item_net_id import ArkItemNetId
 from .ark_linear_color import ArkLinearColor
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 import struct
 from pathlib import Path
@@ -13,6 +13,16 @@ from arkparse.enums.ark_map import ArkMap
 from .ark_vector import ArkVector
 from .ark_rotator import ArkRotator
 
+# location, rotation and an unknown uint64, as stored in the ActorTransforms table
+ACTOR_TRANSFORM = struct.Struct('<6dQ')
+# one row of the ActorTransforms table, uuid_words overlaps the uuid to find the terminating zero uuid
+ACTOR_TRANSFORM_ROW = np.dtype({
+    "names": ["uuid", "uuid_words", "x", "y", "z", "pitch", "yaw", "roll", "unknown"],
+    "formats": ["V16", ("<u8", 2), "<f8", "<f8", "<f8", "<f8", "<f8", "<f8", "<u8"],
+    "offsets": [0, 0, 16, 24, 32, 40, 48, 56, 64],
+    "itemsize": 72,
+})
+
 
 FOUNDATION_DISTANCE = 300  # 300 units in ark is 1 foundation
 
@@ -195,6 +205,18 @@ class MapCoordinateParameters:
 
         # 2 digits after the comma
         return round(lat, 2), round(lo, 2)
+
+    def transform_to_array(self, xs, ys) -> Tuple[np.ndarray, np.ndarray]:
+        # transform_to for arrays of positions at once, returns the lat and long arrays.
+        # np.round can differ from round() in the last digit for values right between two hundredths
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        lat_ratio = (ys - self.origin_max_y) / (self.origin_min_y - self.origin_max_y)
+        lo_ratio = (xs - self.origin_max_x) / (self.origin_min_x - self.origin_max_x)
+        lat = (1 - lat_ratio) * 100.0 + lat_ratio * 0.0
+        lo = (1 - lo_ratio) * 100.0 + lo_ratio * 0.0
+
+        return np.round(lat, 2), np.round(lo, 2)
     
     def transform_from(self, lat: float, lo: float) -> ArkVector:
         origin_y_diff = self.origin_min_y - self.origin_max_y
@@ -208,6 +230,15 @@ class MapCoordinateParameters:
 
         return ArkVector(x=x, y=y, z=0)
 
+    @staticmethod
+    def for_map(map: ArkMap) -> "MapCoordinateParameters":
+        # shared instance per map, so the parameters are only looked up once
+        params = _MAP_COORDINATE_PARAMETERS.get(map)
+        if params is None:
+            params = MapCoordinateParameters(map)
+            _MAP_COORDINATE_PARAMETERS[map] = params
+        return params
+
     @staticmethod
     def lerp(a: float, b: float, t: float) -> float:
         """Linear interpolate on the scale given by a to b, using t as the point on that scale."""
@@ -232,6 +263,8 @@ class MapCoordinateParameters:
 
         return latitude_scale, latitude_shift, longitude_scale, longitude_shift
 
+_MAP_COORDINATE_PARAMETERS: Dict[ArkMap, MapCoordinateParameters] = {}
+
 class MapCoords:
     lat : float
     long : float
@@ -266,7 +299,7 @@ class MapCoords:
 
     def as_actor_transform(self, map) -> "ActorTransform":
 
-        return ActorTransform(vector=MapCoordinateParameters(map).transform_from(self.lat, self.long))
+        return ActorTransform(vector=MapCoordinateParameters.for_map(map).transform_from(self.lat, self.long))
 
 @dataclass
 class ActorTransform:
@@ -283,13 +316,7 @@ class ActorTransform:
     def __init__(self, reader: "ArkBinaryParser" = None, vector: ArkVector = None, rotator: ArkRotator = None, from_json: Path = None):
         if reader:
             # Initialize from ArkBinaryParser
-            self.x = reader.read_double()
-            self.y = reader.read_double()
-            self.z = reader.read_double()
-            self.pitch = reader.read_double()
-            self.yaw = reader.read_double()
-            self.roll = reader.read_double()
-            self.unknown = reader.read_uint64()
+            self.x, self.y, self.z, self.pitch, self.yaw, self.roll, self.unknown = reader.read_struct(ACTOR_TRANSFORM)
         elif vector:
             # Initialize from ArkVector and ArkRotator
             self.x = vector.x
@@ -329,8 +356,16 @@ class ActorTransform:
         return f"({self.x:.2f}, {self.y:.2f}, {self.z:.2f}) ({self.pitch:.2f}, {self.yaw:.2f}, {self.roll:.2f})"
 
     def as_map_coords(self, map) -> MapCoords:
-        lat, long = MapCoordinateParameters(map).transform_to(self.x, self.y)
+        lat, long = MapCoordinateParameters.for_map(map).transform_to(self.x, self.y)
         return MapCoords(lat, long, self.in_cryopod)
+
+    @staticmethod
+    def as_map_coord_arrays(transforms: Iterable[Optional["ActorTransform"]], map: ArkMap) -> Tuple[np.ndarray, np.ndarray]:
+        # lat and long arrays for a collection of transforms, NaN where a transform is None
+        transforms = list(transforms)
+        xs = np.array([np.nan if t is None else t.x for t in transforms], dtype=np.float64)
+        ys = np.array([np.nan if t is None else t.y for t in transforms], dtype=np.float64)
+        return MapCoordinateParameters.for_map(map).transform_to_array(xs, ys)
     
     def is_within_distance(self, location: "ActorTransform", distance: float = None, foundations: int = None, tolerance: int = 10) -> bool:
         if self.in_cryopod or location.in_cryopod:
@@ -402,3 +437,237 @@ class ActorTransform:
         loc_path = folder / ("loc_" + str(name) + ".json")
         with open(loc_path, "w") as f:
             f.write(json.dumps(self.as_json(), indent=4))
+
+
+class ActorTransformTable(MutableMapping):
+    """
+    uuid -> ActorTransform over the ActorTransforms table, decoded in one go into a NumPy structured array.
+    ActorTransform objects are only created when requested and then kept, so changes to them stick.
+    The columns (rows, x, y, z, ...) can be used directly for bulk computations.
+    """
+
+    def __init__(self, data: bytes, offset: int = 0):
+        count = max(0, len(data) - offset) // ACTOR_TRANSFORM_ROW.itemsize
+        rows = np.frombuffer(data, dtype=ACTOR_TRANSFORM_ROW, count=count, offset=offset)
+        words = rows["uuid_words"]
+        terminators = np.flatnonzero((words[:, 0] == 0) & (words[:, 1] == 0))
+        if len(terminators) > 0:
+            count = int(terminators[0])
+        else:
+            # the terminating uuid does not fit a full row when it is at the end of the data
+            end = offset + count * ACTOR_TRANSFORM_ROW.itemsize
+            if data[end:end + 16] != bytes(16):
+                raise ValueError(f"ActorTransforms table has no terminating uuid after {count} entries")
+
+        self.rows = rows[:count]
+        self.offset = offset
+        self.end = offset + count * ACTOR_TRANSFORM_ROW.itemsize + 16
+        self._index: Dict[bytes, int] = dict(zip(self.rows["uuid"].tolist(), range(count)))
+        self._transforms: Dict[bytes, ActorTransform] = {}
+        # set afterwards, not in the table
+        self._added: Dict[bytes, None] = {}
+        self._spatial_index: Optional[SpatialIndex] = None
+
+    def get_row(self, uuid: UUID) -> Optional[int]:
+        return self._index.get(uuid.bytes)
+
+    def __getitem__(self, uuid: UUID) -> ActorTransform:
+        key = uuid.bytes
+        transform = self._transforms.get(key)
+        if transform is None:
+            row = self._index[key]
+            transform = ActorTransform()
+            _, _, transform.x, transform.y, transform.z, transform.pitch, transform.yaw, transform.roll, transform.unknown = self.rows[row].tolist()
+            self._transforms[key] = transform
+        return transform
+
+    def get(self, uuid: UUID, default=None):
+        try:
+            return self[uuid]
+        except (KeyError, AttributeError):
+            return default
+
+    def __contains__(self, uuid) -> bool:
+        key = getattr(uuid, "bytes", None)
+        return key in self._index or key in self._added
+
+    def __setitem__(self, uuid: UUID, transform: ActorTransform):
+        key = uuid.bytes
+        if key not in self._index:
+            self._added[key] = None
+        self._transforms[key] = transform
+        self._spatial_index = None
+
+    def __delitem__(self, uuid: UUID):
+        key = uuid.bytes
+        if key not in self._index and key not in self._added:
+            raise KeyError(uuid)
+        self._index.pop(key, None)
+        self._added.pop(key, None)
+        self._transforms.pop(key, None)
+        self._spatial_index = None
+
+    def __iter__(self) -> Iterator[UUID]:
+        for key in self._index:
+            yield UUID(bytes=key)
+        for key in self._added:
+            yield UUID(bytes=key)
+
+    def __len__(self) -> int:
+        return len(self._index) + len(self._added)
+
+    @property
+    def positions(self) -> "ActorTransformPositions":
+        return ActorTransformPositions(self)
+
+    @property
+    def spatial_index(self) -> "SpatialIndex":
+        # built on first use, call invalidate_spatial_index after moving transforms
+        if self._spatial_index is None:
+            xs = self.rows["x"].copy()
+            ys = self.rows["y"].copy()
+            if len(self._index) != len(self.rows):
+                removed = np.ones(len(self.rows), dtype=bool)
+                removed[np.fromiter(self._index.values(), dtype=np.intp, count=len(self._index))] = False
+                xs[removed] = np.nan
+                ys[removed] = np.nan
+
+            # transforms that were handed out can have been moved since the table was read
+            for key, transform in self._transforms.items():
+                row = self._index.get(key)
+                if row is not None:
+                    xs[row] = transform.x
+                    ys[row] = transform.y
+
+            keys = self.rows["uuid"].tolist()
+            added = [key for key in self._added if key in self._transforms]
+            if added:
+                keys += added
+                xs = np.concatenate([xs, [self._transforms[key].x for key in added]])
+                ys = np.concatenate([ys, [self._transforms[key].y for key in added]])
+            self._spatial_index = SpatialIndex(keys, xs, ys)
+        return self._spatial_index
+
+    def invalidate_spatial_index(self):
+        self._spatial_index = None
+
+
+class ActorTransformPositions(Mapping):
+    # uuid -> position of its entry in the ActorTransforms table
+    def __init__(self, table: ActorTransformTable):
+        self.table = table
+
+    def __getitem__(self, uuid: UUID) -> int:
+        row = self.table.get_row(uuid)
+        if row is None:
+            raise KeyError(uuid)
+        return self.table.offset + row * ACTOR_TRANSFORM_ROW.itemsize
+
+    def __iter__(self) -> Iterator[UUID]:
+        for key in self.table._index:
+            yield UUID(bytes=key)
+
+    def __len__(self) -> int:
+        return len(self.table._index)
+
+
+class SpatialIndex:
+    """
+    Uniform grid over world x/y positions for bounding box and radius queries.
+    Points are sorted by grid cell, so a query only looks at the points in the cells that overlap it.
+    Queries return candidate uuids, without any objects having to be parsed.
+    """
+
+    def __init__(self, keys: Sequence[bytes], xs, ys, cell_size: float = 5000.0):
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        valid = np.flatnonzero(np.isfinite(xs) & np.isfinite(ys))
+
+        self.cell_size = cell_size
+        self._keys = keys
+        cell_x = np.floor(xs[valid] / cell_size).astype(np.int64)
+        cell_y = np.floor(ys[valid] / cell_size).astype(np.int64)
+        self._min_cell_x = int(cell_x.min()) if len(valid) else 0
+        self._min_cell_y = int(cell_y.min()) if len(valid) else 0
+        self._width = int(cell_x.max()) - self._min_cell_x + 1 if len(valid) else 0
+        self._height = int(cell_y.max()) - self._min_cell_y + 1 if len(valid) else 0
+
+        cells = (cell_x - self._min_cell_x) * self._height + (cell_y - self._min_cell_y)
+        order = np.argsort(cells, kind="stable")
+        self._cells = cells[order]
+        self._points = valid[order]
+        self.x = xs[self._points]
+        self.y = ys[self._points]
+        self._positions: Optional[Dict[bytes, int]] = None
+
+    @staticmethod
+    def from_transforms(transforms: Dict[UUID, ActorTransform], cell_size: float = 5000.0) -> "SpatialIndex":
+        located = [(key, transform) for key, transform in transforms.items() if transform is not None and not transform.in_cryopod]
+        return SpatialIndex([key.bytes for key, _ in located],
+                            [transform.x for _, transform in located],
+                            [transform.y for _, transform in located],
+                            cell_size)
+
+    def __len__(self) -> int:
+        return len(self._points)
+
+    def __query_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> np.ndarray:
+        # positions in the sorted points of everything inside the box
+        if len(self._points) == 0:
+            return np.empty(0, dtype=np.intp)
+
+        first_x = max(int(np.floor(min_x / self.cell_size)) - self._min_cell_x, 0)
+        last_x = min(int(np.floor(max_x / self.cell_size)) - self._min_cell_x, self._width - 1)
+        first_y = max(int(np.floor(min_y / self.cell_size)) - self._min_cell_y, 0)
+        last_y = min(int(np.floor(max_y / self.cell_size)) - self._min_cell_y, self._height - 1)
+        if first_x > last_x or first_y > last_y:
+            return np.empty(0, dtype=np.intp)
+
+        # the cells of one grid column are consecutive in the sorted points
+        columns = np.arange(first_x, last_x + 1, dtype=np.int64) * self._height
+        starts = np.searchsorted(self._cells, columns + first_y, side="left")
+        ends = np.searchsorted(self._cells, columns + last_y, side="right")
+        ranges = [np.arange(start, end) for start, end in zip(starts.tolist(), ends.tolist()) if end > start]
+        if not ranges:
+            return np.empty(0, dtype=np.intp)
+        found = np.concatenate(ranges)
+
+        x = self.x[found]
+        y = self.y[found]
+        return found[(x >= min_x) & (x <= max_x) & (y >= min_y) & (y <= max_y)]
+
+    def __to_uuids(self, found: np.ndarray) -> List[UUID]:
+        keys = self._keys
+        return [UUID(bytes=keys[point]) for point in self._points[found].tolist()]
+
+    def get_position(self, uuid: UUID) -> Optional[Tuple[float, float]]:
+        # x/y the uuid is indexed at, None if it is not in the index
+        if self._positions is None:
+            keys = self._keys
+            self._positions = {keys[point]: found for found, point in enumerate(self._points.tolist())}
+        found = self._positions.get(uuid.bytes)
+        if found is None:
+            return None
+        return float(self.x[found]), float(self.y[found])
+
+    def is_indexed_at(self, uuid: UUID, transform: Optional[ActorTransform]) -> bool:
+        # False when the transform was moved without the index being rebuilt
+        return transform is not None and self.get_position(uuid) == (transform.x, transform.y)
+
+    def query_box(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List[UUID]:
+        return self.__to_uuids(self.__query_box(min_x, min_y, max_x, max_y))
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[UUID]:
+        found = self.__query_box(x - radius, y - radius, x + radius, y + radius)
+        dx = self.x[found] - x
+        dy = self.y[found] - y
+        return self.__to_uuids(found[dx * dx + dy * dy <= radius * radius])
+
+    def query_map_coords(self, map: ArkMap, coords: MapCoords, tolerance: float = 0.1) -> List[UUID]:
+        # Superset of the transforms for which is_at_map_coordinate(map, coords, tolerance) holds,
+        # map coordinates are rounded to 2 digits so the box is made slightly bigger
+        params = MapCoordinateParameters.for_map(map)
+        margin = tolerance + 0.01
+        low = params.transform_from(coords.lat - margin, coords.long - margin)
+        high = params.transform_from(coords.lat + margin, coords.long + margin)
+        return self.query_box(min(low.x, high.x), min(low.y, high.y), max(low.x, high.x), max(low.y, high.y))
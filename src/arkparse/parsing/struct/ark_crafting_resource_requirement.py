@@ -17,7 +17,8 @@ class ArkCraftingResourceRequirement:
         self.require_exact_type = ark_binary_data.parse_boolean_property("bCraftingRequireExactResourceType")
         ark_binary_data.validate_name("None")
 
-        ArkSaveLogger.parser_log(f"ArkCraftingResourceRequirement: {self.base_requirement}, {self.resource_type}, {self.require_exact_type}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"ArkCraftingResourceRequirement: {self.base_requirement}, {self.resource_type}, {self.require_exact_type}")
 
     def __read_type(self, ark_binary_data: "ArkBinaryParser"):
         ark_binary_data.validate_name("ResourceItemType")
@@ -51,7 +51,8 @@ class ArkCustomItemData:
 
         total_size = self.__read_header(ark_binary_data)
         data_start = ark_binary_data.position
-        ArkSaveLogger.parser_log(f"Reading CustomItemData at position {data_start}, expected size: {total_size} bytes")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Reading CustomItemData at position {data_start}, expected size: {total_size} bytes")
         self.byte_arrays = []
         self._read_arrays(ark_binary_data)
 
@@ -94,17 +95,18 @@ class ArkCustomItemData:
 
         ark_binary_data.validate_name("None")        
 
-        ArkSaveLogger.parser_log(f"CustomItemData of type {self.custom_data_name} read successfully, total size: {total_size} bytes")
-        for string in self.strings:
-            ArkSaveLogger.parser_log(f"String: {string}")
-        for obj in self.objects:
-            ArkSaveLogger.parser_log(f"Object: {obj}")
-        for double in self.doubles:
-            ArkSaveLogger.parser_log(f"Double: {double}")
-        for float_value in self.floats:
-            ArkSaveLogger.parser_log(f"Float: {float_value}")
-        for name in self.names:
-            ArkSaveLogger.parser_log(f"Name: {name}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"CustomItemData of type {self.custom_data_name} read successfully, total size: {total_size} bytes")
+            for string in self.strings:
+                ArkSaveLogger.parser_log(f"String: {string}")
+            for obj in self.objects:
+                ArkSaveLogger.parser_log(f"Object: {obj}")
+            for double in self.doubles:
+                ArkSaveLogger.parser_log(f"Double: {double}")
+            for float_value in self.floats:
+                ArkSaveLogger.parser_log(f"Float: {float_value}")
+            for name in self.names:
+                ArkSaveLogger.parser_log(f"Name: {name}")
             
         ark_binary_data.save_context.generate_unknown = False
 
@@ -126,7 +128,8 @@ class ArkCustomItemData:
 
     def __read_header(self, ark_binary_data: "ArkBinaryParser"):
         total_size = self.__read_struct_start(ark_binary_data, "CustomDataBytes", "CustomItemByteArrays")
-        ArkSaveLogger.parser_log(f"CustomItemData total size: {total_size} bytes")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"CustomItemData total size: {total_size} bytes")
 
         return total_size
     
@@ -180,7 +183,7 @@ class ArkCustomItemData:
         ark_binary_data.validate_byte(0)
         nr_of_values = ark_binary_data.read_uint32()
 
-        doubles = [ark_binary_data.read_double() for _ in range(nr_of_values)]
+        doubles = list(ark_binary_data.read_doubles(nr_of_values))
 
         ark_binary_data.validate_name("None")
 
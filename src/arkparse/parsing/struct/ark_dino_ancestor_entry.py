@@ -3,13 +3,14 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from arkparse.utils.json_utils import DefaultJsonEncoder
+from arkparse.utils.freezable import Freezable
 
 
 if TYPE_CHECKING:
     from arkparse.parsing import ArkBinaryParser
     from arkparse.object_model.dinos.dino_id import DinoId
 
-class ArkDinoAncestor:
+class ArkDinoAncestor(Freezable):
     name: str
     id_: "DinoId"
 
@@ -36,7 +37,7 @@ class ArkDinoAncestor:
         return json.dumps(self.to_json_obj(), default=lambda o: o.to_json_obj() if hasattr(o, 'to_json_obj') else None, indent=4, cls=DefaultJsonEncoder)
 
 @dataclass
-class ArkDinoAncestorEntry:
+class ArkDinoAncestorEntry(Freezable):
     male: ArkDinoAncestor
     female: ArkDinoAncestor
 
@@ -38,7 +38,8 @@ class ArkDinoOrderID:
 
         byte_buffer.validate_string("None")
 
-        ArkSaveLogger.parser_log(f"Read dino order id1:{self.id1} id2:{self.id2} name:{self.dino_name}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Read dino order id1:{self.id1} id2:{self.id2} name:{self.dino_name}")
 
     def __str__(self) -> str:
         return f"id1:{self.id1} id2:{self.id2} name:{self.dino_name}"
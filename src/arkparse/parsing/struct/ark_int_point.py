@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from arkparse.utils.freezable import Freezable
 if TYPE_CHECKING:
     from arkparse.parsing.ark_binary_parser import ArkBinaryParser
 
 @dataclass
-class ArkIntPoint:
+class ArkIntPoint(Freezable):
     value1 : int
     value2 : int
 
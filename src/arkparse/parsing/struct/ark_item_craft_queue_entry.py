@@ -20,13 +20,9 @@ class ArkItemCraftQueueEntry:
             binary_data.validate_uint32(0)
             binary_data.validate_uint32(0x18)
             binary_data.validate_byte(0)
-            self.pitch = binary_data.read_double()
-            self.yaw = binary_data.read_double()
-            self.roll = binary_data.read_double()
+            self.pitch, self.yaw, self.roll = binary_data.read_doubles(3)
         elif binary_data is not None:
-            self.pitch = binary_data.read_double()
-            self.yaw = binary_data.read_double()
-            self.roll = binary_data.read_double()
+            self.pitch, self.yaw, self.roll = binary_data.read_doubles(3)
         else:
             self.pitch = pitch
             self.yaw = yaw
@@ -22,7 +22,8 @@ class ArkItemNetId:
         self.id2 = byte_buffer.parse_uint32_property("ItemID2")
         byte_buffer.validate_name("None")
 
-        ArkSaveLogger.parser_log(f"ArkItemNetId: {self.id1}, {self.id2}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"ArkItemNetId: {self.id1}, {self.id2}")
 
 
     def replace(self, byte_buffer: "ArkBinaryParser", new_id1: int = None, new_id2: int = None):
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from arkparse.utils.freezable import Freezable
 
 if TYPE_CHECKING:
     from arkparse.parsing import ArkBinaryParser
 
 @dataclass
-class ArkLinearColor:
+class ArkLinearColor(Freezable):
     r: float
     g: float
     b: float
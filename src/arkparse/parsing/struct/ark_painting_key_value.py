@@ -16,4 +16,5 @@ class ArkPaintingKeyValue:
         self.value = ark_binary_data.parse_int32_property("Value")
         ark_binary_data.validate_name("None")
 
-        ArkSaveLogger.parser_log(f"ArkPaintingKeyValue: {self.key}, {self.value}")
\ No newline at end of file
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"ArkPaintingKeyValue: {self.key}, {self.value}")
\ No newline at end of file
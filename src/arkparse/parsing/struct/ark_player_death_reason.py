@@ -22,4 +22,5 @@ class ArkPlayerDeathReason:
         self.location = ArkVector(ark_binary_data, from_struct=True)
         ark_binary_data.validate_name("None")
 
-        ArkSaveLogger.parser_log(f"ArkPlayerDeathReason: {self.player_id}, {self.reason}, {self.time}, {self.location}")
\ No newline at end of file
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"ArkPlayerDeathReason: {self.player_id}, {self.reason}, {self.time}, {self.location}")
\ No newline at end of file
@@ -1,11 +1,12 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
+from arkparse.utils.freezable import Freezable
 
 if TYPE_CHECKING:
     from arkparse.parsing import ArkBinaryParser
 
 @dataclass
-class ArkRotator:
+class ArkRotator(Freezable):
     pitch: float
     yaw: float
     roll: float
@@ -20,13 +21,9 @@ class ArkRotator:
             binary_data.validate_uint32(0)
             binary_data.validate_uint32(0x18)
             binary_data.validate_byte(8)
-            self.pitch = binary_data.read_double()
-            self.yaw = binary_data.read_double()
-            self.roll = binary_data.read_double()
+            self.pitch, self.yaw, self.roll = binary_data.read_doubles(3)
         elif binary_data is not None:
-            self.pitch = binary_data.read_double()
-            self.yaw = binary_data.read_double()
-            self.roll = binary_data.read_double()
+            self.pitch, self.yaw, self.roll = binary_data.read_doubles(3)
         else:
             self.pitch = pitch
             self.yaw = yaw
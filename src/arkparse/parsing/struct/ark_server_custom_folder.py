@@ -18,7 +18,8 @@ class ArkServerCustomFolder:
         self.__read_custom_folder_ids(ark_binary_data)
         ark_binary_data.validate_name("None")
 
-        ArkSaveLogger.parser_log(f"ArkServerCustomFolder: {self.inventory_comp_type}, {self.name}, {len(self.custom_folder_ids)} items")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"ArkServerCustomFolder: {self.inventory_comp_type}, {self.name}, {len(self.custom_folder_ids)} items")
 
     def __read_custom_folder_ids(self, ark_binary_data: "ArkBinaryParser"):
         ark_binary_data.validate_name("CustomFolderItemIds")
@@ -44,7 +44,8 @@ class ArkTrackedActorIdCategoryPairWithBool:
 
         byte_buffer.validate_string("None")
 
-        ArkSaveLogger.parser_log(f"Read tracked actor id category pair with bool: {self}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Read tracked actor id category pair with bool: {self}")
 
     def __str__(self) -> str:
         return f"id:{self.id_} cat_byte:{self.cat_byte} category:{self.category} bool:{self.bool_}"
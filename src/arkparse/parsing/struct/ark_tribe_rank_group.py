@@ -71,7 +71,8 @@ class ArkTribeRankGroup:
 
         byte_buffer.validate_string("None")
 
-        ArkSaveLogger.parser_log(f"Read tribe rank group: {self}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Read tribe rank group: {self}")
 
     def __str__(self) -> str:
         return f"group_name:{self.rank_group_name} group_rank:{self.rank_group_rank}"
@@ -3,12 +3,13 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from arkparse.utils.json_utils import DefaultJsonEncoder
+from arkparse.utils.freezable import Freezable
 
 if TYPE_CHECKING:
     from arkparse.parsing import ArkBinaryParser
 
 @dataclass
-class ArkUniqueNetIdRepl:
+class ArkUniqueNetIdRepl(Freezable):
     unknown: int
     value_type: str
     value: str
@@ -4,12 +4,13 @@ from typing import TYPE_CHECKING
 from struct import pack
 
 from arkparse.utils.json_utils import DefaultJsonEncoder
+from arkparse.utils.freezable import Freezable
 
 if TYPE_CHECKING:
     from arkparse.parsing import ArkBinaryParser
 
 @dataclass
-class ArkVector:
+class ArkVector(Freezable):
     x: float = field(default=0.0)
     y: float = field(default=0.0)
     z: float = field(default=0.0)
@@ -26,9 +27,7 @@ class ArkVector:
             byte_buffer.validate_byte(8)
 
         if byte_buffer:
-            self.x = byte_buffer.read_double()
-            self.y = byte_buffer.read_double()
-            self.z = byte_buffer.read_double()
+            self.x, self.y, self.z = byte_buffer.read_doubles(3)
         else:
             self.x = x
             self.y = y
@@ -6,10 +6,11 @@ if TYPE_CHECKING:
 
 from arkparse.logging import ArkSaveLogger
 from .ark_vector import ArkVector
+from arkparse.utils.freezable import Freezable
 
 
 @dataclass
-class ArkVectorBoolPair:
+class ArkVectorBoolPair(Freezable):
     vector: ArkVector
     bool_: bool
 
@@ -33,8 +34,9 @@ class ArkVectorBoolPair:
 
         byte_buffer.validate_string("None")
 
-        ArkSaveLogger.parser_log(
-            f"Read vector bool pair {self.vector} {self.vector}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(
+                f"Read vector bool pair {self.vector} {self.vector}")
 
     def __str__(self):
         return f"ArkVectorBoolPair: {self.vector} {self.bool_}"
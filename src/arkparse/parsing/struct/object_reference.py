@@ -2,12 +2,13 @@ from dataclasses import dataclass
 from uuid import UUID
 from typing import TYPE_CHECKING
 from arkparse.logging import ArkSaveLogger
+from arkparse.utils.freezable import Freezable
 
 if TYPE_CHECKING:
     from arkparse.parsing import ArkBinaryParser
 
 @dataclass
-class ObjectReference:
+class ObjectReference(Freezable):
     TYPE_UUID = 0
     TYPE_PATH = 1
     TYPE_PATH_NO_TYPE = 2
@@ -31,9 +32,11 @@ class ObjectReference:
 
         # If the save context has a name table, handle accordingly
         if reader.save_context.has_name_table() and not reader.in_cryopod:
-            ArkSaveLogger.parser_log(f"Reading type at position {reader.position} with name table")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"Reading type at position {reader.position} with name table")
             type = reader.read_short()
-            ArkSaveLogger.parser_log(f"ObjectReference type: {type}, position: {reader.position}")
+            if ArkSaveLogger.parser_enabled:
+                ArkSaveLogger.parser_log(f"ObjectReference type: {type}, position: {reader.position}")
 
             if type == ObjectReference.TYPE_PATH or type == ObjectReference.TYPE_NAME_2:
                 self.type = ObjectReference.TYPE_PATH
@@ -48,7 +51,8 @@ class ObjectReference:
                 raise ValueError(f"Unknown ObjectReference type: {type}")
             return
 
-        ArkSaveLogger.parser_log(f"Reading ObjectReference without name table at position {reader.position}")
+        if ArkSaveLogger.parser_enabled:
+            ArkSaveLogger.parser_log(f"Reading ObjectReference without name table at position {reader.position}")
         # Handle object types
         object_type = reader.read_int()
         if object_type == -1:
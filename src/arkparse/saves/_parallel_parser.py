@@ -0,0 +1,155 @@
+import multiprocessing
+import pickle
+import re
+import sqlite3
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from arkparse.logging import ArkSaveLogger
+from arkparse.object_model.ark_game_object import ArkGameObject, _NameMetadata
+from arkparse.parsing import GameObjectReaderConfiguration
+from arkparse.saves.save_context import SaveContext
+
+if TYPE_CHECKING:
+    from .save_connection import SaveConnection
+
+# Number of key-range shards handed out per worker, more shards gives better load balancing
+SHARDS_PER_WORKER = 4
+
+# State of a worker process, set once by the pool initializer
+_worker_connection: Optional[sqlite3.Connection] = None
+_worker_context: Optional[SaveContext] = None
+_worker_config: Optional[GameObjectReaderConfiguration] = None
+_worker_prop_filter: Optional["re.Pattern[bytes]"] = None
+
+
+def _init_worker(database_uri: str, save_context: SaveContext, reader_config: GameObjectReaderConfiguration,
+                 prop_filter: Optional["re.Pattern[bytes]"], failed_parses: Dict[str, int]):
+    from .save_connection import SaveConnection
+
+    global _worker_connection, _worker_context, _worker_config, _worker_prop_filter
+    _worker_connection = sqlite3.connect(database_uri, uri=True)
+    _worker_context = save_context
+    _worker_config = reader_config
+    _worker_prop_filter = prop_filter
+    SaveConnection.failed_parses = dict(failed_parses)
+
+
+def _pack_object(key: bytes, obj: ArkGameObject) -> tuple:
+    # The decoded object as a flat tuple, unpickling the default state of every object (and its uuids) costs almost
+    # as much as parsing it. The location is left out, the parent has the same actor transforms
+    uuid2 = obj.uuid2.bytes if isinstance(obj.uuid2, uuid.UUID) else obj.uuid2
+    name_metadata = [(metadata.name, metadata.offset, metadata.is_read_as_string) for metadata in obj.name_metadata]
+    return (key, obj.blueprint, uuid2, obj.names, name_metadata, obj.section, obj.unknown, obj.properties_offset, obj.properties)
+
+
+def _unpack_object(packed: tuple, save_context: SaveContext) -> ArkGameObject:
+    key, blueprint, uuid2, names, name_metadata, section, unknown, properties_offset, properties = packed
+    obj = ArkGameObject()
+    obj.uuid = uuid.UUID(bytes=key)
+    obj.uuid2 = uuid.UUID(bytes=uuid2) if isinstance(uuid2, bytes) else uuid2
+    obj.blueprint = blueprint
+    obj.location = save_context.get_actor_transform(obj.uuid)
+    obj.names = names
+    obj.name_metadata = [_NameMetadata(*metadata) for metadata in name_metadata]
+    obj.section = section
+    obj.unknown = unknown
+    obj.properties_offset = properties_offset
+    obj.properties = properties
+    return obj
+
+
+def _parse_shard(keys: List[bytes]) -> Tuple[List[tuple], int, Dict[str, int]]:
+    from .save_connection import SaveConnection
+
+    failed_before = dict(SaveConnection.failed_parses)
+    parsed: List[tuple] = []
+    faulty = 0
+
+    for key, value in SaveConnection.fetch_game_obj_binaries(_worker_connection, keys):
+        obj_uuid = SaveConnection.byte_array_to_uuid(key)
+        obj, is_faulty = SaveConnection.parse_game_object_row(obj_uuid, value, _worker_context, _worker_config, _worker_prop_filter)
+        if obj is not None:
+            parsed.append(_pack_object(key, obj))
+        elif is_faulty:
+            faulty += 1
+
+    failed_delta = {cls: count - failed_before.get(cls, 0) for cls, count in SaveConnection.failed_parses.items() if count != failed_before.get(cls, 0)}
+    return parsed, faulty, failed_delta
+
+
+class ParallelObjectParser:
+    """
+    Parses the game table over a pool of worker processes.
+
+    The keys left after filtering are split into contiguous shards, every worker opens its own read
+    only connection to the save and gets the name table and actor transforms once, when it starts.
+    Workers send the decoded objects back as flat tuples (see _pack_object), lazy properties are decoded
+    in the worker, the parent only rebuilds the objects.
+    """
+
+    def __init__(self, connection: "SaveConnection", workers: int):
+        self.connection = connection
+        self.workers = workers
+
+    @staticmethod
+    def _get_mp_context():
+        # fork lets the workers share the save context and filters (lambdas) without pickling them
+        if "fork" in multiprocessing.get_all_start_methods():
+            return multiprocessing.get_context("fork")
+        return multiprocessing.get_context()
+
+    @staticmethod
+    def _is_picklable(obj) -> bool:
+        try:
+            pickle.dumps(obj)
+            return True
+        except Exception:
+            return False
+
+    def _get_shards(self, keys: List[bytes]) -> List[List[bytes]]:
+        nr_of_shards = min(len(keys), self.workers * SHARDS_PER_WORKER)
+        if nr_of_shards == 0:
+            return []
+
+        shard_size = -(-len(keys) // nr_of_shards)
+        return [keys[i:i + shard_size] for i in range(0, len(keys), shard_size)]
+
+    def get_game_objects(self, reader_config: GameObjectReaderConfiguration) -> Dict[uuid.UUID, "ArkGameObject"]:
+        from .save_connection import SaveConnection
+
+        connection = self.connection
+        context = self._get_mp_context()
+        if context.get_start_method() != "fork" and not self._is_picklable(reader_config):
+            ArkSaveLogger.warning_log("Reader configuration can not be sent to worker processes (use module level filter functions instead of lambdas), parsing on a single process")
+            return connection.get_game_objects(reader_config)
+
+        prop_ids = connection.get_property_name_ids(reader_config)
+        game_objects: Dict[uuid.UUID, "ArkGameObject"] = {}
+        if connection.matches_no_objects(reader_config, prop_ids):
+            return game_objects
+
+        # filtering and cached objects are handled here, workers only get the keys left to parse
+        shards = self._get_shards(connection.select_game_object_keys(reader_config, prop_ids, game_objects))
+        ArkSaveLogger.save_log(f"Parsing game objects in {len(shards)} shards over {self.workers} worker processes")
+
+        init_args = (connection.get_database_uri(), connection.save_context, reader_config, SaveConnection.get_property_filter(prop_ids), SaveConnection.failed_parses)
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=context, initializer=_init_worker, initargs=init_args) as executor:
+            futures = [executor.submit(_parse_shard, shard) for shard in shards]
+            for future in futures:
+                parsed, faulty, failed_delta = future.result()
+
+                for packed in parsed:
+                    obj = _unpack_object(packed, connection.save_context)
+                    game_objects[obj.uuid] = obj
+                    connection.parsed_objects[obj.uuid] = obj
+
+                connection.nr_parsed += len(parsed)
+                connection.faulty_objects += faulty
+                for cls, count in failed_delta.items():
+                    SaveConnection.failed_parses[cls] = SaveConnection.failed_parses.get(cls, 0) + count
+
+        connection.report_faulty_objects()
+
+        return game_objects
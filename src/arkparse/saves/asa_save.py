@@ -1,25 +1,32 @@
 import math
+from contextlib import nullcontext
 from pathlib import Path
-from typing import Dict, Optional, Collection
+from typing import Dict, Iterator, Optional, Collection, Tuple
 import uuid
 
 from arkparse.logging import ArkSaveLogger
 
 from arkparse.parsing.game_object_reader_configuration import GameObjectReaderConfiguration
 from arkparse.parsing.ark_binary_parser import ArkBinaryParser
+from arkparse.parsing.struct import ActorTransformTable
 from arkparse.object_model.misc.__parsed_object_base import ParsedObjectBase
 
 from arkparse.object_model.ark_game_object import ArkGameObject
 from .save_connection import SaveConnection
+from .parse_cache import ParseCache
 from .save_context import SaveContext
 
 class AsaSave:
     # Populate manually if constructor parameter use_connection is False
     
 
-    def __init__(self, path: Path = None, contents: bytes = None, read_only: bool = False, use_connection: bool = True):
+    def __init__(self, path: Path = None, contents: bytes = None, read_only: bool = False, use_connection: bool = True, cache_path: Path = None, intern_values: bool = False):
 
         self.save_context = SaveContext()
+        if intern_values:
+            # identical small struct and array values are shared between objects: such struct values are frozen (modifying one
+            # raises an AttributeError, copy.copy gives a modifiable copy) and such array values are tuples instead of lists
+            self.save_context.interned_values = {}
         self.parsed_objects: Dict[uuid.UUID, ArkGameObject] = {}
 
         # Populate manually if constructor parameter use_connection is False
@@ -33,6 +40,9 @@ class AsaSave:
         self.profile_data_in_db = False
         self.save_dir = path.parent if path is not None else None
         self.save_connection = None
+
+        # Parse results are loaded from this sidecar file when present, store them with store_parse_cache()
+        self.parse_cache = ParseCache(cache_path) if cache_path is not None else None
         if use_connection:
             self.save_connection = SaveConnection(save_context=self.save_context, path=path, contents=contents, read_only=read_only)
             self.initialize()
@@ -43,11 +53,15 @@ class AsaSave:
     @property
     def faulty_objects(self) -> Dict[uuid.UUID, ArkGameObject]:
         if self.save_connection is not None:
+            self.save_connection.collect_decode_errors()
             return self.save_connection.faulty_objects
         return 0
 
     def initialize(self):
-        self.read_actor_locations()
+        if self.parse_cache is not None:
+            self.parse_cache.load(self.save_connection)
+        else:
+            self.read_actor_locations()
         self.profile_data_in_db = self.profile_data_in_saves()
         self._get_game_time_params()
 
@@ -58,9 +72,19 @@ class AsaSave:
             return False
         return True
 
+    def store_parse_cache(self, path: Path = None):
+        if path is None and self.parse_cache is None:
+            raise ValueError("No parse cache path given")
+        cache = ParseCache(path) if path is not None else self.parse_cache
+        cache.store(self.save_connection)
+
     def get_class_of_uuid(self, obj_uuid: uuid.UUID) -> Optional[str]:
         return self.save_connection.get_class_of_uuid(obj_uuid)
 
+    def get_classes_of_uuids(self, obj_uuids: Collection[uuid.UUID]) -> Dict[uuid.UUID, str]:
+        # objects that are not in the save are left out
+        return self.save_connection.get_classes_of_uuids(obj_uuids)
+
     def _get_game_time_params(self):
         config: GameObjectReaderConfiguration = GameObjectReaderConfiguration()
         config.blueprint_name_filter = lambda name: name is not None and "daycycle" in name.lower()
@@ -151,6 +175,31 @@ class AsaSave:
             return self.save_connection.get_parser_for_game_object(obj_uuid)
         return None
     
+    def get_parser_and_game_object(self, obj_uuid: uuid.UUID, reparse: bool = False) -> Tuple[Optional[ArkBinaryParser], Optional[ArkGameObject]]:
+        # Binary and parsed object in one lookup, (None, None) if the object is not in the save
+        if (self.game_obj_binaries is not None and obj_uuid in self.game_obj_binaries) or (obj_uuid in self.parsed_objects and not reparse):
+            if not self.is_in_db(obj_uuid):
+                return None, None
+            return self.get_parser_for_game_object(obj_uuid), self.get_game_object_by_id(obj_uuid, reparse)
+        if self.save_connection is not None:
+            return self.save_connection.get_parser_and_game_object(obj_uuid, reparse)
+        return None, None
+
+    def get_parsers_and_game_objects(self, obj_uuids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Tuple[ArkBinaryParser, Optional[ArkGameObject]]]:
+        # get_parser_and_game_object for several objects at once, objects that are not in the save are left out
+        result = {}
+        remaining = []
+        for obj_uuid in obj_uuids:
+            if (self.game_obj_binaries is not None and obj_uuid in self.game_obj_binaries) or obj_uuid in self.parsed_objects:
+                parser, obj = self.get_parser_and_game_object(obj_uuid)
+                if parser is not None:
+                    result[obj_uuid] = (parser, obj)
+            else:
+                remaining.append(obj_uuid)
+        if self.save_connection is not None and len(remaining) > 0:
+            result.update(self.save_connection.get_parsers_and_game_objects(remaining))
+        return result
+
     def find_value_in_game_table_objects(self, value: bytes):
         if self.save_connection is not None:
             self.save_connection.find_value_in_game_table_objects(value)
@@ -188,9 +237,14 @@ class AsaSave:
         if self.save_connection is not None:
             self.save_connection.add_obj_to_db(obj_uuid, obj_data)
 
-    def modify_game_obj(self, obj_uuid: uuid.UUID, obj_data: bytes):
+    def modify_game_obj(self, obj_uuid: uuid.UUID, obj_data: bytes, parsed_object: Optional[ArkGameObject] = None):
         if self.save_connection is not None:
-            self.save_connection.modify_game_obj(obj_uuid, obj_data)
+            self.save_connection.modify_game_obj(obj_uuid, obj_data, parsed_object)
+
+    def uncache_game_object(self, obj_uuid: uuid.UUID):
+        self.parsed_objects.pop(obj_uuid, None)
+        if self.save_connection is not None:
+            self.save_connection.uncache_game_object(obj_uuid)
 
     def remove_obj_from_db(self, obj_uuid: uuid.UUID):
         if self.save_connection is not None:
@@ -207,6 +261,14 @@ class AsaSave:
     def modify_actor_transform(self, uuid: uuid.UUID, binary_data: bytes):
         if self.save_connection is not None:
             self.save_connection.modify_actor_transform(uuid, binary_data)
+        if isinstance(self.save_context.actor_transforms, ActorTransformTable):
+            self.save_context.actor_transforms.invalidate_spatial_index()
+
+    def batch(self):
+        # with save.batch(): writes are executed together in one transaction when the block ends
+        if self.save_connection is not None:
+            return self.save_connection.batch()
+        return nullcontext(self)
 
     def store_db(self, path: Path):
         if self.save_connection is not None:
@@ -222,14 +284,28 @@ class AsaSave:
         if self.save_connection is not None:
             self.save_connection.reset_caching()
 
-    def get_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration()) -> Dict[uuid.UUID, 'ArkGameObject']:
+    def get_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration(), workers: int = 1) -> Dict[uuid.UUID, 'ArkGameObject']:
+        # workers > 1 parses the game table over a pool of worker processes
         if self.parsed_objects is not None and len(self.parsed_objects) > 0:
             return self.parsed_objects
         else:
             if self.save_connection is not None:
-                return self.save_connection.get_game_objects(reader_config)
+                return self.save_connection.get_game_objects(reader_config, workers)
             return {}
     
+    def iter_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration(), cache: bool = False) -> Iterator[Tuple[uuid.UUID, 'ArkGameObject']]:
+        # streams the objects one at a time, see SaveConnection.iter_game_objects
+        if self.save_connection is not None:
+            yield from self.save_connection.iter_game_objects(reader_config, cache)
+            return
+
+        prop_ids = [prop.encode() for prop in reader_config.property_names]
+        for obj_uuid, obj in self.parsed_objects.items():
+            if reader_config.uuid_filter and not reader_config.uuid_filter(obj_uuid):
+                continue
+            if SaveConnection.is_cached_object_selected(obj, reader_config, prop_ids):
+                yield obj_uuid, obj
+
     def get_all_present_classes(self):
         if self.all_classes is not None:
             return self.all_classes
@@ -0,0 +1,115 @@
+import hashlib
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from arkparse.logging import ArkSaveLogger
+
+if TYPE_CHECKING:
+    from .save_connection import SaveConnection
+
+# Bump when the layout of the cache file or of the pickled objects changes
+CACHE_VERSION = 2
+
+
+class ParseCache:
+    """
+    Sidecar file with the parse results of a save, so other processes opening the same save
+    do not have to parse it again.
+
+    When size, modification time and header of the save are unchanged, the actor transforms and
+    parsed objects are loaded as is. Otherwise the objects whose blob did not change are reused and only
+    the changed rows are parsed again when requested.
+    The cache is a pickle, only load cache files you created yourself.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    @staticmethod
+    def hash_blob(blob: bytes) -> bytes:
+        return hashlib.blake2b(blob, digest_size=16).digest()
+
+    @staticmethod
+    def get_fingerprint(connection: "SaveConnection") -> Optional[Tuple[int, int, bytes]]:
+        # A save that was written to does not match its file on disk anymore
+        if connection.save_path is None or connection.has_changes:
+            return None
+        stat = connection.save_path.stat()
+        return stat.st_size, stat.st_mtime_ns, ParseCache.hash_blob(connection.get_custom_value("SaveHeader").byte_buffer)
+
+    def __read(self) -> Optional[dict]:
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            ArkSaveLogger.warning_log(f"Could not read parse cache {self.path}: {e}")
+            return None
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            ArkSaveLogger.save_log(f"Parse cache {self.path} has an old format, ignoring it")
+            return None
+        return data
+
+    def load(self, connection: "SaveConnection") -> int:
+        # Fills the actor transforms and the parsed object cache of the connection, returns the nr of reused objects
+        data = self.__read()
+        save_context = connection.save_context
+
+        fingerprint = ParseCache.get_fingerprint(connection)
+        if data is not None and fingerprint is not None and data["fingerprint"] == fingerprint:
+            save_context.actor_transforms = data["actor_transforms"]
+            save_context.actor_transform_positions = data["actor_transform_positions"]
+            connection.parsed_objects.update({obj.uuid: obj for _, obj in data["objects"].values()})
+            ArkSaveLogger.save_log(f"Save unchanged, loaded {len(data['objects'])} objects from parse cache {self.path}")
+            return len(data["objects"])
+
+        connection.read_actor_locations()
+        if data is None:
+            return 0
+
+        # name ids in unchanged blobs only mean the same thing if the names they refer to did not change
+        if any(save_context.names.get(key) != name for key, name in data["names"].items()):
+            ArkSaveLogger.save_log(f"Name table changed, parse cache {self.path} can not be used")
+            return 0
+
+        cached: Dict[bytes, Tuple[bytes, object]] = data["objects"]
+        reused = 0
+        for key, blob in connection.connection.execute("SELECT key, value FROM game"):
+            entry = cached.get(key)
+            if entry is None or entry[0] != ParseCache.hash_blob(blob):
+                continue
+            obj = entry[1]
+            obj.location = save_context.get_actor_transform(obj.uuid) or None
+            connection.parsed_objects[obj.uuid] = obj
+            reused += 1
+
+        ArkSaveLogger.save_log(f"Save changed, reused {reused} of {len(cached)} objects from parse cache {self.path}")
+        return reused
+
+    def store(self, connection: "SaveConnection"):
+        save_context = connection.save_context
+        objects = dict(connection.parsed_objects)
+
+        objects_by_key = {}
+        keys = [connection.uuid_to_byte_array(obj_uuid) for obj_uuid in objects.keys()]
+        for key, blob in connection.fetch_game_obj_binaries(connection.connection, keys):
+            objects_by_key[key] = (ParseCache.hash_blob(blob), objects[connection.byte_array_to_uuid(key)])
+
+        data = {
+            "version": CACHE_VERSION,
+            "fingerprint": ParseCache.get_fingerprint(connection),
+            "names": save_context.names,
+            "actor_transforms": save_context.actor_transforms,
+            "actor_transform_positions": save_context.actor_transform_positions,
+            "objects": objects_by_key,
+        }
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(self.path)
+
+        ArkSaveLogger.save_log(f"Stored {len(objects_by_key)} parsed objects in parse cache {self.path}")
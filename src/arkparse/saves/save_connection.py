@@ -1,10 +1,14 @@
+import itertools
+import re
+import shutil
 import sqlite3
 import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Collection, Optional, Dict
+from typing import Callable, Collection, Iterator, Optional, Dict, List, Set, Tuple
 
 from arkparse.logging import ArkSaveLogger
-from arkparse.object_model.ark_game_object import ArkGameObject
+from arkparse.object_model.ark_game_object import ArkGameObject, LazyArkGameObject
 from arkparse.parsing import ArkBinaryParser, GameObjectReaderConfiguration
 from arkparse.saves.header_location import HeaderLocation
 from arkparse.saves.save_context import SaveContext
@@ -21,28 +25,53 @@ class SaveConnection:
 
     failed_parses: Dict[str, int] = {}
 
-    def __init__(self, save_context: SaveContext, path: Path = None, contents: bytes = None, read_only: bool = False):
+    # Number of keys per "WHERE key IN (...)" query, stays below the sqlite parameter limit
+    FETCH_CHUNK_SIZE = 900
 
-        # create temp copy of file
-        temp_save_path = TEMP_FILES_DIR / (str(uuid.uuid4()) + ".ark")
+    def __init__(self, save_context: SaveContext, path: Path = None, contents: bytes = None, read_only: bool = False):
+        self.connection = None
+        self.sqlite_db = None
+        self.save_path: Optional[Path] = Path(path) if path is not None else None
+        self.has_changes = False
         self.parsed_objects: Dict[uuid.UUID, ArkGameObject] = {}
 
-        if path is not None:
-            with open(path, 'rb') as file:
-                with open(temp_save_path, 'wb') as temp_file:
-                    temp_file.write(file.read())
-        elif contents is not None:
-            with open(temp_save_path, 'wb') as temp_file:
-                temp_file.write(contents)
+        # key -> class name id of every object in the game table, built on first use
+        self.class_index: Optional[Dict[bytes, int]] = None
+
+        # state of an open batch(), see there
+        self._batch_depth = 0
+        self._pending_writes: List[Tuple[str, tuple]] = []
+        self._deferred_reparse: Set[uuid.UUID] = set()
+        # custom table values edited inside the batch, every edit goes to one parser per key that is written on commit
+        self._pending_custom_values: Dict[str, ArkBinaryParser] = {}
+        # name table state before the first name added inside the batch, restored on rollback
+        self._name_table_snapshot: Optional[Tuple[int, int, Dict[int, str]]] = None
+
+        # read only saves on disk are opened in place, a temp copy is only made on the first write
+        self.source_path: Optional[Path] = None
+
+        if path is not None and read_only:
+            self.source_path = Path(path)
+            conn_str = f"{self.source_path.resolve().as_uri()}?mode=ro&immutable=1"
         else:
-            raise ValueError("Either path or contents must be provided")
+            # create temp copy of file
+            temp_save_path = TEMP_FILES_DIR / (str(uuid.uuid4()) + ".ark")
+
+            if path is not None:
+                with open(path, 'rb') as file:
+                    with open(temp_save_path, 'wb') as temp_file:
+                        temp_file.write(file.read())
+            elif contents is not None:
+                with open(temp_save_path, 'wb') as temp_file:
+                    temp_file.write(contents)
+            else:
+                raise ValueError("Either path or contents must be provided")
 
-        self.save_dir = path.parent if path is not None else None
-        self.sqlite_db = temp_save_path
+            self.sqlite_db = temp_save_path
+            conn_str = f"file:{temp_save_path}?mode={'ro' if read_only else 'rw'}"
 
+        self.save_dir = path.parent if path is not None else None
         self.save_context = save_context
-
-        conn_str = f"file:{temp_save_path}?mode={'ro' if read_only else 'rw'}"
         self.connection = sqlite3.connect(conn_str, uri=True)
 
         self.list_all_items_in_db()
@@ -51,10 +80,121 @@ class SaveConnection:
     def __del__(self):
         self.close()
 
-        # clean up temp file
+        # clean up temp file, the original save is never removed
         if self.sqlite_db is not None and self.sqlite_db.exists():
             self.sqlite_db.unlink()
 
+    @property
+    def is_read_only(self) -> bool:
+        return self.source_path is not None and self.sqlite_db is None
+
+    def _ensure_writable(self):
+        # copy-on-first-write: move a read only (in place) connection over to a writable temp copy
+        self.has_changes = True
+        if not self.is_read_only:
+            return
+
+        temp_save_path = TEMP_FILES_DIR / (str(uuid.uuid4()) + ".ark")
+        ArkSaveLogger.save_log(f"First write to read only save, copying {self.source_path} to {temp_save_path}")
+        shutil.copyfile(self.source_path, temp_save_path)
+
+        self.connection.close()
+        self.sqlite_db = temp_save_path
+        self.connection = sqlite3.connect(f"file:{temp_save_path}?mode=rw", uri=True)
+
+    @contextmanager
+    def batch(self):
+        # Writes made inside the block are queued and executed together (executemany per statement) in a single
+        # transaction, committed when the outermost batch ends. Queued writes are flushed before every read, so
+        # reads inside the block see them. Reparsing added and modified objects waits until they are requested
+        # or the batch ends. If the block raises, all writes of the batch are rolled back, together with the names
+        # added to the name table. Objects and tables read from the save before (like the actor transforms in the
+        # save context) are not restored, read them again after a failed batch.
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._pending_writes.clear()
+                self._pending_custom_values.clear()
+                self._deferred_reparse.clear()
+                self.connection.rollback()
+                if self._name_table_snapshot is not None:
+                    self.name_count, self.last_name_end, self.save_context.names = self._name_table_snapshot
+                    self._name_table_snapshot = None
+                # cached state may contain changes that were rolled back
+                self.class_index = None
+                self.parsed_objects.clear()
+            raise
+
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._commit_writes()
+            self._name_table_snapshot = None
+            for obj_uuid in list(self._deferred_reparse):
+                if obj_uuid not in self.parsed_objects:
+                    self.get_game_object_by_id(obj_uuid)
+            self._deferred_reparse.clear()
+
+    def _execute_write(self, query: str, params: tuple):
+        if self._batch_depth > 0:
+            self._pending_writes.append((query, params))
+            return
+
+        with self.connection as conn:
+            conn.execute(query, params)
+            conn.commit()
+
+    def _flush_writes(self):
+        # executes queued batch writes, consecutive writes with the same statement go in one executemany
+        if len(self._pending_writes) == 0:
+            return
+        for query, writes in itertools.groupby(self._pending_writes, key=lambda write: write[0]):
+            params = [write_params for _, write_params in writes]
+            if query.startswith("UPDATE"):
+                # all updates replace the full value of a row, only the last one per row has to be written
+                params = list({write_params[1:]: write_params for write_params in params}.values())
+            self.connection.executemany(query, params)
+        self._pending_writes.clear()
+
+    def _flush_custom_values(self):
+        # queues the custom values edited in the batch, one update per key, and executes all queued writes
+        query = "UPDATE custom SET value = ? WHERE key = ?"
+        for key, value in self._pending_custom_values.items():
+            self._pending_writes.append((query, (value.byte_buffer, key)))
+        self._pending_custom_values.clear()
+        self._flush_writes()
+
+    def _commit_writes(self):
+        self._flush_custom_values()
+        self.connection.commit()
+
+    def _get_custom_value_for_update(self, key: str) -> Optional[ArkBinaryParser]:
+        # inside a batch the same parser is returned for every edit of the key, it is only read once
+        if self._batch_depth == 0:
+            return self.get_custom_value(key)
+        if key not in self._pending_custom_values:
+            value = self.get_custom_value(key)
+            if value is None:
+                return None
+            self._pending_custom_values[key] = value
+        return self._pending_custom_values[key]
+
+    def _store_custom_value(self, key: str, value: ArkBinaryParser):
+        if self._batch_depth > 0:
+            # value is the pending parser, written by _flush_custom_values
+            return
+        query = "UPDATE custom SET value = ? WHERE key = ?"
+        self._execute_write(query, (value.byte_buffer, key))
+
+    def __reparse(self, obj_uuid: uuid.UUID):
+        if self._batch_depth > 0:
+            self.parsed_objects.pop(obj_uuid, None)
+            self._deferred_reparse.add(obj_uuid)
+        else:
+            self.get_game_object_by_id(obj_uuid, reparse=True)
+
     def read_table(self, header_data: 'ArkBinaryParser') -> Dict[int, str]:
         count = header_data.read_int()
         self.name_count = count
@@ -114,6 +254,7 @@ class SaveConnection:
     def close(self):
         if self.connection:
             self.connection.close()
+            self.connection = None
 
     def get_class_of_uuid(self, obj_uuid: uuid.UUID) -> Optional[str]:
         bin = self.get_game_obj_binary(obj_uuid)
@@ -121,25 +262,48 @@ class SaveConnection:
         class_name, string_name = ArkGameObject.read_name(obj_uuid, reader)
         return class_name
 
+    def get_classes_of_uuids(self, obj_uuids: Collection[uuid.UUID]) -> Dict[uuid.UUID, str]:
+        # Class names of several objects with batched queries, objects that are not in the database are left out.
+        # Only the class name id is fetched, full blobs only for class names that do not resolve through the name table
+        self._flush_writes()
+        keys = [SaveConnection.uuid_to_byte_array(obj_uuid) for obj_uuid in obj_uuids]
+        classes = {}
+        unresolved = keys
+        if self.save_context.has_name_table():
+            unresolved = []
+            for key, class_id in SaveConnection.fetch_game_obj_binaries(self.connection, keys, prefix=4):
+                class_name = self.save_context.get_name(int.from_bytes(class_id, byteorder="little"))
+                if class_name is None:
+                    unresolved.append(key)
+                else:
+                    classes[SaveConnection.byte_array_to_uuid(key)] = class_name
+
+        for key, bin in SaveConnection.fetch_game_obj_binaries(self.connection, unresolved):
+            obj_uuid = SaveConnection.byte_array_to_uuid(key)
+            classes[obj_uuid], _ = ArkGameObject.read_name(obj_uuid, ArkBinaryParser(bin, self.save_context))
+        return classes
+
     def list_all_items_in_db(self):
+        # plain cursors, the connection context manager would commit an open batch
+        self._flush_custom_values()
         query = "SELECT key, value FROM game"
-        with self.connection as conn:
-            cursor = conn.execute(query)
-            name = cursor.description
-            rowCount = 0
-            for row in cursor:
-                rowCount += 1
-            ArkSaveLogger.save_log(f"Found {rowCount} items in game table")
+        cursor = self.connection.execute(query)
+        rowCount = 0
+        for row in cursor:
+            rowCount += 1
+        ArkSaveLogger.save_log(f"Found {rowCount} items in game table")
 
         # get custom values
         query = "SELECT key, value FROM custom"
-        with self.connection as conn:
-            cursor = conn.execute(query)
-            for row in cursor:
-                ArkSaveLogger.save_log(f"Custom key: {row[0]}")
+        cursor = self.connection.execute(query)
+        for row in cursor:
+            ArkSaveLogger.save_log(f"Custom key: {row[0]}")
 
     def add_name_to_name_table(self, name: str, id: Optional[int] = None):
-        header_data = self.get_custom_value("SaveHeader")
+        self._ensure_writable()
+        if self._batch_depth > 0 and self._name_table_snapshot is None:
+            self._name_table_snapshot = (self.name_count, self.last_name_end, dict(self.save_context.names))
+        header_data = self._get_custom_value_for_update("SaveHeader")
         self.name_count += 1
         header_data.set_position(self.name_offset)
         header_data.replace_bytes(self.name_count.to_bytes(4, byteorder="little"))
@@ -149,12 +313,10 @@ class SaveConnection:
         self.last_name_end = header_data.position
 
         # store new name table
-        query = "UPDATE custom SET value = ? WHERE key = 'SaveHeader'"
-        with self.connection as conn:
-            conn.execute(query, (header_data.byte_buffer,))
-            conn.commit()
+        self._store_custom_value("SaveHeader", header_data)
 
     def find_value_in_game_table_objects(self, value: bytes):
+        self._flush_writes()
         query = "SELECT key, value FROM game"
         cursor = self.connection.cursor()
         cursor.execute(query)
@@ -170,6 +332,7 @@ class SaveConnection:
                     print(f"Object: {obj.blueprint} ({obj.uuid})")
 
     def find_value_in_custom_tables(self, value: bytes):
+        self._flush_custom_values()
         query = "SELECT key, value FROM custom"
         cursor = self.connection.cursor()
         cursor.execute(query)
@@ -181,6 +344,8 @@ class SaveConnection:
                 print(f"Found at {row[0]}, index: {r}")
 
     def replace_value_in_custom_tables(self, search: bytes, replace: bytes):
+        self._ensure_writable()
+        self._flush_custom_values()
         query = "SELECT key, value FROM custom"
         cursor = self.connection.cursor()
         cursor.execute(query)
@@ -194,17 +359,17 @@ class SaveConnection:
                 reader.replace_bytes(replace)
 
                 query = "UPDATE custom SET value = ? WHERE key = ?"
-                with self.connection as conn:
-                    conn.execute(query, (reader.byte_buffer, row[0]))
-                    conn.commit()
+                self._execute_write(query, (reader.byte_buffer, row[0]))
 
     def get_obj_uuids(self) -> Collection[uuid.UUID]:
+        self._flush_writes()
         query = "SELECT key FROM game"
         cursor = self.connection.cursor()
         cursor.execute(query)
         return [SaveConnection.byte_array_to_uuid(row[0]) for row in cursor]
 
     def print_tables_and_sizes(self):
+        self._flush_writes()
         query = "SELECT name FROM sqlite_master WHERE type='table'"
         cursor = self.connection.cursor()
         cursor.execute(query)
@@ -216,6 +381,7 @@ class SaveConnection:
             print(f"Table {table_name} has {count} rows")
 
     def print_custom_table_sizes(self):
+        self._flush_custom_values()
         query = "SELECT key, LENGTH(value) FROM custom"
         cursor = self.connection.cursor()
         cursor.execute(query)
@@ -223,35 +389,49 @@ class SaveConnection:
             print(f"Key: {row[0]}, size: {row[1]}")
 
     def add_obj_to_db(self, obj_uuid: uuid.UUID, obj_data: bytes):
+        self._ensure_writable()
         query = "INSERT INTO game (key, value) VALUES (?, ?)"
-        with self.connection as conn:
-            conn.execute(query, (SaveConnection.uuid_to_byte_array(obj_uuid), obj_data))
-            conn.commit()
+        self._execute_write(query, (SaveConnection.uuid_to_byte_array(obj_uuid), obj_data))
 
-        self.get_game_object_by_id(obj_uuid, reparse=True)
+        self.__update_class_index(obj_uuid, obj_data)
+        self.__reparse(obj_uuid)
 
-    def modify_game_obj(self, obj_uuid: uuid.UUID, obj_data: bytes):
+    def modify_game_obj(self, obj_uuid: uuid.UUID, obj_data: bytes, parsed_object: Optional['ArkGameObject'] = None):
+        # parsed_object: the object already updated to match obj_data (see ArkBinaryParser.track), it is cached
+        # as it is instead of parsing obj_data again
+        self._ensure_writable()
         query = "UPDATE game SET value = ? WHERE key = ?"
-        with self.connection as conn:
-            conn.execute(query, (obj_data, SaveConnection.uuid_to_byte_array(obj_uuid)))
-            conn.commit()
+        self._execute_write(query, (obj_data, SaveConnection.uuid_to_byte_array(obj_uuid)))
 
-        self.get_game_object_by_id(obj_uuid, reparse=True)
+        self.__update_class_index(obj_uuid, obj_data)
+        if parsed_object is None:
+            self.__reparse(obj_uuid)
+        else:
+            self._deferred_reparse.discard(obj_uuid)
+            self.parsed_objects[obj_uuid] = parsed_object
+
+    def uncache_game_object(self, obj_uuid: uuid.UUID):
+        # the object is parsed again the next time it is requested
+        self.parsed_objects.pop(obj_uuid, None)
 
     def remove_obj_from_db(self, obj_uuid: uuid.UUID):
+        self._ensure_writable()
         try:
             query = "DELETE FROM game WHERE key = ?"
-            with self.connection as conn:
-                conn.execute(query, (SaveConnection.uuid_to_byte_array(obj_uuid),))
-                conn.commit()
+            self._execute_write(query, (SaveConnection.uuid_to_byte_array(obj_uuid),))
         except Exception as e:
             ArkSaveLogger.error_log(f"Error removing object {obj_uuid} from database: {e}")
 
         if obj_uuid in self.parsed_objects:
             self.parsed_objects.pop(obj_uuid)
+        self._deferred_reparse.discard(obj_uuid)
+
+        if self.class_index is not None:
+            self.class_index.pop(SaveConnection.uuid_to_byte_array(obj_uuid), None)
 
     def add_actor_transform(self, uuid: uuid.UUID, binary_data: bytes, no_store: bool = False):
-        actor_transforms = self.get_custom_value("ActorTransforms")
+        self._ensure_writable()
+        actor_transforms = self._get_custom_value_for_update("ActorTransforms")
 
         # print(f"Adding actor transform {uuid}")
 
@@ -262,24 +442,20 @@ class SaveConnection:
             actor_transforms.insert_bytes(binary_data)
             # print(f"New size: {actor_transforms.size()}")
 
-            query = "UPDATE custom SET value = ? WHERE key = 'ActorTransforms'"
-            with self.connection as conn:
-                conn.execute(query, (actor_transforms.byte_buffer,))
-                conn.commit()
+            self._store_custom_value("ActorTransforms", actor_transforms)
 
     def add_actor_transforms(self, new_actor_transforms: bytes):
-        actor_transforms = self.get_custom_value("ActorTransforms")
+        self._ensure_writable()
+        actor_transforms = self._get_custom_value_for_update("ActorTransforms")
         if actor_transforms:
             actor_transforms.set_position(actor_transforms.size() - 16)
             actor_transforms.insert_bytes(new_actor_transforms)
 
-            query = "UPDATE custom SET value = ? WHERE key = 'ActorTransforms'"
-            with self.connection as conn:
-                conn.execute(query, (actor_transforms.byte_buffer,))
-                conn.commit()
+            self._store_custom_value("ActorTransforms", actor_transforms)
 
     def modify_actor_transform(self, uuid: uuid.UUID, binary_data: bytes):
-        actor_transforms = self.get_custom_value("ActorTransforms")
+        self._ensure_writable()
+        actor_transforms = self._get_custom_value_for_update("ActorTransforms")
 
         if actor_transforms:
             byte_sequence = SaveConnection.uuid_to_byte_array(uuid)
@@ -294,11 +470,10 @@ class SaveConnection:
             actor_transforms.set_position(positions[0])
             actor_transforms.replace_bytes(byte_sequence + binary_data)
 
-            query = "UPDATE custom SET value = ? WHERE key = 'ActorTransforms'"
-            with self.connection as conn:
-                conn.execute(query, (actor_transforms.byte_buffer,))
+            self._store_custom_value("ActorTransforms", actor_transforms)
 
     def store_db(self, path: Path):
+        self._commit_writes()
         path.parent.mkdir(parents=True, exist_ok=True)
         with sqlite3.connect(path) as new_conn:
             self.connection.backup(new_conn)
@@ -306,6 +481,7 @@ class SaveConnection:
         print(f"Database successfully backed up to {path}")
 
     def get_save_binary_size(self) -> int:
+        self._flush_writes()
         query = "SELECT SUM(LENGTH(value)) FROM game"
         cursor = self.connection.cursor()
         cursor.execute(query)
@@ -315,18 +491,22 @@ class SaveConnection:
         return 0
 
     def get_all_present_classes(self):
+        self._flush_writes()
         query = "SELECT value FROM game"
         classes = []
-        with self.connection as conn:
-            cursor = conn.execute(query)
-            for row in cursor:
-                byte_buffer = ArkBinaryParser(row[0], self.save_context)
-                class_name = byte_buffer.read_name()
-                if class_name not in classes:
-                    classes.append(class_name)
+        cursor = self.connection.execute(query)
+        for row in cursor:
+            byte_buffer = ArkBinaryParser(row[0], self.save_context)
+            class_name = byte_buffer.read_name()
+            if class_name not in classes:
+                classes.append(class_name)
         return classes
 
     def get_custom_value(self, key: str) -> Optional['ArkBinaryParser']:
+        if key in self._pending_custom_values:
+            # edited in the open batch and not written yet, a new parser so the position of the pending one is kept
+            return ArkBinaryParser(self._pending_custom_values[key].byte_buffer, self.save_context)
+        self._flush_writes()
         query = f"SELECT value FROM custom WHERE key = ? LIMIT 1"
         cursor = self.connection.cursor()
         cursor.execute(query, (key,))
@@ -336,6 +516,7 @@ class SaveConnection:
         return None
 
     def get_game_obj_binary(self, obj_uuid: uuid.UUID) -> Optional[bytes]:
+        self._flush_writes()
         query = "SELECT value FROM game WHERE key = ?"
         cursor = self.connection.cursor()
         cursor.execute(query, (SaveConnection.uuid_to_byte_array(obj_uuid),))
@@ -352,6 +533,7 @@ class SaveConnection:
         return ArkBinaryParser(binary, self.save_context)
 
     def is_in_db(self, obj_uuid: uuid.UUID) -> bool:
+        self._flush_writes()
         query = "SELECT key FROM game WHERE key = ?"
         cursor = self.connection.cursor()
         cursor.execute(query, (SaveConnection.uuid_to_byte_array(obj_uuid),))
@@ -360,7 +542,37 @@ class SaveConnection:
     def get_game_object_by_id(self, obj_uuid: uuid.UUID, reparse: bool = False) -> Optional['ArkGameObject']:
         if obj_uuid in self.parsed_objects and not reparse:
             return self.parsed_objects[obj_uuid]
-        bin = self.get_game_obj_binary(obj_uuid)
+        return self.__parse_game_object(obj_uuid, self.get_game_obj_binary(obj_uuid))
+
+    def get_parser_and_game_object(self, obj_uuid: uuid.UUID, reparse: bool = False) -> Tuple[Optional[ArkBinaryParser], Optional['ArkGameObject']]:
+        # Binary and parsed object with a single query, the cached object is reused unless reparse is set.
+        # Returns (None, None) if the object is not in the database
+        self._flush_writes()
+        query = "SELECT value FROM game WHERE key = ?"
+        row = self.connection.execute(query, (SaveConnection.uuid_to_byte_array(obj_uuid),)).fetchone()
+        if row is None:
+            return None, None
+
+        obj = None if reparse else self.parsed_objects.get(obj_uuid)
+        if obj is None:
+            obj = self.__parse_game_object(obj_uuid, row[0])
+        # separate parser, the object may still read from its own (lazy objects)
+        return ArkBinaryParser(row[0], self.save_context), obj
+
+    def get_parsers_and_game_objects(self, obj_uuids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Tuple[ArkBinaryParser, Optional['ArkGameObject']]]:
+        # get_parser_and_game_object for several objects with batched queries, objects that are not in the database are left out
+        self._flush_writes()
+        keys = [SaveConnection.uuid_to_byte_array(obj_uuid) for obj_uuid in obj_uuids]
+        result = {}
+        for key, bin in SaveConnection.fetch_game_obj_binaries(self.connection, keys):
+            obj_uuid = SaveConnection.byte_array_to_uuid(key)
+            obj = self.parsed_objects.get(obj_uuid)
+            if obj is None:
+                obj = self.__parse_game_object(obj_uuid, bin)
+            result[obj_uuid] = (ArkBinaryParser(bin, self.save_context), obj)
+        return result
+
+    def __parse_game_object(self, obj_uuid: uuid.UUID, bin: bytes) -> Optional['ArkGameObject']:
         reader = ArkBinaryParser(bin, self.save_context)
 
         class_name, string_name = ArkGameObject.read_name(obj_uuid, reader)
@@ -372,89 +584,138 @@ class SaveConnection:
 
         return obj
 
-    def get_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration()) -> Dict[uuid.UUID, 'ArkGameObject']:
-        query = "SELECT key, value FROM game"
-        game_objects = {}
-        row_index = 0
-        objects = []
-        prop_ids = []
+    def get_database_uri(self) -> str:
+        # uri other (read only) connections can use to open the same database, e.g. parsing worker processes
+        if self.sqlite_db is not None:
+            return f"file:{self.sqlite_db}?mode=ro"
+        return f"{self.source_path.resolve().as_uri()}?mode=ro&immutable=1"
 
+    def get_property_name_ids(self, reader_config: GameObjectReaderConfiguration) -> List[bytes]:
+        prop_ids = []
         for prop in reader_config.property_names:
             id_ = self.save_context.get_name_id(prop)
             if id_ is not None:
                 prop_ids.append(id_.to_bytes(4, byteorder="little") + b'\x00\x00\x00\x00')
+        return prop_ids
+
+    def matches_no_objects(self, reader_config: GameObjectReaderConfiguration, prop_ids: List[bytes]) -> bool:
+        # none of the requested properties is in the name table, so no object can have them
+        return len(reader_config.property_names) > 0 and len(prop_ids) == 0 and self.save_context.has_name_table()
+
+    @staticmethod
+    def get_property_filter(prop_ids: List[bytes]) -> Optional["re.Pattern[bytes]"]:
+        # One pattern matching any of the property name ids, a blob is scanned once and the search stops at the first hit
+        if len(prop_ids) == 0:
+            return None
+        return re.compile(b"|".join(re.escape(pid) for pid in prop_ids))
+
+    def get_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration(), workers: int = 1) -> Dict[uuid.UUID, 'ArkGameObject']:
+        if workers > 1:
+            # worker processes use their own connections and only see committed writes
+            self._commit_writes()
+            from ._parallel_parser import ParallelObjectParser
+            return ParallelObjectParser(self, workers).get_game_objects(reader_config)
+
+        return dict(self.iter_game_objects(reader_config, cache=True))
+
+    def iter_game_objects(self, reader_config: GameObjectReaderConfiguration = GameObjectReaderConfiguration(), cache: bool = False) -> Iterator[Tuple[uuid.UUID, 'ArkGameObject']]:
+        # Yields the selected objects as their rows are read, already parsed objects first.
+        # Without cache, parsed objects are not kept in parsed_objects, so only the object being processed is held in memory
+        cached_objects = {}
+        prop_ids = self.get_property_name_ids(reader_config)
+        if self.matches_no_objects(reader_config, prop_ids):
+            return
+
+        prop_filter = SaveConnection.get_property_filter(prop_ids)
+        keys = self.select_game_object_keys(reader_config, prop_ids, cached_objects)
+        self._flush_writes()
+
+        yield from cached_objects.items()
+        cached_objects = None
 
         ArkSaveLogger.enter_struct("GameObjects")
 
-        with self.connection as conn:   
-            cursor = conn.execute(query)
-            for row in cursor:
-                if row_index < 0:
-                    row_index += 1
-                    self.nr_parsed += 1
-                    continue
-
-                obj_uuid = self.byte_array_to_uuid(row[0])
-                self.save_context.all_uuids.append(obj_uuid)
-                if reader_config.uuid_filter and not reader_config.uuid_filter(obj_uuid):
-                    ArkSaveLogger.save_log("Skipping object %s", obj_uuid)
-                    ArkSaveLogger.exit_struct()
-                    continue
-
-                byte_buffer = ArkBinaryParser(row[1], self.save_context)
-                ArkSaveLogger.set_file(byte_buffer, "game_object.bin")
-                class_name, string_name =  ArkGameObject.read_name(obj_uuid, byte_buffer)
-                ArkSaveLogger.enter_struct(class_name)
-
-                if reader_config.blueprint_name_filter and not reader_config.blueprint_name_filter(class_name):
-                    ArkSaveLogger.exit_struct()
-                    continue
-
-                if SaveConnection.failed_parses.get(class_name, 0) >= 5:
-                    if SaveConnection.failed_parses[class_name] == 5:
-                        ArkSaveLogger.warning_log(f"Skipping parsing of class {class_name} due to previous errors")
-                    SaveConnection.failed_parses[class_name] += 1
-                    ArkSaveLogger.exit_struct()
-                    self.faulty_objects += 1
-                    continue
-
-                if class_name not in objects:
-                    objects.append(class_name)
-                
-                if obj_uuid not in self.parsed_objects.keys():
-                    ark_game_object = None
-                    found = False
-                    for pid in prop_ids:
-                        if byte_buffer.find_byte_sequence(pid, adjust_offset=0):
-                            found = True
-
-                    if found or len(prop_ids) == 0:
-                        ark_game_object = self.parse_as_predefined_object(obj_uuid, class_name, byte_buffer)
-
-                        if ark_game_object:
-                            game_objects[obj_uuid] = ark_game_object
-                            self.parsed_objects[obj_uuid] = ark_game_object
-
-                            self.nr_parsed += 1
-                            if self.nr_parsed % 25000 == 0:
-                                ArkSaveLogger.save_log(f"Nr parsed: {self.nr_parsed}")
-                        else:
-                            self.faulty_objects += 1
-                else:
-                    found = False or (len(prop_ids) == 0)
-                    for prop in reader_config.property_names:
-                        if self.parsed_objects[obj_uuid].has_property(prop):
-                            found = True
-
-                    if found:
-                        game_objects[obj_uuid] = self.parsed_objects[obj_uuid]
-        
+        for key, blob in SaveConnection.fetch_game_obj_binaries(self.connection, keys, scan=len(keys) > len(self.class_index) // 2):
+            obj_uuid = self.byte_array_to_uuid(key)
+            ark_game_object, faulty = SaveConnection.parse_game_object_row(obj_uuid, blob, self.save_context, reader_config, prop_filter)
+
+            if ark_game_object:
+                if cache:
+                    self.parsed_objects[obj_uuid] = ark_game_object
+
+                self.nr_parsed += 1
+                if self.nr_parsed % 25000 == 0:
+                    ArkSaveLogger.save_log(f"Nr parsed: {self.nr_parsed}")
+                yield obj_uuid, ark_game_object
+            elif faulty:
+                self.faulty_objects += 1
+
+        self.report_faulty_objects()
+
+    def get_class_index(self) -> Dict[bytes, int]:
+        # Only the first 4 bytes (the class name id) of every object are read, not the full blobs
+        if self.class_index is None:
+            self._flush_writes()
+            query = "SELECT key, substr(value, 1, 4) FROM game"
+            self.class_index = {row[0]: int.from_bytes(row[1], byteorder="little") for row in self.connection.execute(query)}
+            ArkSaveLogger.save_log(f"Class index built for {len(self.class_index)} objects")
+        return self.class_index
+
+    def get_selected_class_ids(self, blueprint_name_filter: Callable[[Optional[str]], bool]) -> Set[int]:
+        # The filter is evaluated once per distinct class instead of once per object.
+        # Ids that do not resolve to a name (string class names) are kept, the full parse decides on those
+        selected = set()
+        for class_id in set(self.get_class_index().values()):
+            class_name = self.save_context.get_name(class_id)
+            if class_name is None or blueprint_name_filter(class_name):
+                selected.add(class_id)
+        return selected
+
+    def select_game_object_keys(self, reader_config: GameObjectReaderConfiguration, prop_ids: List[bytes], game_objects: Dict[uuid.UUID, 'ArkGameObject']) -> List[bytes]:
+        # Registers all uuids, applies the uuid and blueprint filters and adds selected cached objects to game_objects.
+        # Returns the keys of the objects that still need to be parsed
+        selected_classes = None
+        if reader_config.blueprint_name_filter is not None and self.save_context.has_name_table():
+            selected_classes = self.get_selected_class_ids(reader_config.blueprint_name_filter)
+
+        keys = []
+        for key, class_id in self.get_class_index().items():
+            obj_uuid = self.byte_array_to_uuid(key)
+            self.save_context.all_uuids.append(obj_uuid)
+            if reader_config.uuid_filter and not reader_config.uuid_filter(obj_uuid):
+                continue
+
+            if obj_uuid in self.parsed_objects:
+                if SaveConnection.is_cached_object_selected(self.parsed_objects[obj_uuid], reader_config, prop_ids):
+                    game_objects[obj_uuid] = self.parsed_objects[obj_uuid]
+                continue
+
+            if selected_classes is not None and class_id not in selected_classes:
+                continue
+
+            keys.append(key)
+        return keys
+
+    def __update_class_index(self, obj_uuid: uuid.UUID, obj_data: bytes):
+        if self.class_index is not None:
+            self.class_index[SaveConnection.uuid_to_byte_array(obj_uuid)] = int.from_bytes(obj_data[:4], byteorder="little")
+
+    def collect_decode_errors(self):
+        # objects parsed lazily fail when their properties are decoded, after the parse was counted
+        decode_errors = self.save_context.decode_errors
+        if len(decode_errors) == 0:
+            return
+        for class_name in decode_errors.values():
+            SaveConnection.failed_parses[class_name] = SaveConnection.failed_parses.get(class_name, 0) + 1
+        self.faulty_objects += len(decode_errors)
+        decode_errors.clear()
+
+    def report_faulty_objects(self):
+        self.collect_decode_errors()
         if self.faulty_objects > 0:
             ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.ERROR, True)
             ArkSaveLogger.error_log(f"{self.faulty_objects} objects could not be parsed, if possible, please report this to the developers.")
             ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.ERROR, False)
-        
-        return game_objects
 
     def reset_caching(self):
         self.parsed_objects.clear()
@@ -473,6 +734,58 @@ class SaveConnection:
             header_data.validate_uint32(0xFFFFFFFF)
         return parts
 
+    @staticmethod
+    def fetch_game_obj_binaries(connection: sqlite3.Connection, keys: List[bytes], scan: bool = False, prefix: Optional[int] = None) -> Iterator[Tuple[bytes, bytes]]:
+        # prefix only fetches the first bytes of every blob
+        value = "value" if prefix is None else f"substr(value, 1, {int(prefix)})"
+        if scan:
+            # cheaper than key lookups when most of the table is selected
+            selected = set(keys)
+            for row in connection.execute(f"SELECT key, {value} FROM game"):
+                if row[0] in selected:
+                    yield row
+            return
+
+        for i in range(0, len(keys), SaveConnection.FETCH_CHUNK_SIZE):
+            chunk = keys[i:i + SaveConnection.FETCH_CHUNK_SIZE]
+            query = f"SELECT key, {value} FROM game WHERE key IN ({', '.join('?' * len(chunk))})"
+            yield from connection.execute(query, chunk)
+
+    @staticmethod
+    def is_cached_object_selected(obj: ArkGameObject, reader_config: GameObjectReaderConfiguration, prop_ids: List[bytes]) -> bool:
+        if reader_config.blueprint_name_filter and not reader_config.blueprint_name_filter(obj.blueprint):
+            return False
+        if len(prop_ids) == 0:
+            return True
+        return any(obj.has_property(prop) for prop in reader_config.property_names)
+
+    @staticmethod
+    def parse_game_object_row(obj_uuid: uuid.UUID, blob: bytes, save_context: SaveContext, reader_config: GameObjectReaderConfiguration, prop_filter: Optional["re.Pattern[bytes]"] = None) -> Tuple[Optional[ArkGameObject], bool]:
+        # Returns the parsed object (None if it was filtered out or failed) and whether it failed to parse
+        byte_buffer = ArkBinaryParser(blob, save_context)
+        ArkSaveLogger.set_file(byte_buffer, "game_object.bin")
+        class_name, string_name = ArkGameObject.read_name(obj_uuid, byte_buffer)
+        ArkSaveLogger.enter_struct(class_name)
+
+        if reader_config.blueprint_name_filter and not reader_config.blueprint_name_filter(class_name):
+            ArkSaveLogger.exit_struct()
+            return None, False
+
+        if SaveConnection.failed_parses.get(class_name, 0) >= 5:
+            if SaveConnection.failed_parses[class_name] == 5:
+                ArkSaveLogger.warning_log(f"Skipping parsing of class {class_name} due to previous errors")
+            SaveConnection.failed_parses[class_name] += 1
+            ArkSaveLogger.exit_struct()
+            return None, True
+
+        # position 0 holds the class name, not a property
+        if prop_filter is not None and prop_filter.search(blob, 1) is None:
+            ArkSaveLogger.exit_struct()
+            return None, False
+
+        ark_game_object = SaveConnection.parse_as_predefined_object(obj_uuid, class_name, byte_buffer, reader_config.lazy_properties)
+        return ark_game_object, ark_game_object is None
+
     @staticmethod
     def byte_array_to_uuid(byte_array: bytes) -> uuid.UUID:
         return uuid.UUID(bytes=byte_array)
@@ -482,8 +795,10 @@ class SaveConnection:
         return obj_uuid.bytes
 
     @staticmethod
-    def parse_as_predefined_object(obj_uuid, class_name, byte_buffer: ArkBinaryParser):
+    def parse_as_predefined_object(obj_uuid, class_name, byte_buffer: ArkBinaryParser, lazy: bool = False):
         try:
+            if lazy:
+                return LazyArkGameObject(obj_uuid, class_name, byte_buffer)
             return ArkGameObject(obj_uuid, class_name, byte_buffer)
         except Exception as e:
             reraise = False
@@ -512,6 +827,7 @@ class SaveConnection:
                     ArkSaveLogger.open_hex_view(True)
 
             if reraise:
+                ArkSaveLogger.dump_recent_files()
                 raise Exception(f"Error parsing object {obj_uuid} of type {class_name}: {e}")
         finally:
             ArkSaveLogger.set_log_level(ArkSaveLogger.LogTypes.PARSER, False)
@@ -10,6 +10,7 @@ from .header_location import HeaderLocation
 
 class SaveContext:
     def __init__(self):
+        self._name_ids: Dict[str, int] = {}
         self.names: Dict[int, str] = {}
         self.constant_name_table: Optional[Dict[int, str]] = None
         self.some_other_table: Optional[Dict[int, str]] = None
@@ -23,9 +24,43 @@ class SaveContext:
         self.npc_zone_volumes: List["NpcZoneVolume"] = []
         self.all_uuids: List[uuid.UUID] = []
         self.generate_unknown: bool = False
+        # property type name ids to their readers, see ArkProperty.get_dispatch_table
+        self.property_readers: Optional[Dict[int, tuple]] = None
+        # (type, payload digest) to the value read from the payload, parsed values are only shared when this is set
+        self.interned_values: Optional[Dict[tuple, object]] = None
+        # uuid -> class name of lazily decoded objects whose properties failed to decode, see LazyArkGameObject
+        self.decode_errors: Dict[uuid.UUID, str] = {}
         self.current_time = 0
         self.current_day = 0
 
+    @property
+    def names(self) -> Dict[int, str]:
+        return self._names
+
+    @names.setter
+    def names(self, names: Dict[int, str]):
+        self._names = names
+        self.__rebuild_name_ids()
+        self.property_readers = None
+
+    def __rebuild_name_ids(self):
+        # reverse lookup for get_name_id, the first id of a name wins, like a scan of the name table would
+        self._name_ids = {}
+        for key, value in self._names.items():
+            self._name_ids.setdefault(value, key)
+
+    def __set_name(self, key: int, name: str):
+        if self.property_readers is not None and (key in self.property_readers or name.endswith("Property")):
+            self.property_readers = None
+
+        if key in self._names:
+            # overwriting an existing id can change the first id of two names, just rebuild
+            self._names[key] = name
+            self.__rebuild_name_ids()
+        else:
+            self._names[key] = name
+            self._name_ids.setdefault(name, key)
+
     def get_actor_transform(self, uuid_: uuid.UUID) -> Optional[ActorTransform]:
         return self.actor_transforms.get(uuid_)
 
@@ -39,12 +74,13 @@ class SaveContext:
             return self.constant_name_table[key]
         elif self.generate_unknown:
             unknown_name = f"Unknown_{key}"
-            self.names[key] = unknown_name
+            self.__set_name(key, unknown_name)
             return unknown_name
         return None
 
     def use_constant_name_table(self, constant_name_table: Dict[int, str]):
         self.constant_name_table = constant_name_table
+        self.property_readers = None
 
     def is_read_names_as_strings(self) -> bool:
         return self.save_version >= 13
@@ -54,20 +90,16 @@ class SaveContext:
             json.dump(self.names, f, indent=4)
 
     def get_name_id(self, name: str) -> Optional[int]:
-        for key, value in self.names.items():
-            if value == name:
-                return key
-        
-        return None
+        return self._name_ids.get(name)
 
     def add_new_name(self, name: str, id: int = None) -> int:
         if id is not None:
-            self.names[id] = name
+            self.__set_name(id, name)
             return id
     
         new_id = random.randint(0, int(2**31 - 1))
         while new_id in self.names:
             new_id = random.randint(0, int(2**31 - 1))
-        self.names[new_id] = name
-        
+        self.__set_name(new_id, name)
+
         return new_id
\ No newline at end of file
@@ -1,7 +1,7 @@
 from pathlib import Path
 
 from .tm_files import TEMP_FILES_DIR
-from .heatmap_visualization import draw_heatmap
+from .heatmap_visualization import draw_heatmap, bin_heatmap
 from .import_file import ImportFile
 
 __THIS_DIR = Path(__file__).parent
@@ -0,0 +1,65 @@
+from typing import Any, Dict
+
+
+class Freezable:
+    """
+    Values that can be frozen when they are shared, such as the values interned by the save context.
+    Freezing swaps the class of the value for a subclass that refuses changes, so values that are not
+    frozen are not slowed down. A copy (copy.copy or pickling) of a frozen value is not frozen.
+    """
+    __slots__ = ()
+    _frozen_types: Dict[type, type] = {}
+
+    def freeze(self) -> "Freezable":
+        cls = type(self)
+        if self.is_frozen():
+            return self
+
+        frozen = Freezable._frozen_types.get(cls)
+        if frozen is None:
+            frozen = Freezable.__create_frozen_type(cls)
+            Freezable._frozen_types[cls] = frozen
+
+        for value in self.__dict__.values():
+            if isinstance(value, Freezable):
+                value.freeze()
+        self.__class__ = frozen
+        return self
+
+    def is_frozen(self) -> bool:
+        return "_thawed_type" in type(self).__dict__
+
+    @staticmethod
+    def __create_frozen_type(cls: type) -> type:
+        def refuse(self, name, *args):
+            raise AttributeError(f"{cls.__name__} is shared between objects and can not be modified, change a copy instead")
+
+        def equals(self, other):
+            return cls.__eq__(_thawed(self), _thawed(other))
+
+        def reduce(self):
+            return _thawed_copy, (cls, dict(self.__dict__))
+
+        return type(cls.__name__, (cls,), {
+            "__qualname__": cls.__qualname__,
+            "__module__": cls.__module__,
+            "_thawed_type": cls,
+            "__setattr__": refuse,
+            "__delattr__": refuse,
+            "__eq__": equals,
+            "__hash__": cls.__hash__,
+            "__reduce__": reduce,
+        })
+
+
+def _thawed_copy(cls: type, state: Dict[str, Any]) -> Any:
+    value = cls.__new__(cls)
+    value.__dict__.update(state)
+    return value
+
+
+def _thawed(value: Any) -> Any:
+    # an unfrozen view of value to compare with, the base classes only compare instances of their own class
+    if isinstance(value, Freezable) and value.is_frozen():
+        return _thawed_copy(type(value)._thawed_type, value.__dict__)
+    return value
@@ -1,6 +1,18 @@
 from arkparse.enums import ArkMap
 from importlib.resources import files
 
+def bin_heatmap(lat, long, resolution: int = 100):
+    # Number of positions per whole map coordinate, indexed as heatmap[lat][long].
+    # Positions outside of 0 to resolution and NaN positions are not counted
+    import numpy as np
+
+    lat = np.asarray(lat, dtype=np.float64)
+    long = np.asarray(long, dtype=np.float64)
+    inside = (lat >= 0) & (lat < resolution) & (long >= 0) & (long < resolution)
+    edges = np.arange(resolution + 1)
+    heatmap, _, _ = np.histogram2d(lat[inside], long[inside], bins=[edges, edges])
+    return heatmap.astype(int)
+
 def draw_heatmap(heatmap, map: ArkMap, map_fade: float = 0.7):
     import matplotlib.pyplot as plt
     import matplotlib.image as mpimg
@@ -114,6 +114,12 @@ def rag_limited():
     resource = AsaSave(save_path(ArkMap.RAGNAROK, "set_2"))
     yield resource
 
+@pytest.fixture(scope="session")
+def rag_limited_read_only():
+    # setup (runs once, at first use)
+    resource = AsaSave(save_path(ArkMap.RAGNAROK, "set_2"), read_only=True)
+    yield resource
+
 @pytest.fixture(scope="session")
 def aberration_save(enabled_maps):
     # setup (runs once, at first use)
@@ -318,3 +318,42 @@ def test_turret_ammo(rag_limited: AsaSave, temp_file_folder: Path, resource_path
 
     
 
+
+def test_get_all_bases(rag_limited_read_only: AsaSave):
+    """
+    Test that single pass bases are disjoint and that connected bases contain all their linked structures.
+    """
+    base_api = BaseApi(rag_limited_read_only, ArkMap.RAGNAROK)
+    all_structures = base_api.get_all()
+
+    for only_connected, transitive in ((True, False), (False, True)):
+        bases = base_api.get_all_bases(only_connected=only_connected, min_structures=1, transitive=transitive)
+        seen = set()
+        for base in bases:
+            assert base.keystone.uuid in base.structures, "The keystone should be part of the base"
+            assert seen.isdisjoint(base.structures.keys()), "A structure should only be part of one base"
+            seen.update(base.structures.keys())
+            if only_connected:
+                for structure in base.structures.values():
+                    for linked in structure.linked_structure_uuids:
+                        assert linked not in all_structures or linked in base.structures, "Linked structures should be in the same base"
+
+        assert seen == set(all_structures.keys()), "With min_structures=1 every structure should be in a base"
+
+def test_get_all_bases_around_keystones(rag_limited_read_only: AsaSave):
+    """
+    Test that by default every base is the base get_base_at finds around its keystone.
+    """
+    base_api = BaseApi(rag_limited_read_only, ArkMap.RAGNAROK)
+    all_structures = base_api.get_all()
+
+    bases = base_api.get_all_bases(min_structures=1)
+    seen = set()
+    for base in bases:
+        keystone = base.keystone
+        expected = base_api.get_base_at(keystone.location.as_map_coords(ArkMap.RAGNAROK), 0.3, keystone.owner.tribe_id, keystone)
+        assert list(base.structures.keys()) == list(expected.structures.keys()), f"Unexpected structures in the base of {keystone.uuid}"
+        seen.update(base.structures.keys())
+
+    located = {key for key, structure in all_structures.items() if structure.location is not None and not structure.location.in_cryopod}
+    assert located <= seen, "Every located structure should be in a base"
@@ -5,6 +5,7 @@ from arkparse import AsaSave
 from arkparse.object_model.dinos import TamedDino, TamedBaby, BabyStage
 from arkparse.enums import ArkMap
 from arkparse.classes.dinos import Dinos
+from arkparse.parsing.struct import ActorTransform, ArkVector
 
 NR_DINOS = 34450
 NR_TAMED = 2925
@@ -245,4 +246,67 @@ def test_get_tameable_dinos(dino_api: DinoApi):
     tameable_dinos = dino_api.get_all_wild_tamables()
 
     print(f"Total tameable dinos found: {len(tameable_dinos)}")
-    
\ No newline at end of file
+    
+def test_get_by_id(dino_api: DinoApi):
+    """
+    Test that looking up dinos by DinoId finds the same dinos as a scan, including cryopodded ones.
+    """
+    tamed_dinos = dino_api.get_all_tamed()
+    for dino in list(tamed_dinos.values())[:200]:
+        found = dino_api.get_by_id(dino.id_)
+        assert found is not None and found.id_ == dino.id_, f"Expected to find dino with id {dino.id_}"
+
+    cryopodded = [dino for dino in tamed_dinos.values() if dino.cryopod is not None]
+    assert len(cryopodded) == 0 or dino_api.get_by_id(cryopodded[0].id_) is not None, "Cryopodded dinos should be indexed"
+
+    wild = next(iter(dino_api.get_all_wild().values()))
+    assert dino_api.get_by_id(wild.id_, tamed=True) is None or isinstance(dino_api.get_by_id(wild.id_, tamed=True), TamedDino)
+    assert dino_api.get_by_id(wild.id_, tamed=False) is not None, "Wild dinos should be found when not restricted to tamed"
+
+def test_get_at_location(dino_api: DinoApi):
+    """
+    Test that the location queries through the spatial index find the same dinos as a full scan.
+    """
+    dinos = {key: dino for key, dino in dino_api.get_all().items() if not (isinstance(dino, TamedDino) and dino.cryopod is not None)}
+    located = list(dinos.values())
+
+    for dino in located[::max(1, len(located) // 10)]:
+        coords = dino.location.as_map_coords(ArkMap.RAGNAROK)
+        expected = {key for key, d in dinos.items() if d.location.is_at_map_coordinate(ArkMap.RAGNAROK, coords, tolerance=0.3)}
+
+        assert set(dino_api.get_at_location(ArkMap.RAGNAROK, coords, 0.3).keys()) == expected, f"Unexpected dinos at {coords}"
+
+def test_set_location_untracked(dino_mod_api: DinoApi):
+    """
+    Test that moving a dino whose binary no longer tracks its object still updates the object.
+    """
+    save = dino_mod_api.save
+    dino = next(d for d in dino_mod_api.get_all().values() if not d.is_cryopodded and d.object.has_property("SavedBaseWorldLocation"))
+
+    # another parser takes over the tracking of the cached object
+    other, _ = save.get_parser_and_game_object(dino.object.uuid)
+    other.track(dino.object)
+    assert not dino.binary.tracks(dino.object)
+
+    new_location = ActorTransform(vector=ArkVector(x=1000.0, y=2000.0, z=3000.0))
+    dino.set_location(new_location)
+
+    location = dino.object.get_property_value("SavedBaseWorldLocation")
+    assert (location.x, location.y, location.z) == (1000.0, 2000.0, 3000.0), "Object should hold the new location"
+    stored = save.get_game_object_by_id(dino.object.uuid, reparse=True).get_property_value("SavedBaseWorldLocation")
+    assert (stored.x, stored.y, stored.z) == (1000.0, 2000.0, 3000.0), "Stored binary should hold the new location"
+
+def test_get_at_location_after_move(dino_mod_api: DinoApi):
+    """
+    Test that location queries see dinos that were moved after an earlier query.
+    """
+    dino = next(d for d in dino_mod_api.get_all().values() if not d.is_cryopodded and d.object.has_property("SavedBaseWorldLocation"))
+    old_coords = dino.location.as_map_coords(ArkMap.RAGNAROK)
+    assert dino.object.uuid in dino_mod_api.get_at_location(ArkMap.RAGNAROK, old_coords, 0.3)
+
+    new_location = ActorTransform(vector=ArkVector(x=-300000.0, y=-300000.0, z=0.0))
+    dino.set_location(new_location)
+
+    new_coords = new_location.as_map_coords(ArkMap.RAGNAROK)
+    assert dino.object.uuid in dino_mod_api.get_at_location(ArkMap.RAGNAROK, new_coords, 0.3), "Moved dino should be found at its new location"
+    assert dino.object.uuid not in dino_mod_api.get_at_location(ArkMap.RAGNAROK, old_coords, 0.3), "Moved dino should not be found at its old location"
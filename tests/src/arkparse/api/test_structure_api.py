@@ -5,6 +5,7 @@ from typing import Dict
 from arkparse import AsaSave
 from arkparse.api import StructureApi
 from arkparse.enums import ArkMap
+from arkparse.object_model.misc.object_owner import ObjectOwner
 
 def structures_per_map(map: ArkMap) -> int:
     """ Fixture to provide the expected number of dinos for each map. """
@@ -40,3 +41,101 @@ def test_structure_retrieval(structure_apis: Dict[ArkMap, StructureApi], enabled
         print(f"  Total structures: {len(structures)}")
 
         assert len(structures) == structures_per_map(map), f"Expected {structures_per_map(map)} structures, got {len(structures)}"
+
+def test_get_at_location(enabled_map_objects: Dict[ArkMap, AsaSave]):
+    """
+    Test that the location queries through the spatial index find the same structures as a full scan.
+    """
+    for map, save in enabled_map_objects.items():
+        structures = StructureApi(save).get_all()
+        located = [s for s in structures.values() if s.location is not None]
+
+        for structure in located[::max(1, len(located) // 10)]:
+            coords = structure.location.as_map_coords(map)
+            expected = {key for key, s in structures.items() if s.location is not None and s.location.is_at_map_coordinate(map, coords, tolerance=0.3)}
+
+            assert set(StructureApi(save).get_at_location(map, coords, 0.3).keys()) == expected, f"Unexpected structures at {coords} on {map.name}"
+            assert set(StructureApi(save).filter_by_location(map, coords, 0.3, structures).keys()) == expected
+
+def test_filter_by_location_after_in_memory_move(rag_limited: AsaSave):
+    """
+    Test that filter_by_location finds structures whose location was changed without modify_actor_transform.
+    """
+    api = StructureApi(rag_limited)
+    structures = {key: s for key, s in api.get_all().items() if s.location is not None and not s.location.in_cryopod}
+    key, structure = next(iter(structures.items()))
+    old_coords = structure.location.as_map_coords(ArkMap.RAGNAROK)
+    assert key in api.filter_by_location(ArkMap.RAGNAROK, old_coords, 0.3, structures)
+
+    x, y, z = structure.location.x, structure.location.y, structure.location.z
+    try:
+        structure.location.update(-300000.0, -300000.0, z)
+        new_coords = structure.location.as_map_coords(ArkMap.RAGNAROK)
+        assert key in api.filter_by_location(ArkMap.RAGNAROK, new_coords, 0.3, structures), "Moved structure should be found at its new location"
+        assert key not in api.filter_by_location(ArkMap.RAGNAROK, old_coords, 0.3, structures), "Moved structure should not be found at its old location"
+    finally:
+        structure.location.update(x, y, z)
+
+def test_create_heatmap(structure_apis: Dict[ArkMap, StructureApi], enabled_map_objects: Dict[ArkMap, AsaSave]):
+    """
+    Test that the heatmap counts every structure in the cell of its rounded map coordinates.
+    """
+    for map, _ in enabled_map_objects.items():
+        structures = structure_apis[map].get_all()
+        heatmap = structure_apis[map].create_heatmap(map, structures=structures)
+
+        expected = [[0 for _ in range(100)] for _ in range(100)]
+        for structure in structures.values():
+            if structure.location is None:
+                continue
+            coords = structure.location.as_map_coords(map)
+            if 0 <= coords.lat < 100 and 0 <= coords.long < 100:
+                expected[int(coords.lat)][int(coords.long)] += 1
+
+        assert heatmap.tolist() == expected, f"Unexpected heatmap for {map.name}"
+
+def test_structure_graph(enabled_map_objects: Dict[ArkMap, AsaSave]):
+    """
+    Test that connected structures from the structure graph match a breadth first search through the structures.
+    """
+    for map, save in enabled_map_objects.items():
+        api = StructureApi(save)
+        structures = api.get_all()
+        graph = api.get_structure_graph()
+
+        assert set(graph.uuids) == set(structures.keys())
+
+        for component in graph.get_components()[::100]:
+            start = component[0]
+            connected = {start}
+            unprocessed = [start]
+            while unprocessed:
+                s = structures[unprocessed.pop()]
+                attached = s.linked_structure_uuids + s.placed_on_floor_uuids + [s.placed_on_floor_uuid]
+                for uuid in attached:
+                    if uuid in structures and uuid not in connected:
+                        connected.add(uuid)
+                        unprocessed.append(uuid)
+
+            assert set(component) == connected, f"Unexpected component for {start} on {map.name}"
+            assert set(api.get_connected_structures({start: structures[start]}).keys()) == connected
+            assert set(api.get_placed_on(structures[start]).keys()) <= connected
+
+def test_modify_structures_in_place(rag_limited: AsaSave):
+    """
+    Test that structures edited with modify_structures are patched in place and equal a fresh parse of the stored binary.
+    """
+    api = StructureApi(rag_limited)
+    structures = {uuid: s for uuid, s in api.get_all().items() if s.owner.tribe_name is not None and len(s.linked_structure_uuids) == 0}
+    structures = dict(list(structures.items())[:50])
+    assert len(structures) > 0, "Save should have unlinked owned structures"
+
+    owner = ObjectOwner()
+    owner.set_tribe(1234, "A tribe name of another length")
+    owner.set_player(5678, "Player")
+    api.modify_structures(structures, new_owner=owner, new_max_health=1234.0)
+
+    for uuid, structure in structures.items():
+        assert rag_limited.get_game_object_by_id(uuid) is structure.object, "Edited structures should not be parsed again"
+        assert structure.object.get_property_value("OwnerName") == owner.tribe_name
+        assert structure.object.properties == rag_limited.get_game_object_by_id(uuid, reparse=True).properties, "Patched properties should equal a fresh parse"
@@ -1,11 +1,17 @@
 import pytest
+import copy
 import time
 from pathlib import Path
 from uuid import UUID, uuid4
 
 from arkparse import AsaSave
+from arkparse.object_model.ark_game_object import LazyArkGameObject
+from arkparse.parsing import ArkBinaryParser, GameObjectReaderConfiguration
+from arkparse.parsing.ark_property import ArkProperty
+from arkparse.parsing.ark_property_container import ArkPropertyContainer
 from arkparse.parsing.struct import ActorTransform, ArkVector
 from arkparse.logging import ArkSaveLogger
+from arkparse.saves.save_context import SaveContext
 
 def test_nr_of_objects(rag_limited: AsaSave):
     objects = rag_limited.get_game_objects()
@@ -17,6 +23,84 @@ def test_get_nr_of_classes(rag_limited: AsaSave):
     print(f"Number of classes in save: {len(classes)}")
     assert len(classes) > 0, "AsaSave should have classes"
 
+def test_read_only_copy_on_write(rag_limited_read_only: AsaSave):
+    connection = rag_limited_read_only.save_connection
+    assert connection.is_read_only, "Read only save should be opened in place"
+    assert connection.sqlite_db is None, "Read only save should not create a temp copy"
+
+    objects = rag_limited_read_only.get_game_objects()
+    assert len(objects) > 0, "Read only save should have objects"
+
+    obj_uuid = next(iter(objects.keys()))
+    rag_limited_read_only.modify_game_obj(obj_uuid, connection.get_game_obj_binary(obj_uuid))
+    assert not connection.is_read_only, "Save should switch to a temp copy on the first write"
+    assert connection.sqlite_db is not None and connection.sqlite_db.exists(), "Temp copy should exist after the first write"
+
+def test_class_index_prefilter(rag_limited_read_only: AsaSave):
+    connection = rag_limited_read_only.save_connection
+    class_index = connection.get_class_index()
+    assert len(class_index) == len(connection.get_obj_uuids()), "Class index should cover every object"
+
+    blueprint = connection.save_context.get_name(next(iter(class_index.values())))
+    config = GameObjectReaderConfiguration(blueprint_name_filter=lambda name: name == blueprint)
+    objects = connection.get_game_objects(config)
+    assert len(objects) > 0, "Prefiltered parse should return the objects of the selected class"
+    assert all(obj.blueprint == blueprint for obj in objects.values()), "Prefiltered parse should only return the selected class"
+
+def test_parse_cache(rag_limited_read_only: AsaSave, temp_file_folder: Path):
+    path = rag_limited_read_only.save_connection.save_path
+    cache_path = temp_file_folder / "test_parse_cache.cache"
+    save = AsaSave(path, read_only=True, cache_path=cache_path)
+    objects = save.get_game_objects()
+    save.store_parse_cache()
+
+    cached_save = AsaSave(path, read_only=True, cache_path=cache_path)
+    assert len(cached_save.save_connection.parsed_objects) == len(objects), "All parsed objects should be loaded from the cache"
+    cached_objects = cached_save.get_game_objects()
+    assert cached_objects.keys() == objects.keys(), "Cached objects should match the parsed objects"
+    assert len(cached_save.save_context.actor_transforms) == len(save.save_context.actor_transforms), "Actor transforms should be loaded from the cache"
+
+def test_lazy_properties(rag_limited_read_only: AsaSave):
+    connection = rag_limited_read_only.save_connection
+    config = GameObjectReaderConfiguration(blueprint_name_filter=lambda name: name is not None and "/Structures/" in name)
+    lazy_config = GameObjectReaderConfiguration(blueprint_name_filter=config.blueprint_name_filter, lazy_properties=True)
+
+    objects = {obj_uuid: connection.get_game_object_by_id(obj_uuid, reparse=True) for obj_uuid in list(connection.get_game_objects(config).keys())[:100]}
+    connection.reset_caching()
+    lazy_objects = connection.get_game_objects(lazy_config)
+
+    for obj_uuid, obj in objects.items():
+        lazy_obj = lazy_objects[obj_uuid]
+        assert lazy_obj.get_property_value("StructureID") == obj.get_property_value("StructureID"), "Lazy object should find the same property value"
+        assert [prop.name for prop in lazy_obj.properties] == [prop.name for prop in obj.properties], "Lazy object should decode the same properties"
+
+def test_lazy_decode_error(rag_limited_read_only: AsaSave):
+    connection = rag_limited_read_only.save_connection
+    obj_uuid = next(iter(connection.get_game_objects(GameObjectReaderConfiguration(blueprint_name_filter=lambda name: name is not None and "/Structures/" in name))))
+    blob = connection.get_game_obj_binary(obj_uuid)
+    start = LazyArkGameObject(obj_uuid, None, ArkBinaryParser(blob, rag_limited_read_only.save_context))._next_property_position
+
+    # a type name id that is not in the name table in the first property
+    corrupted = blob[:start + 8] + b"\xff\xff\xff\xff" + blob[start + 12:]
+    faulty_before = rag_limited_read_only.faulty_objects
+
+    lazy_obj = LazyArkGameObject(obj_uuid, None, ArkBinaryParser(corrupted, rag_limited_read_only.save_context))
+    with pytest.raises(Exception):
+        lazy_obj.get_property_value("StructureID")
+    assert lazy_obj.decode_error is not None, "Object should be marked faulty"
+    assert rag_limited_read_only.faulty_objects == faulty_before, "Raised errors should not be recorded"
+
+    ArkSaveLogger.allow_invalid_objects(True)
+    try:
+        lazy_obj = LazyArkGameObject(obj_uuid, None, ArkBinaryParser(corrupted, rag_limited_read_only.save_context))
+        failed_before = connection.failed_parses.get(lazy_obj.blueprint, 0)
+        assert lazy_obj.properties == [], "No properties should be decoded"
+    finally:
+        ArkSaveLogger.allow_invalid_objects(False)
+    assert lazy_obj.decode_error is not None, "Object should be marked faulty"
+    assert rag_limited_read_only.faulty_objects == faulty_before + 1, "Decode error should be counted as a faulty object"
+    assert connection.failed_parses[lazy_obj.blueprint] == failed_before + 1, "Decode error should be counted for the class"
+
 def test_add_actor_transform(rag_limited: AsaSave, temp_file_folder: Path):
     new_location = ActorTransform(vector=ArkVector(x=118368.11, y=172509.7, z=-10290))
     new_uuid: UUID = uuid4()
@@ -62,4 +146,232 @@ def test_modify_actor_transform(rag_limited: AsaSave, temp_file_folder: Path):
     print(f"Modified actor transform distance: {at.get_distance_to(modified_location)}")
     assert at.get_distance_to(modified_location) < 100, (
         f"Actor transform should be close to the modified location, got {at.get_distance_to(modified_location)}"
-    )
\ No newline at end of file
+    )
+def test_batch_writes(rag_limited: AsaSave, temp_file_folder: Path):
+    connection = rag_limited.save_connection
+    obj_uuid = next(iter(connection.get_obj_uuids()))
+    obj_data = connection.get_game_obj_binary(obj_uuid)
+    new_uuids = [uuid4() for _ in range(10)]
+
+    with rag_limited.batch():
+        for new_uuid in new_uuids:
+            rag_limited.add_obj_to_db(new_uuid, obj_data)
+        assert rag_limited.is_in_db(new_uuids[0]), "Writes should be visible to reads inside the batch"
+    assert rag_limited.get_game_object_by_id(new_uuids[-1]) is not None, "Added objects should be parsed after the batch"
+
+    try:
+        with rag_limited.batch():
+            for new_uuid in new_uuids:
+                rag_limited.remove_obj_from_db(new_uuid)
+            raise RuntimeError("abort batch")
+    except RuntimeError:
+        pass
+    assert all(rag_limited.is_in_db(new_uuid) for new_uuid in new_uuids), "Failed batch should be rolled back"
+
+    rag_limited.store_db(temp_file_folder / "test_batch_writes.db")
+    reparse_save = AsaSave(path=temp_file_folder / "test_batch_writes.db")
+    assert all(reparse_save.is_in_db(new_uuid) for new_uuid in new_uuids), "Batched objects should be stored"
+
+def test_batch_actor_transforms(rag_limited: AsaSave, temp_file_folder: Path):
+    connection = rag_limited.save_connection
+    new_uuids = [uuid4() for _ in range(50)]
+    new_location = ActorTransform(vector=ArkVector(x=1000.0, y=2000.0, z=-3000.0))
+    modified_location = ActorTransform(vector=ArkVector(x=7777.0, y=7777.0, z=-7777))
+    statements = []
+    connection.connection.set_trace_callback(statements.append)
+
+    with rag_limited.batch():
+        for new_uuid in new_uuids:
+            rag_limited.add_actor_transform(new_uuid, new_location.to_bytes())
+        for new_uuid in new_uuids:
+            rag_limited.modify_actor_transform(new_uuid, modified_location.to_bytes())
+    connection.connection.set_trace_callback(None)
+
+    custom_reads = [s for s in statements if s.startswith("SELECT value FROM custom")]
+    custom_updates = [s for s in statements if s.startswith("UPDATE custom")]
+    assert len(custom_reads) == 1, f"Actor transforms should be read once per batch, got {len(custom_reads)} reads"
+    assert len(custom_updates) == 1, f"Actor transforms should be written once per batch, got {len(custom_updates)} updates"
+
+    rag_limited.store_db(temp_file_folder / "test_batch_actor_transforms.db")
+    reparse_save = AsaSave(path=temp_file_folder / "test_batch_actor_transforms.db")
+    for new_uuid in new_uuids:
+        at = reparse_save.save_context.get_actor_transform(new_uuid)
+        assert at is not None and at.get_distance_to(modified_location) < 100, "Batched transforms should be stored"
+
+def test_batch_rollback_names(rag_limited: AsaSave):
+    connection = rag_limited.save_connection
+    name_count = connection.name_count
+    try:
+        with rag_limited.batch():
+            connection.add_name_to_name_table("BatchRollbackName")
+            raise RuntimeError("abort batch")
+    except RuntimeError:
+        pass
+    assert connection.name_count == name_count, "Failed batch should restore the name count"
+    assert rag_limited.save_context.get_name_id("BatchRollbackName") is None, "Failed batch should remove added names"
+
+def test_parallel_game_objects(rag_limited_read_only: AsaSave):
+    path = rag_limited_read_only.save_connection.source_path
+    sequential = AsaSave(path=path, read_only=True).get_game_objects(workers=1)
+    parallel_save = AsaSave(path=path, read_only=True)
+    parallel = parallel_save.get_game_objects(workers=2)
+
+    assert parallel.keys() == sequential.keys(), "Parallel parsing should select the same objects"
+    for obj_uuid, obj in sequential.items():
+        assert parallel[obj_uuid].blueprint == obj.blueprint
+        assert parallel[obj_uuid].names == obj.names and parallel[obj_uuid].location == obj.location
+        assert parallel[obj_uuid].properties == obj.properties, f"Object {obj_uuid} should have the same properties"
+    assert all(obj_uuid in parallel_save.save_connection.parsed_objects for obj_uuid in parallel), "Parsed objects should be cached"
+
+def test_get_parser_and_game_object(rag_limited_read_only: AsaSave):
+    obj_uuid = next(iter(rag_limited_read_only.save_connection.get_obj_uuids()))
+    obj = rag_limited_read_only.get_game_object_by_id(obj_uuid)
+
+    parser, cached = rag_limited_read_only.get_parser_and_game_object(obj_uuid)
+    assert cached is obj, "Already parsed object should be reused"
+    assert parser.byte_buffer == rag_limited_read_only.save_connection.get_game_obj_binary(obj_uuid)
+    assert rag_limited_read_only.get_parser_and_game_object(uuid4()) == (None, None), "Unknown objects should not be found"
+
+def test_get_classes_of_uuids(rag_limited_read_only: AsaSave):
+    obj_uuids = list(rag_limited_read_only.save_connection.get_obj_uuids())[:500]
+    classes = rag_limited_read_only.get_classes_of_uuids(obj_uuids + [uuid4()])
+    assert len(classes) == len(obj_uuids), "Only objects in the save should be returned"
+    for obj_uuid in obj_uuids:
+        assert classes[obj_uuid] == rag_limited_read_only.get_class_of_uuid(obj_uuid)
+
+def test_actor_transform_table(rag_limited_read_only: AsaSave):
+    actor_transforms = rag_limited_read_only.save_context.actor_transforms
+    positions = rag_limited_read_only.save_context.actor_transform_positions
+    table = rag_limited_read_only.get_custom_value("ActorTransforms")
+
+    for obj_uuid in list(actor_transforms)[:100]:
+        table.set_position(positions[obj_uuid])
+        assert table.read_uuid() == obj_uuid
+        assert actor_transforms[obj_uuid] == ActorTransform(table), "Decoded actor transform should match the table entry"
+        assert actor_transforms[obj_uuid] is actor_transforms[obj_uuid], "Actor transforms should only be created once"
+
+def test_iter_game_objects(rag_limited_read_only: AsaSave):
+    connection = rag_limited_read_only.save_connection
+    connection.reset_caching()
+    config = GameObjectReaderConfiguration(blueprint_name_filter=lambda name: name is not None and "/Structures/" in name)
+
+    streamed = {obj_uuid: obj.blueprint for obj_uuid, obj in rag_limited_read_only.iter_game_objects(config)}
+    assert len(connection.parsed_objects) == 0, "Streamed objects should not be cached by default"
+
+    objects = rag_limited_read_only.get_game_objects(config)
+    assert streamed == {obj_uuid: obj.blueprint for obj_uuid, obj in objects.items()}, "Streaming should yield the same objects as get_game_objects"
+
+def test_property_dispatch_table(rag_limited_read_only: AsaSave):
+    connection = rag_limited_read_only.save_connection
+    save_context = rag_limited_read_only.save_context
+    table = ArkProperty.get_dispatch_table(save_context)
+    assert len(table) > 0, "Property type names should be in the dispatch table"
+    for name_id, (value_type, _) in table.items():
+        assert save_context.get_name(name_id) == value_type.type_name
+
+    obj_uuids = list(connection.get_obj_uuids())[:500]
+    objects = {obj_uuid: connection.get_game_object_by_id(obj_uuid, reparse=True) for obj_uuid in obj_uuids}
+
+    # an empty table sends every property type through the name lookup
+    save_context.property_readers = {}
+    try:
+        for obj_uuid, obj in objects.items():
+            reparsed = connection.get_game_object_by_id(obj_uuid, reparse=True)
+            if obj is None:
+                continue
+            assert [(prop.name, prop.type, prop.value_position) for prop in reparsed.properties] == [(prop.name, prop.type, prop.value_position) for prop in obj.properties]
+    finally:
+        save_context.property_readers = None
+
+def test_property_prefilter(rag_limited_read_only: AsaSave):
+    connection = rag_limited_read_only.save_connection
+    objects = connection.get_game_objects()
+    expected = {obj_uuid for obj_uuid, obj in objects.items() if obj.has_property("MyInventoryComponent") or obj.has_property("TargetingTeam")}
+
+    connection.reset_caching()
+    config = GameObjectReaderConfiguration(property_names=["MyInventoryComponent", "TargetingTeam"])
+    prefiltered = connection.get_game_objects(config)
+    assert expected <= set(prefiltered.keys()), "Prefilter should keep every object that has one of the properties"
+    assert len(prefiltered) < len(objects), "Prefilter should skip objects without the properties"
+
+    config = GameObjectReaderConfiguration(property_names=["NotAPropertyOfAnyObject"])
+    assert len(connection.get_game_objects(config)) == 0, "Properties that are not in the name table should match nothing"
+
+def test_intern_values(rag_limited_read_only: AsaSave):
+    path = rag_limited_read_only.save_connection.save_path
+    save = AsaSave(path, read_only=True, intern_values=True)
+    objects = save.get_game_objects()
+    assert 0 < len(save.save_context.interned_values), "Struct and array values should be interned"
+
+    for obj_uuid in list(objects.keys())[:1000]:
+        obj = rag_limited_read_only.get_game_object_by_id(obj_uuid)
+        if obj is None:
+            continue
+        assert [str(list(prop.value) if isinstance(prop.value, tuple) else prop.value) for prop in objects[obj_uuid].properties] == [str(prop.value) for prop in obj.properties], "Interned values should equal the parsed ones"
+
+    values = [prop.value for obj in objects.values() for prop in obj.properties if prop.type == "Struct" and prop.value is not None]
+    assert len({id(value) for value in values}) < len(values), "Identical values should be shared"
+    arrays = [prop.value for obj in objects.values() for prop in obj.properties if prop.type == "Array" and isinstance(prop.value, tuple)]
+    assert len(arrays) > 0, "Small arrays should be interned as tuples"
+    assert all(len(key[1]) == 16 for key in save.save_context.interned_values), "Values should be keyed on a digest"
+
+    shared = next(value for value in values if isinstance(value, ArkVector))
+    with pytest.raises(AttributeError):
+        shared.x = 0.0
+    modified = copy.copy(shared)
+    modified.x = shared.x + 1
+    assert modified != shared and not modified.is_frozen(), "Copies of shared values should be modifiable"
+
+def test_property_offsets(rag_limited_read_only: AsaSave):
+    obj_uuids = list(rag_limited_read_only.save_connection.get_obj_uuids())[:200]
+    for obj_uuid in obj_uuids:
+        parser, obj = rag_limited_read_only.get_parser_and_game_object(obj_uuid)
+        if obj is None:
+            continue
+        properties = obj.properties
+        for prop, next_prop in zip(properties, properties[1:]):
+            assert not hasattr(prop, "__dict__"), "Properties should be slotted"
+            assert prop.end_position == next_prop.name_position, "Properties of an object should follow each other"
+            assert len(prop.get_bytes(parser)) == prop.end_position - prop.name_position
+
+def test_property_index(rag_limited_read_only: AsaSave):
+    objects = [rag_limited_read_only.get_game_object_by_id(obj_uuid) for obj_uuid in list(rag_limited_read_only.save_connection.get_obj_uuids())[:200]]
+    objects = [obj for obj in objects if obj is not None]
+    for obj in objects:
+        for prop in obj.properties:
+            # same result as a scan over all properties
+            expected = next(m for m in (ArkPropertyContainer._match_property(p, prop.name) for p in obj.properties) if m)
+            assert obj.has_property(prop.name)
+            assert obj.find_property(prop.name) is expected, "Index should find the first property of a name"
+            assert obj.find_property_by_position(prop.name, prop.position) is not None
+        assert not obj.has_property("NotAPropertyOfAnyObject")
+
+    properties = next(obj.properties for obj in objects if len({p.name for p in obj.properties}) > 1)
+    container = ArkPropertyContainer(list(properties))
+    first = properties[0]
+    last = next(p for p in reversed(properties) if p.name != first.name)
+    assert container.find_property_by_position(last.name, last.position) is last
+
+    # a new list of the same length replaces the indexed one
+    container.properties = list(reversed(properties))
+    assert container.find_property_by_position(first.name, first.position) is first, "Index should be rebuilt for a new list"
+    container.properties = [p for p in properties if p.name != last.name]
+    assert not container.has_property(last.name), "Index should be rebuilt when the list changes"
+    container.properties.append(last)
+    assert container.find_property_by_position(last.name, last.position) is last, "Index should be rebuilt when the list grows"
+
+def test_name_index():
+    context = SaveContext()
+    context.names = {1: "First", 2: "Second", 3: "First"}
+    assert context.get_name_id("First") == 1, "The first id of a name should win"
+    assert context.get_name_id("Second") == 2
+    assert context.get_name_id("Missing") is None
+
+    new_id = context.add_new_name("Third")
+    assert context.get_name_id("Third") == new_id and context.names[new_id] == "Third"
+    context.add_new_name("Other", 1)
+    assert context.get_name_id("First") == 3, "Overwriting an id should update the index"
+    assert context.get_name_id("Other") == 1
+
+    context.names = {5: "Second"}
+    assert context.get_name_id("Second") == 5 and context.get_name_id("First") is None, "Replacing the names should rebuild the index"